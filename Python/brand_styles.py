@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Shared Red Cross stylesheets for the PDF builders
+Every builder shares one set of brand styles (BRAND_STYLES); a builder adds
+its own title/callout styles and may override named brand styles. Each sheet
+is built on first use, frozen and reused for the rest of the process. The
+fonts the styles use are loaded up front so layout never stops to read font
+metrics. An optional pickle
+cache (CAP_STYLE_CACHE=1) skips building the stylesheets in new processes.
+
+Usage:
+    styles = brand_styles.get_stylesheet('fortune500')
+    python brand_styles.py            # list variants and their styles
+    python brand_styles.py --clear    # drop the pickle cache
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.fonts import tt2ps
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+
+CACHE_DIR = '/Users/jefffranzen/cap-data/.style_cache'
+USE_PICKLE_CACHE = os.environ.get('CAP_STYLE_CACHE') == '1'
+
+# American Red Cross Brand Colors
+ARC_RED = colors.HexColor('#CC0000')
+ARC_GRAY = colors.HexColor('#6B7C93')
+ARC_LIGHT_GRAY = colors.HexColor('#F5F5F5')
+ARC_DARK_GRAY = colors.HexColor('#333333')
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """ParagraphStyle that can no longer be changed once its sheet is frozen"""
+    def __setattr__(self, name, value):
+        raise AttributeError(f"brand style '{self.name}' is shared and read-only; use clone()")
+
+    def clone(self, name, parent=None, **kwds):
+        """Editable copy for one-off tweaks"""
+        style = ParagraphStyle(name)
+        style.__dict__.update(self.__dict__)
+        style.name = name
+        style.parent = parent or self
+        style._setKwds(**kwds)
+        return style
+
+class FrozenStyleSheet(StyleSheet1):
+    """StyleSheet1 that rejects new styles once built"""
+    _frozen = False
+
+    def add(self, style, alias=None):
+        if self._frozen:
+            raise KeyError(f"brand stylesheet is read-only; can't add '{style.name}'")
+        StyleSheet1.add(self, style, alias)
+
+    def freeze(self):
+        for style in self.byName.values():
+            if isinstance(style, ParagraphStyle):
+                style.__class__ = FrozenParagraphStyle
+        self._frozen = True
+        return self
+
+# 1. STYLES
+
+# Red Cross typography every builder shares: (name, parent, attributes), added in this order
+BRAND_STYLES = [
+    ('SectionHeader', 'Heading1', dict(
+        fontName='Helvetica-Bold', fontSize=18, leading=22, textColor=ARC_RED,
+        spaceBefore=24, spaceAfter=12, leftIndent=0, keepWithNext=True)),
+    ('SubsectionHeader', 'Heading2', dict(
+        fontName='Helvetica-Bold', fontSize=14, leading=18, textColor=ARC_GRAY,
+        spaceBefore=12, spaceAfter=6, keepWithNext=True)),
+    ('CustomBody', 'BodyText', dict(
+        fontName='Helvetica', fontSize=11, leading=14, alignment=TA_JUSTIFY,
+        spaceBefore=0, spaceAfter=12)),
+    ('BulletText', 'CustomBody', dict(leftIndent=20, bulletIndent=10, spaceAfter=6)),
+]
+
+# Per builder: its own extra styles, same form as BRAND_STYLES, and named
+# changes to brand styles. Anything not overridden keeps the shared value.
+VARIANTS = {
+    'fortune500': {
+        'styles': [
+            ('MainTitle', 'Normal', dict(
+                fontName='Helvetica-Bold', fontSize=28, leading=34, textColor=ARC_RED,
+                alignment=TA_CENTER, spaceBefore=30, spaceAfter=20)),
+            ('Subtitle', 'Normal', dict(
+                fontName='Helvetica', fontSize=16, leading=20, textColor=ARC_GRAY,
+                alignment=TA_CENTER, spaceBefore=10, spaceAfter=30)),
+            ('ExecutiveSummary', 'CustomBody', dict(
+                fontSize=12, leading=16, spaceBefore=8, spaceAfter=8, backColor=ARC_LIGHT_GRAY,
+                borderWidth=1, borderColor=ARC_GRAY, borderPadding=12)),
+            ('KeyFinding', 'Normal', dict(
+                fontSize=11, leading=14, leftIndent=20, bulletIndent=10, spaceBefore=4, spaceAfter=4)),
+            ('CalloutBox', 'Normal', dict(
+                fontName='Helvetica-Bold', fontSize=12, leading=15, alignment=TA_CENTER,
+                backColor=ARC_RED, textColor=colors.white, borderWidth=2, borderColor=ARC_RED,
+                borderPadding=15, spaceBefore=12, spaceAfter=12)),
+            ('MetricBox', 'Normal', dict(
+                fontName='Helvetica-Bold', fontSize=14, leading=18, alignment=TA_CENTER,
+                backColor=ARC_LIGHT_GRAY, textColor=ARC_DARK_GRAY, borderWidth=1, borderColor=ARC_GRAY,
+                borderPadding=10, spaceBefore=8, spaceAfter=8)),
+        ],
+        'overrides': {
+            # Boxed section headers for the executive layout
+            'SectionHeader': dict(borderWidth=2, borderColor=ARC_RED, borderPadding=8, backColor=ARC_LIGHT_GRAY),
+        },
+    },
+    # Times styles matching the Friday report format
+    'real_cap': {
+        'styles': [
+            ('ReportTitle', 'Title', dict(
+                fontName='Times-Bold', fontSize=16, leading=20, textColor=colors.black,
+                alignment=TA_CENTER, spaceAfter=12)),
+        ],
+        'overrides': {
+            'SectionHeader': dict(fontName='Times-Bold', fontSize=14, leading=17, textColor=colors.black,
+                                  spaceBefore=18),
+            'SubsectionHeader': dict(fontName='Times-Bold', fontSize=12, leading=15, textColor=colors.black),
+            'CustomBody': dict(fontName='Times-Roman'),
+            'BulletText': dict(leftIndent=36, bulletIndent=20),
+        },
+    },
+    'simple': {
+        'styles': [
+            ('CustomTitle', 'Title', dict(
+                fontSize=26, leading=32, textColor=ARC_RED, alignment=TA_CENTER, spaceAfter=30)),
+            ('CustomSubtitle', 'Heading2', dict(
+                fontSize=16, leading=20, textColor=ARC_GRAY, alignment=TA_CENTER, spaceAfter=12)),
+        ],
+    },
+    'professional': {
+        'styles': [
+            ('CustomTitle', 'Title', dict(
+                fontSize=24, leading=30, textColor=ARC_RED, alignment=TA_CENTER, spaceAfter=30)),
+        ],
+    },
+}
+
+def _sample_styles():
+    """ReportLab's sample sheet copied into a FrozenStyleSheet"""
+    sample = getSampleStyleSheet()
+    styles = FrozenStyleSheet()
+    for name, style in sample.byName.items():
+        aliases = [alias for alias, target in sample.byAlias.items() if target is style]
+        styles.add(style, aliases[0] if aliases else None)
+    return styles
+
+def build_stylesheet(variant):
+    """Sample sheet + BRAND_STYLES with the variant's overrides + the variant's own styles (unfrozen)"""
+    spec = VARIANTS[variant]
+    overrides = spec.get('overrides', {})
+    unknown = set(overrides) - {name for name, _, _ in BRAND_STYLES}
+    if unknown:
+        raise KeyError(f"{variant} overrides styles that aren't brand styles: {', '.join(sorted(unknown))}")
+
+    styles = _sample_styles()
+    for name, parent, attributes in BRAND_STYLES + spec.get('styles', []):
+        styles.add(ParagraphStyle(name, parent=styles[parent], **{**attributes, **overrides.get(name, {})}))
+    return styles
+
+# 2. FONTS
+
+def preload_fonts(styles):
+    """Load metrics for every face the styles can draw, including <b>/<i> variants"""
+    faces = set()
+    for style in styles.byName.values():
+        if not hasattr(style, 'fontName'):
+            continue
+        for bold in (0, 1):
+            for italic in (0, 1):
+                try:
+                    faces.add(tt2ps(style.fontName, bold, italic))
+                except (KeyError, ValueError):
+                    faces.add(style.fontName)
+    for face in sorted(faces):
+        # getFont reads the AFM widths; stringWidth fills the width cache for the face
+        pdfmetrics.getFont(face)
+        pdfmetrics.stringWidth('0', face, 10)
+    return faces
+
+# 3. CACHE
+
+def _source_hash():
+    """Hash of this module and the ReportLab version; a change invalidates the pickles"""
+    import reportlab
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(reportlab.Version.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def _cache_path(variant):
+    return os.path.join(CACHE_DIR, f'{variant}_{_source_hash()}.pickle')
+
+def _plain(styles):
+    """[(style class, name, alias, parent name, attributes)] in the sheet's order"""
+    # StyleSheet1 objects don't survive unpickling (__getattr__ recurses), so only plain dicts are stored
+    aliases = {id(style): alias for alias, style in styles.byAlias.items()}
+    entries = []
+    for name, style in styles.byName.items():
+        attributes = {key: value for key, value in style.__dict__.items() if key != 'parent'}
+        parent = getattr(style.parent, 'name', None)
+        cls = ParagraphStyle if isinstance(style, FrozenParagraphStyle) else type(style)
+        entries.append((cls, name, aliases.get(id(style)), parent, attributes))
+    return entries
+
+def _from_plain(entries):
+    styles = FrozenStyleSheet()
+    for cls, name, alias, parent, attributes in entries:
+        style = cls(name)
+        style.__dict__.update(attributes)
+        style.parent = styles[parent] if parent else None
+        styles.add(style, alias)
+    return styles.freeze()
+
+def _load_pickled(variant):
+    try:
+        with open(_cache_path(variant), 'rb') as f:
+            return _from_plain(pickle.load(f))
+    except Exception:
+        # Any unreadable or stale cache entry just means building the sheet again
+        return None
+
+def _save_pickled(variant, styles):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(variant)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(_plain(styles), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+def clear_cache():
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    removed = 0
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.pickle'):
+            os.remove(os.path.join(CACHE_DIR, name))
+            removed += 1
+    return removed
+
+# 4. LOOKUP
+
+_stylesheets = {}
+
+def get_stylesheet(variant, use_cache=None):
+    """Frozen stylesheet for one builder, built once per process"""
+    if variant in _stylesheets:
+        return _stylesheets[variant]
+    if variant not in VARIANTS:
+        raise KeyError(f"unknown stylesheet '{variant}' (choose from {', '.join(VARIANTS)})")
+
+    use_cache = USE_PICKLE_CACHE if use_cache is None else use_cache
+    styles = _load_pickled(variant) if use_cache else None
+    if styles is None:
+        styles = build_stylesheet(variant).freeze()
+        if use_cache:
+            _save_pickled(variant, styles)
+
+    preload_fonts(styles)
+    _stylesheets[variant] = styles
+    return styles
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv:
+        print(f"🧹 Removed {clear_cache()} cached stylesheets from {CACHE_DIR}")
+        sys.exit(0)
+    for variant in VARIANTS:
+        styles = get_stylesheet(variant)
+        print(f"🎨 {variant}: {', '.join(styles.byName)}")
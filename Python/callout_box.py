@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Call-out box flowable shared by the PDF builders
+Content is wrapped with real font metrics (stringWidth) instead of character
+counts, so the box is exactly as tall as its text. Wrap results are memoized
+per (text, font, size, width), and a box too tall for the space left on the
+page splits into a first part and a "(continued)" part.
+"""
+
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus.flowables import Flowable
+
+BOX_COLORS = {
+    'metric': colors.HexColor('#CC0000'),   # Red Cross red
+    'quote': colors.HexColor('#6B7C93'),    # Gray
+    'success': colors.HexColor('#4CAF50'),  # Green
+    'priority': colors.HexColor('#FF6B35'), # Orange
+    'speed': colors.HexColor('#2196F3'),    # Blue
+}
+
+@lru_cache(maxsize=1024)
+def wrap_text(text, font_name, font_size, max_width):
+    """Greedy word wrap measured in points; returns a tuple of lines"""
+    lines = []
+    line = ''
+    space = stringWidth(' ', font_name, font_size)
+    line_width = 0
+    for word in text.split():
+        word_width = stringWidth(word, font_name, font_size)
+        if line and line_width + space + word_width > max_width:
+            lines.append(line)
+            line, line_width = word, word_width
+        elif line:
+            line, line_width = f'{line} {word}', line_width + space + word_width
+        else:
+            # A word wider than the box gets a line of its own
+            line, line_width = word, word_width
+    if line:
+        lines.append(line)
+    return tuple(lines)
+
+class CalloutBox(Flowable):
+    """
+    Custom flowable for professional call-out boxes
+
+    Builders subclass it to set the box width, fonts and spacing.
+    """
+    box_width = 5.5 * inch
+    title_font = 'Helvetica-Bold'
+    title_size = 11
+    body_font = 'Helvetica'
+    body_size = 9
+    title_bar = 0.35 * inch        # height of the colored title bar
+    title_baseline = 0.23 * inch   # from the top of the box
+    first_baseline = 0.55 * inch   # first content line, from the top of the box
+    line_height = 0.18 * inch
+    padding = 0.2 * inch           # left/right text margin and space under the last line
+
+    def __init__(self, title, content, box_type='metric'):
+        Flowable.__init__(self)
+        self.title = title
+        self.content = content
+        self.box_type = box_type
+        self.width = self.box_width
+        self.height = self._height_for(self._lines(self.box_width))
+
+    def _lines(self, width):
+        return wrap_text(self.content, self.body_font, self.body_size, width - 2 * self.padding)
+
+    def _height_for(self, lines):
+        return self.first_baseline + max(len(lines) - 1, 0) * self.line_height + self.padding
+
+    def wrap(self, availWidth, availHeight):
+        self.width = min(self.box_width, availWidth)
+        self.height = self._height_for(self._lines(self.width))
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        lines = self._lines(min(self.box_width, availWidth))
+        fits = int((availHeight - self.first_baseline - self.padding) // self.line_height) + 1
+        if fits < 1 or fits >= len(lines):
+            return []
+        # Greedy wrapping of a prefix reproduces the same lines, so each part re-wraps identically
+        first = type(self)(self.title, ' '.join(lines[:fits]), self.box_type)
+        rest = type(self)(f'{self.title} (continued)', ' '.join(lines[fits:]), self.box_type)
+        return [first, rest]
+
+    def draw(self):
+        color = BOX_COLORS.get(self.box_type, colors.black)
+        self.canv.setStrokeColor(color)
+        self.canv.setLineWidth(2)
+
+        # Main box
+        self.canv.rect(0, 0, self.width, self.height)
+
+        # Title bar
+        self.canv.setFillColor(color)
+        self.canv.rect(0, self.height - self.title_bar, self.width, self.title_bar, fill=1)
+
+        # Title text
+        self.canv.setFillColor(colors.white)
+        self.canv.setFont(self.title_font, self.title_size)
+        self.canv.drawCentredString(self.width/2, self.height - self.title_baseline, self.title)
+
+        # Content
+        self.canv.setFillColor(colors.black)
+        self.canv.setFont(self.body_font, self.body_size)
+        y_position = self.height - self.first_baseline
+        for line in self._lines(self.width):
+            self.canv.drawCentredString(self.width/2, y_position, line)
+            y_position -= self.line_height
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Single registry of every CAP chart with a make-style selective rebuild CLI
+Charts register a name, a figure builder, the data files they read and the
+files they write. A chart is rebuilt only when its builder code, one of its
+inputs, one of the metrics_store values it read or one of its targets changed
+since the last successful build.
+
+Usage:
+    python chart_registry.py                      # rebuild whatever is stale
+    python chart_registry.py --only 'cool/*'      # restrict to matching charts
+    python chart_registry.py --exclude '*dashboard*' --force
+    python chart_registry.py --list
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+
+import metrics_store
+
+CAP_DATA = '/Users/jefffranzen/cap-data'
+STATE_FILE = f'{CAP_DATA}/.chart_state.json'
+
+class Chart:
+    """A registered chart: how to build it, what it reads and what it writes"""
+    def __init__(self, name, builder, inputs=(), targets=()):
+        self.name = name
+        self.builder = builder
+        self.inputs = list(inputs)
+        # (path, raster): raster is None for HTML, else (width, height, scale)
+        self.targets = list(targets)
+
+# Registration order is build order
+REGISTRY = {}
+# Target path -> the chart that writes it
+TARGETS = {}
+
+def register(name, builder, inputs=(), targets=()):
+    """Add a chart to the registry; names are unique 'group/chart' paths and no two charts share a target"""
+    if name in REGISTRY:
+        raise ValueError(f"Chart already registered: {name}")
+    for path, _ in targets:
+        if os.path.abspath(path) in TARGETS:
+            raise ValueError(f"{name} writes {path}, already a target of {TARGETS[os.path.abspath(path)]}")
+    for path, _ in targets:
+        TARGETS[os.path.abspath(path)] = name
+    REGISTRY[name] = Chart(name, builder, inputs, targets)
+    return REGISTRY[name]
+
+# 1. FINGERPRINTS
+
+def code_fingerprint(builder):
+    """Hash a builder's source plus the helpers and constants it references"""
+    digest = hashlib.sha256()
+    seen = set()
+
+    def visit(func):
+        if func in seen:
+            return
+        seen.add(func)
+        try:
+            digest.update(inspect.getsource(func).encode('utf-8'))
+            referenced = inspect.getclosurevars(func).globals
+        except (OSError, TypeError):
+            digest.update(repr(func).encode('utf-8'))
+            return
+        for name, value in sorted(referenced.items()):
+            if inspect.isfunction(value):
+                visit(value)
+            elif not (inspect.ismodule(value) or inspect.isclass(value) or callable(value)):
+                digest.update(f'{name}={value!r}'.encode('utf-8'))
+
+    visit(builder)
+    return digest.hexdigest()
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def input_fingerprints(paths, previous=None):
+    """[mtime_ns, size, sha256] per input; unchanged mtime+size reuses the old hash"""
+    previous = previous or {}
+    prints = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            prints[path] = None
+            continue
+        old = previous.get(path)
+        if old and old[0] == stat.st_mtime_ns and old[1] == stat.st_size:
+            prints[path] = old
+        else:
+            prints[path] = [stat.st_mtime_ns, stat.st_size, _file_sha256(path)]
+    return prints
+
+# 2. BUILD STATE
+
+def load_state():
+    try:
+        with open(STATE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    tmp_path = f'{STATE_FILE}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, STATE_FILE)
+
+def stale_reason(chart, state):
+    """Why a chart needs rebuilding, or None if it is up to date"""
+    entry = state.get(chart.name)
+    if not entry:
+        return 'never built'
+    if entry.get('code') != code_fingerprint(chart.builder):
+        return 'code changed'
+    previous = entry.get('inputs', {})
+    current = input_fingerprints(chart.inputs, previous)
+    for path, fingerprint in current.items():
+        old = previous.get(path)
+        if fingerprint is None or old is None or fingerprint[2] != old[2]:
+            return f'input changed: {os.path.basename(path)}'
+    recorded = entry.get('metrics', {})
+    for key, current_value in metrics_store.current_values(recorded).items():
+        if current_value != recorded[key]:
+            return f'metric changed: {key}'
+    for path, _ in chart.targets:
+        if not os.path.exists(path):
+            return f'missing target: {os.path.basename(path)}'
+    return None
+
+# 3. CHART DECLARATIONS
+
+def load_charts():
+    """Register every chart module's declared charts"""
+    if REGISTRY:
+        return REGISTRY
+
+    import create_20_visualizations as viz
+    from convert_to_images import IMAGES_DIR, IMAGE_NAMES
+    for name, builder in viz.VISUALIZATIONS:
+        image_name = IMAGE_NAMES.get(name, name)
+        register(f'visualizations/{name}', builder, targets=[
+            (f'{viz.VISUALIZATIONS_DIR}/{name}.html', None),
+            (f'{IMAGES_DIR}/{image_name}.png', (1200, 600, 2)),
+            (f'{IMAGES_DIR}/{image_name}.jpg', (1200, 600, 2)),
+        ])
+
+    import create_cap_graphics as cap
+    for name, builder, width, height in cap.CHARTS:
+        register(f'graphics/{name}', builder, targets=[
+            (f'{cap.GRAPHICS_DIR}/{name}.html', None),
+            (f'{cap.GRAPHICS_DIR}/{name}.png', (width, height, 1)),
+        ])
+
+    import fortune500_graphics as f500
+    graphics_dir = f'{CAP_DATA}/graphics'
+    for name, builder in f500.CHARTS:
+        register(f'fortune500/{name}', builder, targets=[
+            (f'{graphics_dir}/{name}.html', None),
+            (f'{graphics_dir}/{name}.png', (f500.DEFAULT_WIDTH, f500.DEFAULT_HEIGHT, 2)),
+        ])
+    register('fortune500/executive_dashboard', f500.build_executive_dashboard, targets=[
+        (f'{graphics_dir}/executive_dashboard.html', None),
+        (f'{graphics_dir}/executive_dashboard.png', (1600, 1600, 2)),
+    ])
+
+    # The cool sets draw their data from synthetic_data; a change there changes every chart
+    import network_charts
+    import synthetic_data
+    import create_cool_visualizations as cool
+    for name, builder in cool.VISUALIZATIONS:
+        inputs = [synthetic_data.__file__]
+        if builder is cool.create_network_graph:
+            inputs.append(network_charts.PARTNER_GRAPH_CSV)
+        register(f'cool/{name}', builder, inputs=inputs, targets=[
+            (f'{cool.COOL_DIR}/{name}.html', None),
+            (f'{cool.COOL_DIR}/{name}.png', (1400, 800, 2)),
+        ])
+
+    # The "fixed" cool set lives at the top of the cap-data folder
+    sys.path.append(CAP_DATA)
+    import create_cool_visualizations_fixed as cool_fixed
+    for name, builder in cool_fixed.VISUALIZATIONS:
+        register(f'cool_fixed/{name}', builder, inputs=[synthetic_data.__file__], targets=[
+            (f'{cool_fixed.COOL_DIR}/{name}.html', None),
+            (f'{cool_fixed.COOL_DIR}/{name}.png', (1400, 800, 2)),
+        ])
+
+    return REGISTRY
+
+def select(charts, only=None, exclude=None):
+    """Filter charts by --only/--exclude glob patterns"""
+    selected = []
+    for chart in charts:
+        if only and not any(fnmatch.fnmatch(chart.name, pattern) for pattern in only):
+            continue
+        if exclude and any(fnmatch.fnmatch(chart.name, pattern) for pattern in exclude):
+            continue
+        selected.append(chart)
+    return selected
+
+# 4. REBUILD
+
+def rebuild(charts, force=False, dry_run=False, workers=None):
+    """Build and export the stale subset of charts; returns (built, failed) counts"""
+    import html_export
+    from image_export import DEFAULT_WORKERS, export_figures
+
+    state = load_state()
+    stale = []
+    for chart in charts:
+        reason = 'forced' if force else stale_reason(chart, state)
+        if reason:
+            stale.append(chart)
+            print(f"🔄 {chart.name} ({reason})")
+
+    print(f"\n📊 {len(stale)} of {len(charts)} charts need rebuilding")
+    if dry_run or not stale:
+        return 0, 0
+
+    failed = set()
+    built = []
+    jobs = []
+    metrics_read = {}
+    for chart in stale:
+        try:
+            with metrics_store.recording() as reads:
+                fig = chart.builder()
+            metrics_read[chart.name] = reads
+            for path, raster in chart.targets:
+                if raster is None:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    html_export.write_html(fig, path)
+        except Exception as e:
+            print(f"❌ Failed: {chart.name} - {e}")
+            failed.add(chart.name)
+            continue
+        built.append(chart)
+
+        # One raster job per distinct export size; formats are encoded from it
+        rasters = {}
+        for path, raster in chart.targets:
+            if raster is not None:
+                rasters.setdefault(tuple(raster), []).append((path, None))
+        for raster, outputs in rasters.items():
+            jobs.append((chart.name, fig, raster, outputs))
+
+    if jobs:
+        results = export_figures(jobs, workers=workers or DEFAULT_WORKERS)
+        failed.update(name for name, _, error in results if error)
+
+    succeeded = [chart for chart in built if chart.name not in failed]
+    for chart in succeeded:
+        previous = state.get(chart.name, {}).get('inputs', {})
+        state[chart.name] = {
+            'code': code_fingerprint(chart.builder),
+            'inputs': input_fingerprints(chart.inputs, previous),
+            'metrics': metrics_read[chart.name],
+            'built_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+    save_state(state)
+
+    return len(succeeded), len(failed)
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild CAP charts whose code, inputs or outputs changed')
+    parser.add_argument('--only', action='append', default=[],
+                        help="glob of chart names to include, e.g. 'cool/*' (repeatable)")
+    parser.add_argument('--exclude', action='append', default=[],
+                        help="glob of chart names to skip (repeatable)")
+    parser.add_argument('--force', action='store_true', help='rebuild every selected chart')
+    parser.add_argument('--dry-run', action='store_true', help='only report what is stale')
+    parser.add_argument('--list', action='store_true', help='list registered charts and exit')
+    parser.add_argument('--workers', type=int, default=None, help='parallel kaleido workers')
+    args = parser.parse_args()
+
+    charts = select(load_charts().values(), args.only, args.exclude)
+
+    if args.list:
+        for chart in charts:
+            print(chart.name)
+        return
+
+    start = time.perf_counter()
+    built, failed = rebuild(charts, force=args.force, dry_run=args.dry_run, workers=args.workers)
+
+    print("=" * 60)
+    print(f"✅ Rebuilt: {built} charts in {time.perf_counter() - start:.1f}s")
+    if failed:
+        print(f"❌ Failed: {failed} charts")
+
+if __name__ == "__main__":
+    main()
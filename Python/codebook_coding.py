@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Codebook-driven automatic coding of the interview corpus
+Each disaster's codebook PDF is a spreadsheet printed as page tiles (Theme /
+Sub-theme on one run of pages, Code / Document / Quote on the next ...).
+Cells are rebuilt from the text positions pdf_extract caches, tiles are
+joined row by row, and the
+result is a Theme > Sub-theme > Code hierarchy with indicator phrases: the
+parenthesised keyword lists in the labels plus the coded quotes themselves.
+Keywords in a sub-theme label code the sub-theme (its own matrix column), not
+each code under it.
+Every transcript is then coded in one pass with an Aho-Corasick automaton
+over word tokens, one process per document, into a sparse
+interviews-by-codes count matrix (coded utterances per interview and code).
+
+Usage:
+    python codebook_coding.py                    # parse codebooks, code the corpus
+    python codebook_coding.py --codebooks-only   # just parse and list the hierarchy
+    python codebook_coding.py --top 20 --workers 8
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import ingest_transcripts
+import pdf_extract
+
+CAP_DATA = ingest_transcripts.CAP_DATA
+CODEBOOKS_JSON = f'{ingest_transcripts.CORPUS_DIR}/codebooks.json'
+CODING_PATH = f'{ingest_transcripts.CORPUS_DIR}/coding.npz'
+
+DEFAULT_WORKERS = ingest_transcripts.DEFAULT_WORKERS
+
+# Column headers used by the codebook spreadsheets; longest first so prefixes don't win
+HEADERS = ('Quote Elaboration', 'Sub-theme', 'Theme', 'Code', 'Document', 'Quote')
+HIERARCHY = ('Theme', 'Sub-theme', 'Code')
+
+CODEBOOK_FILE = re.compile(r'codebook.*\.pdf$', re.IGNORECASE)
+# "KY April Storms Codebook 2025 09 18" -> "KY April Storms"
+CODEBOOK_NOISE = re.compile(r'codebook|\b\d{4}(?: \d{2}){2}\b|\bDRO?\d{3}(?:-\d{2})?\b', re.IGNORECASE)
+
+PARENTHESES = re.compile(r'\(([^()]+)\)')
+KEYWORD_SPLIT = re.compile(r'[,;/]| or ')
+KEYWORD_NOISE = re.compile(r'\b(?:e\.g|i\.e)\.?(?=\W|$)|\betc\.?', re.IGNORECASE)
+TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Keyword indicators that occur in nearly every interview and so code nothing
+GENERIC_TERMS = {'red cross', 'cap partner', 'cap partners'}
+# Single words ('volunteers', 'data') turn up in nearly every interview; keywords must be phrases
+MIN_KEYWORD_WORDS = 2
+# Coded quotes are matched in chunks so a transcription difference only loses one chunk
+QUOTE_CHUNK_WORDS = 8
+MIN_QUOTE_WORDS = 4
+
+class Code:
+    """One leaf of a codebook (or a sub-theme, when name is None) with the phrases that indicate it"""
+    def __init__(self, codebook, theme, sub_theme, name):
+        self.codebook = codebook
+        self.theme = theme
+        self.sub_theme = sub_theme
+        self.name = name
+        self.indicators = set()
+        self.examples = []
+
+    @property
+    def key(self):
+        if self.name is None:
+            return f'{self.codebook} / {self.theme} / {self.sub_theme}'
+        return f'{self.codebook} / {self.theme} / {self.sub_theme} / {self.name}'
+
+def words(text):
+    """Lowercase word tokens; curly apostrophes are folded to straight ones"""
+    return TOKEN.findall(text.replace('’', "'").replace('‘', "'").lower())
+
+# 1. CODEBOOK PDFS
+
+def find_codebooks(root=CAP_DATA):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d not in ('Python', 'corpus'))
+        paths.extend(os.path.join(dirpath, name) for name in sorted(filenames) if CODEBOOK_FILE.search(name))
+    return paths
+
+def codebook_name(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return ' '.join(CODEBOOK_NOISE.sub(' ', stem).split())
+
+def _fix_mojibake(text):
+    # The exports store UTF-8 bytes as cp1252 characters ("â€‘" for a non-breaking hyphen)
+    try:
+        return text.encode('cp1252').decode('utf-8')
+    except UnicodeError:
+        return text
+
+def _tiles(pages):
+    """
+    Sheets of tiles: each tile is (columns [(header, x)], [fragments per page])
+    A tile starts on a page whose top line is all headers; a 'Theme' tile starts a sheet.
+    """
+    sheets = []
+    for fragments in pdf_extract.page_fragments(pages):
+        if not fragments:
+            continue
+        top = max(y for y, _, _ in fragments)
+        header = sorted((f for f in fragments if f[0] == top), key=lambda f: f[1])
+        names = [text.strip() for _, _, text in header]
+        if all(name in HEADERS for name in names):
+            if names[0] == 'Theme' or not sheets:
+                sheets.append([])
+            sheets[-1].append(([(name, x) for name, (_, x, _) in zip(names, header)], []))
+            fragments = [f for f in fragments if f[0] != top]
+        elif not sheets:
+            continue
+        sheets[-1][-1][1].append(fragments)
+    return sheets
+
+def _cell_ends(column, text):
+    # Wrapped cell lines end in a space or hyphen; file names wrap anywhere until the extension
+    if column == 'Document':
+        return _fix_mojibake(text).rstrip().lower().endswith(('.docx', '.pdf'))
+    return not text.endswith((' ', '-'))
+
+def _segment(columns, fragments, align):
+    """
+    Rows on one tile page as {row y: {column: text}}
+    Cells share their first line's y when top-aligned and their last line's y
+    when bottom-aligned; a y is a row edge if most columns start/end a cell there.
+    """
+    lines = {}
+    for y, x, text in fragments:
+        column = max((c for c in columns if c[1] <= x + 2), key=lambda c: c[1], default=columns[0])[0]
+        lines.setdefault(column, {}).setdefault(y, []).append((x, text))
+
+    votes = {}
+    for column, by_y in lines.items():
+        previous_ended = True
+        for y in sorted(by_y, reverse=True):
+            by_y[y] = ''.join(text for _, text in sorted(by_y[y]))
+            ended = _cell_ends(column, by_y[y])
+            votes.setdefault(y, []).append(previous_ended if align == 'top' else ended)
+            previous_ended = ended
+    edges = sorted((y for y, v in votes.items() if 2 * sum(v) >= len(v)), reverse=True)
+
+    rows = {edge: {} for edge in edges}
+    for column, by_y in lines.items():
+        for y in sorted(by_y, reverse=True):
+            if align == 'top':
+                edge = next((e for e in reversed(edges) if e >= y), None)
+            else:
+                edge = next((e for e in edges if e <= y), None)
+            if edge is not None:
+                rows[edge][column] = rows[edge].get(column, '') + by_y[y]
+    return rows
+
+def _sheet_rows(sheet):
+    """Join a sheet's tiles into full rows, trying both cell alignments"""
+    best = None
+    for align in ('top', 'bottom'):
+        merged = {}
+        for columns, pages in sheet:
+            for page_index, fragments in enumerate(pages):
+                for edge, cells in _segment(columns, fragments, align).items():
+                    merged.setdefault((page_index, edge), {}).update(cells)
+        rows = [row for _, row in sorted(merged.items(), key=lambda kv: (kv[0][0], -kv[0][1]))]
+        complete = sum(1 for row in rows if all(column in row for column in HIERARCHY))
+        if best is None or complete > best[0] or (complete == best[0] and len(rows) < len(best[1])):
+            best = (complete, rows)
+    return best[1]
+
+def _keywords(label):
+    """Indicator phrases from parenthesised lists: 'types (food trucks, mobile health/clinics)'"""
+    keywords = set()
+    for group in PARENTHESES.findall(label):
+        for keyword in KEYWORD_SPLIT.split(KEYWORD_NOISE.sub(' ', group)):
+            tokens = tuple(words(keyword))
+            if len(tokens) >= MIN_KEYWORD_WORDS and ' '.join(tokens) not in GENERIC_TERMS:
+                keywords.add(tokens)
+    return keywords
+
+def _quote_chunks(quote):
+    tokens = words(quote)
+    return {tuple(tokens[i:i + QUOTE_CHUNK_WORDS]) for i in range(0, len(tokens), QUOTE_CHUNK_WORDS)
+            if len(tokens[i:i + QUOTE_CHUNK_WORDS]) >= MIN_QUOTE_WORDS}
+
+def parse_codebook(path, pages):
+    """{code key: Code} for one codebook PDF from its pdf_extract pages, plus sub-themes with keywords"""
+    name = codebook_name(path)
+    codes = {}
+    for sheet in _tiles(pages):
+        for row in _sheet_rows(sheet):
+            cells = {column: ' '.join(_fix_mojibake(text).split()) for column, text in row.items()}
+            if not all(cells.get(column) for column in HIERARCHY):
+                continue
+            sub_theme_keywords = _keywords(cells['Sub-theme'])
+            if sub_theme_keywords:
+                sub_theme = Code(name, cells['Theme'], cells['Sub-theme'], None)
+                codes.setdefault(sub_theme.key, sub_theme).indicators |= sub_theme_keywords
+            code = Code(name, cells['Theme'], cells['Sub-theme'], cells['Code'])
+            code = codes.setdefault(code.key, code)
+            code.indicators |= _keywords(code.name)
+            quote = cells.get('Quote')
+            if quote:
+                code.examples.append((cells.get('Document'), quote))
+                code.indicators |= _quote_chunks(quote)
+    return codes
+
+def parse_codebooks(paths, workers=DEFAULT_WORKERS):
+    """Every codebook's codes; pages come from the pdf_extract cache (needs pypdf for new PDFs)"""
+    codes = {}
+    for path, pages in pdf_extract.extract(paths, workers=workers).items():
+        parsed = parse_codebook(path, pages)
+        leaves = sum(1 for code in parsed.values() if code.name is not None)
+        print(f"📘 {codebook_name(path)}: {leaves} codes, {len(parsed) - leaves} keyword sub-themes")
+        codes.update(parsed)
+    return codes
+
+def hierarchy(codes):
+    """{codebook: {theme: {sub-theme: [code names]}}}"""
+    tree = {}
+    for code in codes.values():
+        if code.name is None:
+            tree.setdefault(code.codebook, {}).setdefault(code.theme, {}).setdefault(code.sub_theme, [])
+            continue
+        tree.setdefault(code.codebook, {}).setdefault(code.theme, {}).setdefault(code.sub_theme, []).append(code.name)
+    return tree
+
+def save_codebooks(codes, path=CODEBOOKS_JSON):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({
+            'hierarchy': hierarchy(codes),
+            'codes': [{
+                'key': code.key,
+                'indicators': sorted(' '.join(tokens) for tokens in code.indicators),
+                'examples': [{'document': document, 'quote': quote} for document, quote in code.examples],
+            } for code in codes.values()],
+        }, f, indent=2)
+
+# 2. MATCHING
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over word tokens: all phrases found in one left-to-right pass"""
+    def __init__(self, phrases):
+        # phrases: iterable of (token tuple, code index)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for tokens, code in phrases:
+            node = 0
+            for token in tokens:
+                if token not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                    self.goto[node][token] = len(self.goto) - 1
+                node = self.goto[node][token]
+            self.output[node].add(code)
+
+        # Breadth-first failure links; each node also reports what its suffixes match
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self.goto[node].items():
+                queue.append(child)
+                if node:
+                    fallback = self.fail[node]
+                    while fallback and token not in self.goto[fallback]:
+                        fallback = self.fail[fallback]
+                    self.fail[child] = self.goto[fallback].get(token, 0)
+                self.output[child] |= self.output[self.fail[child]]
+
+    def codes(self, tokens):
+        """Indices of every code with an indicator phrase in tokens"""
+        found = set()
+        node = 0
+        for token in tokens:
+            while node and token not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(token, 0)
+            if self.output[node]:
+                found |= self.output[node]
+        return found
+
+# Set once per worker process so the automaton is pickled per worker, not per document
+_MATCHER = None
+
+def _init_worker(matcher):
+    global _MATCHER
+    _MATCHER = matcher
+
+def _code_interview(texts):
+    """{code index: coded utterances} for one interview"""
+    counts = Counter()
+    for text in texts:
+        counts.update(_MATCHER.codes(words(text)))
+    return counts
+
+# 3. CODING
+
+def code_corpus(codes, workers=DEFAULT_WORKERS, corpus_path=ingest_transcripts.CORPUS_PATH):
+    """
+    Sparse interviews-by-codes counts as a dict of COO arrays:
+    rows, cols, counts plus the interview ids, file names and code keys they index
+    """
+    keys = list(codes)
+    matcher = PhraseMatcher((tokens, index) for index, key in enumerate(keys) for tokens in codes[key].indicators)
+
+    table = ingest_transcripts.load_corpus(['interview_id', 'file_name', 'text'], corpus_path, canonical_only=True)
+    interviews = {}
+    for interview_id, file_name, text in zip(*(table.column(c).to_pylist() for c in ('interview_id', 'file_name', 'text'))):
+        interviews.setdefault(interview_id, (file_name, []))[1].append(text)
+    interview_ids = sorted(interviews, key=lambda i: interviews[i][0])
+
+    rows, cols, counts = [], [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(matcher,)) as pool:
+        jobs = (interviews[interview_id][1] for interview_id in interview_ids)
+        for row, coded in enumerate(pool.map(_code_interview, jobs, chunksize=4)):
+            for col, count in sorted(coded.items()):
+                rows.append(row)
+                cols.append(col)
+                counts.append(count)
+
+    return {
+        'rows': np.array(rows, dtype=np.int32),
+        'cols': np.array(cols, dtype=np.int32),
+        'counts': np.array(counts, dtype=np.int32),
+        'interviews': np.array(interview_ids),
+        'files': np.array([interviews[interview_id][0] for interview_id in interview_ids]),
+        'codes': np.array(keys),
+    }
+
+def save_coding(coding, path=CODING_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **coding)
+    os.replace(tmp_path, path)
+
+def load_coding(path=CODING_PATH):
+    with np.load(path) as stored:
+        return {name: stored[name] for name in stored.files}
+
+def to_sparse(coding):
+    """scipy.sparse COO matrix (interviews x codes) for analysis code that wants one"""
+    from scipy.sparse import coo_matrix
+    shape = (len(coding['interviews']), len(coding['codes']))
+    return coo_matrix((coding['counts'], (coding['rows'], coding['cols'])), shape=shape)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Parse codebooks and code every transcript')
+    parser.add_argument('--root', default=CAP_DATA, help='folder to scan for codebook PDFs')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--codebooks-only', action='store_true', help='parse and list codebooks without coding')
+    parser.add_argument('--top', type=int, default=10, help='most frequently coded codes to list')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        codes = parse_codebooks(find_codebooks(args.root), workers=args.workers)
+    except ImportError:
+        print("❌ Codebooks that aren't cached yet need pypdf: pip install pypdf")
+        raise SystemExit(1)
+    save_codebooks(codes)
+    print(f"\n🗂️  {len(codes)} codes and sub-themes, {sum(len(c.indicators) for c in codes.values()):,} indicator phrases "
+          f"in {time.perf_counter() - start:.1f}s")
+    if args.codebooks_only:
+        for codebook, themes in hierarchy(codes).items():
+            print(f"\n{codebook}")
+            for theme, sub_themes in themes.items():
+                print(f"  {theme}")
+                for sub_theme, names in sub_themes.items():
+                    print(f"    {sub_theme} ({len(names)} codes)")
+        raise SystemExit(0)
+
+    start = time.perf_counter()
+    coding = code_corpus(codes, workers=args.workers)
+    save_coding(coding)
+    print(f"✅ Coded {len(coding['interviews'])} interviews x {len(coding['codes'])} codes "
+          f"({len(coding['counts']):,} non-zero) in {time.perf_counter() - start:.1f}s")
+    print(f"📄 Matrix: {CODING_PATH}")
+
+    totals = np.bincount(coding['cols'], weights=coding['counts'], minlength=len(coding['codes']))
+    for index in np.argsort(totals)[::-1][:args.top]:
+        if totals[index]:
+            print(f"   {int(totals[index]):5d}  {coding['codes'][index]}")
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 """
 Convert all Plotly HTML visualizations to PNG/JPG images
+Figures are rendered in parallel by a pool of kaleido workers
 """
 
-import plotly.graph_objects as go
-import plotly.io as pio
+import argparse
 import os
+import time
 
-# Set up kaleido for static image export
-pio.kaleido.scope.mathjax = None
+from image_export import DEFAULT_WORKERS, FORMATS, export_figures, print_timing_report
 
 # American Red Cross Brand Colors
 ARC_RED = '#CC0000'
@@ -16,73 +16,93 @@ ARC_GRAY = '#6B7C93'
 ARC_DARK_GRAY = '#4A5568'
 ARC_LIGHT_GRAY = '#E2E8F0'
 
-print("\n📊 Converting all visualizations to PNG images...\n")
-print("=" * 60)
-
-# Import and run the visualization creation script
-import create_20_visualizations as viz
-
-# List of all visualization functions
-viz_functions = [
-    ('roi_by_disaster', viz.create_roi_by_disaster),
-    ('roi_by_partner', viz.create_roi_by_partner),
-    ('cost_containment_donut', viz.create_cost_containment_donut),
-    ('ia_uptake_comparison', viz.create_ia_uptake_comparison),
-    ('speed_advantage', viz.create_speed_advantage),
-    ('volunteer_trends', viz.create_volunteer_trends),
-    ('homes_safer_impact', viz.create_homes_safer_impact),
-    ('stakeholder_sentiment', viz.create_stakeholder_sentiment),
-    ('meal_cost_comparison', viz.create_meal_cost_comparison),
-    ('response_timeline', viz.create_response_timeline),
-    ('geographic_impact', viz.create_geographic_heatmap),
-    ('quarterly_trends', viz.create_quarterly_trends),
-    ('partner_distribution', viz.create_partner_distribution),
-    ('failures_prevented', viz.create_failures_prevented),
-    ('youth_preparedness', viz.create_youth_preparedness),
-    ('francine_breakdown', viz.create_francine_breakdown),
-    ('asset_utilization', viz.create_asset_utilization),
-    ('coalition_growth', viz.create_coalition_growth),
-    ('disaster_efficiency', viz.create_disaster_efficiency),
-    ('kpi_dashboard', viz.create_kpi_dashboard),
-    ('risk_timeline', viz.create_risk_timeline),
-    ('cultural_metrics', viz.create_cultural_metrics),
-    ('investment_return', viz.create_investment_return),
-    ('executive_scorecard', viz.create_executive_scorecard)
-]
-
-# Create images directory
-os.makedirs('/Users/jefffranzen/cap-data/images', exist_ok=True)
-
-# Convert each visualization to PNG
-successful = 0
-failed = 0
-
-for name, func in viz_functions:
+IMAGES_DIR = '/Users/jefffranzen/cap-data/images'
+
+# HTML output name -> image file name, where they differ
+IMAGE_NAMES = {
+    'roi_partner_waterfall': 'roi_by_partner',
+}
+
+def parse_formats(value):
+    """'png,jpg' -> ['png', 'jpg']; argparse reports anything image_export can't encode"""
+    formats = [f.strip().lower() for f in value.split(',') if f.strip()]
+    unknown = [f for f in formats if f'.{f}' not in FORMATS]
+    if unknown or not formats:
+        supported = ', '.join(ext.lstrip('.') for ext in FORMATS)
+        raise argparse.ArgumentTypeError(f"unsupported format in {value!r} (choose from {supported})")
+    return formats
+
+def parse_thumbnails(value):
+    """'400x200,200x100' -> [(400, 200), (200, 100)]"""
     try:
-        # Create the figure
-        fig = func()
-        
-        # Save as PNG (high resolution)
-        png_path = f'/Users/jefffranzen/cap-data/images/{name}.png'
-        fig.write_image(png_path, width=1200, height=600, scale=2)
-        
-        # Also save as JPG
-        jpg_path = f'/Users/jefffranzen/cap-data/images/{name}.jpg'
-        fig.write_image(jpg_path, width=1200, height=600, scale=2)
-        
-        print(f"✅ Converted: {name}")
-        successful += 1
-        
-    except Exception as e:
-        print(f"❌ Failed: {name} - {str(e)}")
-        failed += 1
-
-print("=" * 60)
-print(f"\n📊 Conversion Complete!")
-print(f"✅ Successful: {successful} visualizations")
-if failed > 0:
-    print(f"❌ Failed: {failed} visualizations")
-print(f"\n📁 PNG images saved to: /Users/jefffranzen/cap-data/images/")
-print(f"📁 JPG images saved to: /Users/jefffranzen/cap-data/images/")
-print("\n🎯 All images are high-resolution (1200x600px @ 2x scale)")
-print("   Ready for insertion into reports and presentations!")
\ No newline at end of file
+        boxes = [tuple(int(v) for v in box.lower().split('x')) for box in value.split(',') if box.strip()]
+    except ValueError:
+        boxes = None
+    if boxes is None or any(len(box) != 2 for box in boxes):
+        raise argparse.ArgumentTypeError(f"thumbnail boxes look like 400x200, got {value!r}")
+    return boxes
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert CAP visualizations to PNG/JPG images')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'number of parallel kaleido workers (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--formats', type=parse_formats, default='png,jpg',
+                        help='comma-separated output formats: png, jpg, webp (default: png,jpg)')
+    parser.add_argument('--thumbnails', type=parse_thumbnails, default='',
+                        help='comma-separated thumbnail boxes, e.g. 400x200,200x100')
+    args = parser.parse_args()
+
+    formats = args.formats
+    thumbnails = args.thumbnails
+
+    print("\n📊 Converting all visualizations to PNG images...\n")
+    print("=" * 60)
+
+    # Importing the builders is side-effect free; no HTML is rewritten here
+    import create_20_visualizations as viz
+
+    # Image files keep their historical names where they differ from the HTML name
+    viz_functions = [(IMAGE_NAMES.get(name, name), builder) for name, builder in viz.VISUALIZATIONS]
+
+    # Create images directory
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+
+    # Build every figure up front, then hand them to the render pool
+    jobs = []
+    failed = 0
+    for name, func in viz_functions:
+        try:
+            fig = func()
+        except Exception as e:
+            print(f"❌ Failed: {name} - {str(e)}")
+            failed += 1
+            continue
+
+        # Rasterize once at 1200x600 @ 2x; every format and thumbnail comes from that buffer
+        outputs = [(f'{IMAGES_DIR}/{name}.{fmt}', None) for fmt in formats]
+        outputs += [(f'{IMAGES_DIR}/thumbnails/{name}_{w}x{h}.png', (w, h)) for w, h in thumbnails]
+        jobs.append((name, fig, (1200, 600, 2), outputs))
+
+    print(f"\n🖼️  Rendering {len(jobs)} figures with {args.workers} workers...\n")
+    start = time.perf_counter()
+    results = export_figures(jobs, workers=args.workers)
+    wall_seconds = time.perf_counter() - start
+
+    successful = sum(1 for _, _, error in results if not error)
+    failed += len(results) - successful
+
+    print_timing_report(results, wall_seconds)
+
+    print("=" * 60)
+    print(f"\n📊 Conversion Complete!")
+    print(f"✅ Successful: {successful} visualizations")
+    if failed > 0:
+        print(f"❌ Failed: {failed} visualizations")
+    print(f"\n📁 {', '.join(fmt.upper() for fmt in formats)} images saved to: {IMAGES_DIR}/")
+    if thumbnails:
+        print(f"📁 Thumbnails saved to: {IMAGES_DIR}/thumbnails/")
+    print("\n🎯 All images are high-resolution (1200x600px @ 2x scale)")
+    print("   Ready for insertion into reports and presentations!")
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,18 @@
 """
 Create 20+ Professional Fortune 500 Quality Visualizations for CAP Report
 American Red Cross Brand Colors: #CC0000 (red), #6B7C93 (gray), white, black
+
+The create_* functions are pure figure builders: importing this module and
+calling them writes nothing. HTML output happens in the export stage
+(create_all_visualizations / export_html).
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
 import os
 
-# Create output directory
-os.makedirs('/Users/jefffranzen/cap-data/visualizations', exist_ok=True)
+import html_export
+import metrics_store
+
+VISUALIZATIONS_DIR = '/Users/jefffranzen/cap-data/visualizations'
 
 # American Red Cross Brand Colors
 ARC_RED = '#CC0000'
@@ -29,16 +30,19 @@ AXIS_FONT_SIZE = 12
 LABEL_FONT_SIZE = 11
 
 def save_figure(fig, name):
-    """Save figure as both HTML and static image"""
-    fig.write_html(f'/Users/jefffranzen/cap-data/visualizations/{name}.html')
+    """Save figure as interactive HTML"""
+    html_export.write_html(fig, f'{VISUALIZATIONS_DIR}/{name}.html')
     print(f"✅ Created: {name}")
     return fig
 
 # 1. ROI BY DISASTER TYPE - Horizontal Bar
 def create_roi_by_disaster():
+    import plotly.graph_objects as go
+
+    disasters, roi_values = metrics_store.series('roi_by_disaster')
     data = {
-        'Disaster Type': ['Hurricane', 'Flooding', 'Tornado'],
-        'ROI': [37.30, 25.53, 9.77]
+        'Disaster Type': disasters,
+        'ROI': roi_values
     }
     
     fig = go.Figure(go.Bar(
@@ -65,16 +69,17 @@ def create_roi_by_disaster():
         margin=dict(l=100, r=50, t=50, b=50)
     )
     
-    return save_figure(fig, 'roi_by_disaster')
+    return fig
 
 # 2. ROI BY PARTNER TYPE - Waterfall Chart
 def create_roi_by_partner():
-    partners = ['Resilience Hub', 'Community Gateway', 'Hunger Partners', 'Health Partners', 'Housing Partners']
-    roi_values = [33.48, 30.11, 26.33, 22.99, 4.91]
+    import plotly.graph_objects as go
+
+    partners, roi_values = metrics_store.series('roi_by_partner')
     
     fig = go.Figure(go.Waterfall(
         name="ROI", orientation="v",
-        measure=["relative", "relative", "relative", "relative", "relative"],
+        measure=["relative"] * len(roi_values),
         x=partners,
         y=roi_values,
         text=[f"{v:.1f}%" for v in roi_values],
@@ -94,10 +99,12 @@ def create_roi_by_partner():
         width=900
     )
     
-    return save_figure(fig, 'roi_partner_waterfall')
+    return fig
 
 # 3. COST CONTAINMENT DONUT - With Center KPI
 def create_cost_containment_donut():
+    import plotly.graph_objects as go
+
     labels = ['Direct Services', 'Volunteer Labor', 'Facilities', 'Equipment', 'Other']
     values = [650000, 450000, 200000, 150000, 156305]
     
@@ -111,7 +118,7 @@ def create_cost_containment_donut():
     ))
     
     fig.add_annotation(
-        text='$1.6M<br>Total Savings',
+        text=f"{metrics_store.millions('cost_containment.total')}<br>Total Savings",
         x=0.5, y=0.5,
         font=dict(size=24, family=FONT_FAMILY, color=ARC_RED),
         showarrow=False
@@ -127,13 +134,19 @@ def create_cost_containment_donut():
         legend=dict(orientation="v", x=1.1, y=0.5)
     )
     
-    return save_figure(fig, 'cost_containment_donut')
+    return fig
 
 # 4. IA UPTAKE RATES - Grouped Bar Chart
 def create_ia_uptake_comparison():
+    import plotly.graph_objects as go
+
     categories = ['Hurricane Francine<br>(Terrebonne)', 'Tennessee<br>Tornados', 'South Texas<br>Floods', 'Kentucky<br>Floods']
-    cap_rates = [93, 80.7, 58.3, 53.8]
-    overall_rates = [67, 75.3, 51, 34.3]
+    cap_rates = [metrics_store.value(key) for key in (
+        'ia.completion.cap', 'ia.completion.tn_tornados.cap',
+        'ia.completion.south_tx_floods.cap', 'ia.completion.ky_floods.cap')]
+    overall_rates = [metrics_store.value(key) for key in (
+        'ia.completion.overall', 'ia.completion.tn_tornados.overall',
+        'ia.completion.south_tx_floods.overall', 'ia.completion.ky_floods.overall')]
     
     fig = go.Figure()
     
@@ -169,10 +182,12 @@ def create_ia_uptake_comparison():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'ia_uptake_comparison')
+    return fig
 
 # 5. SPEED ADVANTAGE - Horizontal Bar with Annotations
 def create_speed_advantage():
+    import plotly.graph_objects as go
+
     disasters = ['Kentucky Floods', 'Tennessee Tornados', 'MO/AR Storms', 
                  'South Texas Floods', 'FLOCOM', 'Hurricane Francine']
     days_faster = [4, 3, 1, 1, 1, 0]
@@ -202,13 +217,18 @@ def create_speed_advantage():
         margin=dict(l=150, r=100)
     )
     
-    return save_figure(fig, 'speed_advantage')
+    return fig
 
 # 6. VOLUNTEER ENGAGEMENT TRENDS - Dual Line Chart
 def create_volunteer_trends():
+    import plotly.graph_objects as go
+
     years = ['FY20', 'FY21', 'FY22', 'FY23', 'FY24', 'FY25']
-    cap_trend = [100, 105, 110, 125, 130, 135.92]
-    national_trend = [100, 102, 104, 108, 112, 116.05]
+    # FY25 index is FY20 (= 100) plus the stored growth
+    cap_growth = metrics_store.value('volunteers.growth')
+    national_growth = metrics_store.value('volunteers.growth.national')
+    cap_trend = [100, 105, 110, 125, 130, 100 + cap_growth]
+    national_trend = [100, 102, 104, 108, 112, 100 + national_growth]
     
     fig = go.Figure()
     
@@ -229,8 +249,8 @@ def create_volunteer_trends():
     ))
     
     fig.add_annotation(
-        x='FY25', y=135.92,
-        text='+35.92%',
+        x='FY25', y=100 + cap_growth,
+        text=f"+{metrics_store.percent('volunteers.growth', 2)}",
         showarrow=True,
         arrowhead=2,
         ax=-40, ay=-30,
@@ -238,8 +258,8 @@ def create_volunteer_trends():
     )
     
     fig.add_annotation(
-        x='FY25', y=116.05,
-        text='+16.05%',
+        x='FY25', y=100 + national_growth,
+        text=f"+{metrics_store.percent('volunteers.growth.national', 2)}",
         showarrow=True,
         arrowhead=2,
         ax=40, ay=-30,
@@ -259,13 +279,15 @@ def create_volunteer_trends():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'volunteer_trends')
+    return fig
 
 # 7. HOMES MADE SAFER - Bubble Scatter
 def create_homes_safer_impact():
+    import plotly.graph_objects as go
+
     counties = ['Cameron County, TX', 'Butte County, CA', 'Montgomery County, AL', 
                 'Sarasota County, FL', 'National Average']
-    increases = [1366.67, 828.57, 167.39, 165.47, 14.02]
+    increases = [1366.67, 828.57, 167.39, 165.47, metrics_store.value('homes_safer.growth.national')]
     sizes = [100, 80, 60, 60, 150]  # Bubble sizes
     colors = [ARC_RED, ARC_RED, ARC_RED, ARC_RED, ARC_GRAY]
     
@@ -279,8 +301,9 @@ def create_homes_safer_impact():
         textfont=dict(size=14, family=FONT_FAMILY, color=ARC_BLACK)
     ))
     
-    fig.add_hline(y=66.24, line_dash="dash", line_color=ARC_RED, 
-                  annotation_text="CAP Average: +66.24%", annotation_position="right")
+    fig.add_hline(y=metrics_store.value('homes_safer.growth'), line_dash="dash", line_color=ARC_RED,
+                  annotation_text=f"CAP Average: +{metrics_store.percent('homes_safer.growth', 2)}",
+                  annotation_position="right")
     
     fig.update_layout(
         title='Homes Made Safer: CAP Jurisdiction Performance',
@@ -294,10 +317,12 @@ def create_homes_safer_impact():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY, type='log', range=[1, 3.5])
     )
     
-    return save_figure(fig, 'homes_safer_impact')
+    return fig
 
 # 8. STAKEHOLDER SENTIMENT - Radar Chart
 def create_stakeholder_sentiment():
+    import plotly.graph_objects as go
+
     categories = ['Speed of\nResponse', 'Cultural\nAppropriateness', 
                   'Partnership\nEffectiveness', 'Resource\nAvailability', 
                   'Cost\nEfficiency', 'Scalability']
@@ -330,10 +355,12 @@ def create_stakeholder_sentiment():
         font=dict(family=FONT_FAMILY)
     )
     
-    return save_figure(fig, 'stakeholder_sentiment')
+    return fig
 
 # 9. COST PER MEAL COMPARISON - Column Chart
 def create_meal_cost_comparison():
+    import plotly.graph_objects as go
+
     providers = ['CAP Partners', 'Standard Red Cross', 'Commercial Vendors']
     costs = [4.25, 10.00, 12.50]
     colors = [ARC_RED, ARC_GRAY, ARC_DARK_GRAY]
@@ -359,10 +386,12 @@ def create_meal_cost_comparison():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY, range=[0, 15])
     )
     
-    return save_figure(fig, 'meal_cost_comparison')
+    return fig
 
 # 10. DISASTER RESPONSE TIMELINE - Gantt-style
 def create_response_timeline():
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     # CAP Response
@@ -398,10 +427,12 @@ def create_response_timeline():
         yaxis=dict(tickfont=dict(size=12, family=FONT_FAMILY))
     )
     
-    return save_figure(fig, 'response_timeline')
+    return fig
 
 # 11. GEOGRAPHIC IMPACT HEATMAP
 def create_geographic_heatmap():
+    import plotly.graph_objects as go
+
     states = ['TX', 'TN', 'KY', 'FL', 'CA', 'MO', 'AR', 'LA']
     impact_scores = [95, 88, 82, 78, 75, 70, 68, 85]
     
@@ -429,10 +460,12 @@ def create_geographic_heatmap():
         width=800
     )
     
-    return save_figure(fig, 'geographic_impact')
+    return fig
 
 # 12. QUARTERLY PERFORMANCE TRENDS
 def create_quarterly_trends():
+    import plotly.graph_objects as go
+
     quarters = ['Q1 FY23', 'Q2 FY23', 'Q3 FY23', 'Q4 FY23', 
                 'Q1 FY24', 'Q2 FY24', 'Q3 FY24', 'Q4 FY24',
                 'Q1 FY25', 'Q2 FY25', 'Q3 FY25', 'Q4 FY25']
@@ -463,10 +496,12 @@ def create_quarterly_trends():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'quarterly_trends')
+    return fig
 
 # 13. PARTNER TYPE DISTRIBUTION - Pie Chart
 def create_partner_distribution():
+    import plotly.graph_objects as go
+
     types = ['Resilience Hubs', 'Community Gateways', 'Hunger Partners', 
              'Health Partners', 'Housing Partners', 'Faith-Based', 'Other']
     counts = [25, 18, 22, 15, 10, 20, 12]
@@ -489,10 +524,12 @@ def create_partner_distribution():
         showlegend=True
     )
     
-    return save_figure(fig, 'partner_distribution')
+    return fig
 
 # 14. SERVICE DELIVERY FAILURES PREVENTED
 def create_failures_prevented():
+    import plotly.graph_objects as go
+
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     failures_prevented = [0, 1, 0, 2, 1, 1, 2, 1, 2, 1, 0, 1]
@@ -528,10 +565,12 @@ def create_failures_prevented():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY, range=[0, 3])
     )
     
-    return save_figure(fig, 'failures_prevented')
+    return fig
 
 # 15. YOUTH PREPAREDNESS COMPARISON
 def create_youth_preparedness():
+    import plotly.graph_objects as go
+
     categories = ['CAP Jurisdictions', 'National Average']
     values = [101.23, 39.13]
     
@@ -557,10 +596,12 @@ def create_youth_preparedness():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY, range=[0, 120])
     )
     
-    return save_figure(fig, 'youth_preparedness')
+    return fig
 
 # 16. HURRICANE FRANCINE DETAILED BREAKDOWN
 def create_francine_breakdown():
+    import plotly.graph_objects as go
+
     categories = ['Hot Meals', 'Emergency Kits', 'Shelter Nights', 
                   'Transportation', 'Translation Services']
     cap_provided = [8500, 1200, 450, 125, 85]
@@ -586,10 +627,12 @@ def create_francine_breakdown():
         xaxis_tickangle=-30
     )
     
-    return save_figure(fig, 'francine_breakdown')
+    return fig
 
 # 17. ASSET UTILIZATION MATRIX
 def create_asset_utilization():
+    import plotly.graph_objects as go
+
     assets = ['Refrigerated Trucks', 'Box Trucks', 'Generators', 
               'Forklifts', 'Mobile Units']
     utilization = [92, 88, 75, 95, 82]
@@ -630,10 +673,13 @@ def create_asset_utilization():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'asset_utilization')
+    return fig
 
 # 18. COALITION GROWTH OVER TIME
 def create_coalition_growth():
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     years = ['FY22', 'FY23', 'FY24', 'FY25']
     coalitions = [5, 12, 25, 42]
     members = [50, 180, 450, 820]
@@ -667,10 +713,12 @@ def create_coalition_growth():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'coalition_growth')
+    return fig
 
 # 19. DISASTER TYPE EFFICIENCY MATRIX
 def create_disaster_efficiency():
+    import plotly.graph_objects as go
+
     disasters = ['Hurricane', 'Tornado', 'Flood', 'Wildfire', 'Storm']
     speed_score = [95, 85, 78, 72, 80]
     cost_efficiency = [92, 75, 82, 68, 77]
@@ -705,10 +753,13 @@ def create_disaster_efficiency():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY, range=[65, 100])
     )
     
-    return save_figure(fig, 'disaster_efficiency')
+    return fig
 
 # 20. COMPREHENSIVE KPI DASHBOARD
 def create_kpi_dashboard():
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=2, cols=3,
         subplot_titles=('Total ROI', 'Cost Containment', 'Speed Advantage',
@@ -720,7 +771,7 @@ def create_kpi_dashboard():
     # ROI
     fig.add_trace(go.Indicator(
         mode="number+delta",
-        value=28.3,
+        value=metrics_store.value('roi.overall'),
         delta={'reference': 25, 'relative': True},
         number={'suffix': "%", 'font': {'size': 40, 'color': ARC_RED}},
         domain={'x': [0, 1], 'y': [0, 1]}
@@ -729,7 +780,7 @@ def create_kpi_dashboard():
     # Cost Containment
     fig.add_trace(go.Indicator(
         mode="number",
-        value=1606305,
+        value=metrics_store.value('cost_containment.total'),
         number={'prefix': "$", 'font': {'size': 40, 'color': ARC_RED}},
         domain={'x': [0, 1], 'y': [0, 1]}
     ), row=1, col=2)
@@ -748,8 +799,8 @@ def create_kpi_dashboard():
     # Volunteer Growth
     fig.add_trace(go.Indicator(
         mode="number+delta",
-        value=35.92,
-        delta={'reference': 16.05},
+        value=metrics_store.value('volunteers.growth'),
+        delta={'reference': metrics_store.value('volunteers.growth.national')},
         number={'suffix': "%", 'font': {'size': 40, 'color': ARC_RED}},
         domain={'x': [0, 1], 'y': [0, 1]}
     ), row=2, col=1)
@@ -765,8 +816,8 @@ def create_kpi_dashboard():
     # Homes Safer
     fig.add_trace(go.Indicator(
         mode="number+delta",
-        value=66.24,
-        delta={'reference': 14.02},
+        value=metrics_store.value('homes_safer.growth'),
+        delta={'reference': metrics_store.value('homes_safer.growth.national')},
         number={'suffix': "%", 'font': {'size': 40, 'color': ARC_RED}},
         domain={'x': [0, 1], 'y': [0, 1]}
     ), row=2, col=3)
@@ -780,10 +831,14 @@ def create_kpi_dashboard():
         font=dict(family=FONT_FAMILY)
     )
     
-    return save_figure(fig, 'kpi_dashboard')
+    return fig
 
 # 21. BRAND RISK MITIGATION TIMELINE
 def create_risk_timeline():
+    import plotly.graph_objects as go
+    import pandas as pd
+    import numpy as np
+
     months = pd.date_range('2024-10', '2025-09', freq='M')
     risk_events = [1, 0, 1, 2, 0, 1, 2, 1, 2, 1, 0, 1]
     cumulative = np.cumsum(risk_events)
@@ -820,10 +875,12 @@ def create_risk_timeline():
         hovermode='x unified'
     )
     
-    return save_figure(fig, 'risk_timeline')
+    return fig
 
 # 22. CULTURAL APPROPRIATENESS METRICS
 def create_cultural_metrics():
+    import plotly.graph_objects as go
+
     metrics = ['Bilingual Support', 'Culturally Adapted Meals', 
                'Faith-Based Outreach', 'Community Trust', 'Local Messengers']
     scores = [95, 92, 88, 96, 91]
@@ -850,10 +907,12 @@ def create_cultural_metrics():
         font=dict(family=FONT_FAMILY)
     )
     
-    return save_figure(fig, 'cultural_metrics')
+    return fig
 
 # 23. INVESTMENT VS RETURN SCATTER
 def create_investment_return():
+    import plotly.graph_objects as go
+
     partners = ['Resilience Hub A', 'Resilience Hub B', 'Gateway A', 'Gateway B',
                 'Hunger Partner A', 'Hunger Partner B', 'Health Partner A', 
                 'Housing Partner A', 'Housing Partner B']
@@ -899,10 +958,12 @@ def create_investment_return():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'investment_return')
+    return fig
 
 # 24. SUMMARY EXECUTIVE SCORECARD
 def create_executive_scorecard():
+    import plotly.graph_objects as go
+
     categories = ['Financial Impact', 'Operational Speed', 'Service Quality', 
                   'Community Engagement', 'Strategic Value']
     cap_scores = [92, 88, 95, 86, 90]
@@ -940,44 +1001,64 @@ def create_executive_scorecard():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'executive_scorecard')
+    return fig
+
+# Output name -> figure builder, in report order
+VISUALIZATIONS = [
+    ('roi_by_disaster', create_roi_by_disaster),
+    ('roi_partner_waterfall', create_roi_by_partner),
+    ('cost_containment_donut', create_cost_containment_donut),
+    ('ia_uptake_comparison', create_ia_uptake_comparison),
+    ('speed_advantage', create_speed_advantage),
+    ('volunteer_trends', create_volunteer_trends),
+    ('homes_safer_impact', create_homes_safer_impact),
+    ('stakeholder_sentiment', create_stakeholder_sentiment),
+    ('meal_cost_comparison', create_meal_cost_comparison),
+    ('response_timeline', create_response_timeline),
+    ('geographic_impact', create_geographic_heatmap),
+    ('quarterly_trends', create_quarterly_trends),
+    ('partner_distribution', create_partner_distribution),
+    ('failures_prevented', create_failures_prevented),
+    ('youth_preparedness', create_youth_preparedness),
+    ('francine_breakdown', create_francine_breakdown),
+    ('asset_utilization', create_asset_utilization),
+    ('coalition_growth', create_coalition_growth),
+    ('disaster_efficiency', create_disaster_efficiency),
+    ('kpi_dashboard', create_kpi_dashboard),
+    ('risk_timeline', create_risk_timeline),
+    ('cultural_metrics', create_cultural_metrics),
+    ('investment_return', create_investment_return),
+    ('executive_scorecard', create_executive_scorecard)
+]
+
+def build_figures(visualizations=VISUALIZATIONS):
+    """Build every figure without writing anything; returns (name, fig) pairs"""
+    return [(name, builder()) for name, builder in visualizations]
+
+def export_html(figures):
+    """Export stage: write each (name, fig) as HTML plus a gallery page"""
+    os.makedirs(VISUALIZATIONS_DIR, exist_ok=True)
+    for name, fig in figures:
+        save_figure(fig, name)
+
+    # One page with every chart, loading plotly.js once
+    html_export.write_gallery([fig for _, fig in figures], f'{VISUALIZATIONS_DIR}/index.html',
+                              title="CAP Evaluation Visualizations")
 
 # Main execution
 def create_all_visualizations():
     print("\n🎨 Creating 24 Fortune 500 Quality Visualizations for CAP Report\n")
     print("=" * 60)
     
-    # Create all visualizations
-    visualizations = [
-        create_roi_by_disaster(),
-        create_roi_by_partner(),
-        create_cost_containment_donut(),
-        create_ia_uptake_comparison(),
-        create_speed_advantage(),
-        create_volunteer_trends(),
-        create_homes_safer_impact(),
-        create_stakeholder_sentiment(),
-        create_meal_cost_comparison(),
-        create_response_timeline(),
-        create_geographic_heatmap(),
-        create_quarterly_trends(),
-        create_partner_distribution(),
-        create_failures_prevented(),
-        create_youth_preparedness(),
-        create_francine_breakdown(),
-        create_asset_utilization(),
-        create_coalition_growth(),
-        create_disaster_efficiency(),
-        create_kpi_dashboard(),
-        create_risk_timeline(),
-        create_cultural_metrics(),
-        create_investment_return(),
-        create_executive_scorecard()
-    ]
-    
+    # Build all visualizations, then export them
+    figures = build_figures()
+    export_html(figures)
+    visualizations = [fig for _, fig in figures]
+
     print("=" * 60)
     print(f"\n✅ Successfully created {len(visualizations)} professional visualizations!")
-    print(f"📁 Location: /Users/jefffranzen/cap-data/visualizations/")
+    print(f"📁 Location: {VISUALIZATIONS_DIR}/")
+    print(f"🌐 Gallery: {VISUALIZATIONS_DIR}/index.html")
     print("\n🎯 All visualizations use American Red Cross brand colors:")
     print("   • Primary: #CC0000 (Red)")
     print("   • Secondary: #6B7C93 (Gray)")
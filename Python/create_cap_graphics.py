@@ -4,6 +4,10 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+import html_export
+import metrics_store
+import render_cache
+
 # Set consistent color scheme
 cap_colors = {
     'primary': '#ED1B2E',  # Red Cross Red
@@ -22,12 +26,11 @@ def create_roi_comparison():
     )
     
     # Hazard Type Data
-    hazards = ['Hurricane', 'Flooding', 'Tornado']
-    roi_hazard = [37.30, 25.53, 9.77]
+    hazards, roi_hazard = metrics_store.series('roi_by_disaster')
     
     # Partner Type Data
-    partners = ['Resilience Hub', 'Community Gateway', 'Hunger', 'Health', 'Housing']
-    roi_partner = [33.48, 30.11, 26.33, 22.99, 4.91]
+    partners, roi_partner = metrics_store.series('roi_by_partner')
+    partners = [label.replace(' Partners', '') for label in partners]
     
     # Add hazard bars
     fig.add_trace(
@@ -57,7 +60,9 @@ def create_roi_comparison():
     
     fig.update_layout(
         title={
-            'text': "CAP Return on Investment Analysis<br><sub>28.3% Overall ROI on $5.67M Investment</sub>",
+            'text': "CAP Return on Investment Analysis<br><sub>"
+                    f"{metrics_store.percent('roi.overall')} Overall ROI on "
+                    f"{metrics_store.millions('investment.partner', 2)} Investment</sub>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 24, 'color': cap_colors['primary']}
@@ -143,8 +148,9 @@ def create_volunteer_trend():
     years = ['FY20', 'FY21', 'FY22', 'FY23', 'FY24', 'FY25']
     
     # Simulated data showing the trend
-    national = [100, 102, 105, 110, 113, 116]  # 16.05% increase
-    cap_jurisdictions = [100, 103, 107, 125, 132, 136]  # 35.92% increase
+    # FY25 is FY20 (= 100) plus the stored growth
+    national = [100, 102, 105, 110, 113, round(100 + metrics_store.value('volunteers.growth.national'))]
+    cap_jurisdictions = [100, 103, 107, 125, 132, round(100 + metrics_store.value('volunteers.growth'))]
     
     fig = go.Figure()
     
@@ -176,7 +182,9 @@ def create_volunteer_trend():
     
     fig.update_layout(
         title={
-            'text': "Volunteer Engagement: The CAP Halo Effect<br><sub>+35.92% in CAP Jurisdictions vs +16.05% National Average</sub>",
+            'text': "Volunteer Engagement: The CAP Halo Effect<br>"
+                    f"<sub>+{metrics_store.percent('volunteers.growth', 2)} in CAP Jurisdictions vs "
+                    f"+{metrics_store.percent('volunteers.growth.national', 2)} National Average</sub>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 24, 'color': cap_colors['primary']}
@@ -203,8 +211,12 @@ def create_ia_uptake():
     locations = ['Terrebonne Parish<br>(Hurricane Francine)', 'McNairy County<br>(TN Tornados)',
                  'Warren County<br>(KY Floods)', 'Cameron/Hidalgo<br>(South TX Floods)']
     
-    cap_rates = [93.0, 80.7, 53.8, 58.3]
-    overall_rates = [67.0, 75.3, 34.3, 51.0]
+    cap_rates = [metrics_store.value(key) for key in (
+        'ia.completion.cap', 'ia.completion.tn_tornados.cap',
+        'ia.completion.ky_floods.cap', 'ia.completion.south_tx_floods.cap')]
+    overall_rates = [metrics_store.value(key) for key in (
+        'ia.completion.overall', 'ia.completion.tn_tornados.overall',
+        'ia.completion.ky_floods.overall', 'ia.completion.south_tx_floods.overall')]
     
     fig = go.Figure()
     
@@ -270,7 +282,8 @@ def create_homes_safer():
     counties = ['Cameron County, TX', 'Butte County, CA', 'Montgomery County, AL', 
                 'Sarasota County, FL', 'CAP Average', 'National Average']
     
-    increase = [1366.67, 828.57, 167.39, 165.47, 66.24, 14.02]
+    increase = [1366.67, 828.57, 167.39, 165.47,
+                metrics_store.value('homes_safer.growth'), metrics_store.value('homes_safer.growth.national')]
     bubble_size = [x/10 for x in increase]  # Scale for bubble size
     
     fig = go.Figure()
@@ -295,8 +308,8 @@ def create_homes_safer():
     ))
     
     # Add horizontal line for national average
-    fig.add_hline(y=14.02, line_dash="dash", line_color="gray", 
-                  annotation_text="National Average: +14.02%")
+    fig.add_hline(y=metrics_store.value('homes_safer.growth.national'), line_dash="dash", line_color="gray",
+                  annotation_text=f"National Average: +{metrics_store.percent('homes_safer.growth.national', 2)}")
     
     fig.update_layout(
         title={
@@ -339,14 +352,15 @@ def create_cost_breakdown():
     
     fig.update_layout(
         title={
-            'text': "Cost Containment Breakdown<br><sub>$1.6M Total Value from Partner Contributions</sub>",
+            'text': "Cost Containment Breakdown<br><sub>"
+                    f"{metrics_store.millions('cost_containment.total')} Total Value from Partner Contributions</sub>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 24, 'color': cap_colors['primary']}
         },
         height=500,
         paper_bgcolor='white',
-        annotations=[dict(text='$1.6M<br>Total', x=0.5, y=0.5, font_size=20, showarrow=False)]
+        annotations=[dict(text=f"{metrics_store.millions('cost_containment.total')}<br>Total", x=0.5, y=0.5, font_size=20, showarrow=False)]
     )
     
     return fig
@@ -437,40 +451,38 @@ def create_coalition_growth():
     
     return fig
 
+# Kept apart from graphics/, where fortune500_graphics writes its own ia_uptake and homes_safer
+GRAPHICS_DIR = "/Users/jefffranzen/cap-data/cap_graphics"
+
+# Output name -> (figure builder, PNG width, PNG height)
+CHARTS = [
+    ('roi_comparison', create_roi_comparison, 1200, 500),
+    ('speed_comparison', create_speed_comparison, 1200, 500),
+    ('volunteer_trend', create_volunteer_trend, 1200, 500),
+    ('ia_uptake', create_ia_uptake, 1200, 500),
+    ('homes_safer', create_homes_safer, 1200, 600),
+    ('cost_breakdown', create_cost_breakdown, 1200, 500),
+    ('coalition_growth', create_coalition_growth, 1200, 500)
+]
+
 # Generate all figures
 if __name__ == "__main__":
     print("Generating CAP Report Graphics...")
     
     # Create all visualizations
-    fig1 = create_roi_comparison()
-    fig2 = create_speed_comparison()
-    fig3 = create_volunteer_trend()
-    fig4 = create_ia_uptake()
-    fig5 = create_homes_safer()
-    fig6 = create_cost_breakdown()
-    fig7 = create_coalition_growth()
+    figures = [(name, builder(), width, height) for name, builder, width, height in CHARTS]
     
     # Save as HTML files
-    fig1.write_html("/Users/jefffranzen/cap-data/graphics/roi_comparison.html")
-    fig2.write_html("/Users/jefffranzen/cap-data/graphics/speed_comparison.html")
-    fig3.write_html("/Users/jefffranzen/cap-data/graphics/volunteer_trend.html")
-    fig4.write_html("/Users/jefffranzen/cap-data/graphics/ia_uptake.html")
-    fig5.write_html("/Users/jefffranzen/cap-data/graphics/homes_safer.html")
-    fig6.write_html("/Users/jefffranzen/cap-data/graphics/cost_breakdown.html")
-    fig7.write_html("/Users/jefffranzen/cap-data/graphics/coalition_growth.html")
+    for name, fig, width, height in figures:
+        html_export.write_html(fig, f"{GRAPHICS_DIR}/{name}.html")
     
     # Also save as static images (requires kaleido)
     try:
-        fig1.write_image("/Users/jefffranzen/cap-data/graphics/roi_comparison.png", width=1200, height=500)
-        fig2.write_image("/Users/jefffranzen/cap-data/graphics/speed_comparison.png", width=1200, height=500)
-        fig3.write_image("/Users/jefffranzen/cap-data/graphics/volunteer_trend.png", width=1200, height=500)
-        fig4.write_image("/Users/jefffranzen/cap-data/graphics/ia_uptake.png", width=1200, height=500)
-        fig5.write_image("/Users/jefffranzen/cap-data/graphics/homes_safer.png", width=1200, height=600)
-        fig6.write_image("/Users/jefffranzen/cap-data/graphics/cost_breakdown.png", width=1200, height=500)
-        fig7.write_image("/Users/jefffranzen/cap-data/graphics/coalition_growth.png", width=1200, height=500)
+        for name, fig, width, height in figures:
+            render_cache.write_image(fig, f"{GRAPHICS_DIR}/{name}.png", width=width, height=height)
         print("Static images saved successfully!")
     except:
         print("Note: Install kaleido package to save static images: pip install kaleido")
     
     print("All graphics generated successfully!")
-    print("HTML files saved to /Users/jefffranzen/cap-data/graphics/")
\ No newline at end of file
+    print(f"HTML files saved to {GRAPHICS_DIR}/")
\ No newline at end of file
@@ -11,8 +11,15 @@ import pandas as pd
 import numpy as np
 import os
 
-# Create output directory
-os.makedirs('/Users/jefffranzen/cap-data/cool_visualizations', exist_ok=True)
+import distribution_summary
+import html_export
+import large_data
+import metrics_store
+import network_charts
+import render_cache
+import synthetic_data
+
+COOL_DIR = '/Users/jefffranzen/cap-data/cool_visualizations'
 
 # American Red Cross Brand Colors
 ARC_RED = '#CC0000'
@@ -27,9 +34,10 @@ PALETTE = ['#CC0000', '#E53E3E', '#6B7C93', '#4A5568', '#F56565', '#FC8181', '#F
 
 def save_figure(fig, name):
     """Save figure as both HTML and PNG"""
-    fig.write_html(f'/Users/jefffranzen/cap-data/cool_visualizations/{name}.html')
+    os.makedirs(COOL_DIR, exist_ok=True)
+    html_export.write_html(fig, f'{COOL_DIR}/{name}.html')
     try:
-        fig.write_image(f'/Users/jefffranzen/cap-data/cool_visualizations/{name}.png', width=1400, height=800, scale=2)
+        render_cache.write_image(fig, f'{COOL_DIR}/{name}.png', width=1400, height=800, scale=2)
     except:
         pass
     print(f"✅ Created: {name}")
@@ -39,7 +47,9 @@ def save_figure(fig, name):
 def create_3d_performance():
     partners = ['Resilience Hub A', 'Resilience Hub B', 'Gateway A', 'Gateway B', 
                 'Hunger Partner A', 'Hunger Partner B', 'Health Partner', 'Housing Partner']
-    roi = [33.5, 32.1, 30.1, 28.5, 26.3, 24.2, 23.0, 4.9]
+    # Measured ROI per partner type (hub, gateway, hunger, health, housing); the "B" partners are illustrative
+    _, measured = metrics_store.series('roi_by_partner')
+    roi = [measured[0], 32.1, measured[1], 28.5, measured[2], 24.2, measured[3], measured[4]]
     speed = [95, 92, 88, 85, 82, 78, 75, 65]
     quality = [98, 95, 92, 90, 88, 85, 83, 75]
     
@@ -75,7 +85,7 @@ def create_3d_performance():
         width=1400
     )
     
-    return save_figure(fig, '3d_performance_matrix')
+    return fig
 
 # 2. ANIMATED BUBBLE CHART - Cost Savings Over Time
 def create_animated_bubbles():
@@ -84,19 +94,19 @@ def create_animated_bubbles():
                 'Q1 FY24', 'Q2 FY24', 'Q3 FY24', 'Q4 FY24',
                 'Q1 FY25', 'Q2 FY25', 'Q3 FY25', 'Q4 FY25']
     
-    data = []
-    for i, q in enumerate(quarters):
-        for partner_type in ['Resilience', 'Gateway', 'Hunger', 'Health', 'Housing']:
-            data.append({
-                'Quarter': q,
-                'Partner Type': partner_type,
-                'Cost Savings': np.random.randint(20000, 100000) * (i+1)/4,
-                'Efficiency': np.random.randint(70, 98),
-                'Impact': np.random.randint(60, 100),
-                'Size': np.random.randint(20, 100)
-            })
+    partner_types = ['Resilience', 'Gateway', 'Hunger', 'Health', 'Housing']
+    rng = synthetic_data.chart_rng('create_animated_bubbles')
+    n = len(quarters) * len(partner_types)
     
-    df = pd.DataFrame(data)
+    # One row per (quarter, partner type), savings growing each quarter
+    df = pd.DataFrame({
+        'Quarter': np.repeat(quarters, len(partner_types)),
+        'Partner Type': np.tile(partner_types, len(quarters)),
+        'Cost Savings': rng.integers(20000, 100000, n) * np.repeat(np.arange(1, len(quarters) + 1) / 4, len(partner_types)),
+        'Efficiency': rng.integers(70, 98, n),
+        'Impact': rng.integers(60, 100, n),
+        'Size': rng.integers(20, 100, n)
+    })
     
     fig = px.scatter(df, x='Efficiency', y='Impact', 
                      animation_frame='Quarter',
@@ -118,7 +128,7 @@ def create_animated_bubbles():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'animated_bubble_evolution')
+    return fig
 
 # 3. SUNBURST CHART - Hierarchical Cost Breakdown
 def create_sunburst_breakdown():
@@ -161,25 +171,23 @@ def create_sunburst_breakdown():
         width=1400
     )
     
-    return save_figure(fig, 'sunburst_cost_hierarchy')
+    return fig
 
 # 4. SCATTER PLOT MATRIX - Multi-dimensional Analysis
 def create_scatter_matrix():
     # Generate correlation data
-    np.random.seed(42)
+    rng = synthetic_data.chart_rng('create_scatter_matrix')
     n_points = 50
     
-    data = pd.DataFrame({
-        'ROI (%)': np.random.normal(28, 10, n_points),
-        'Speed (days)': np.random.normal(2, 1, n_points),
-        'Quality Score': np.random.normal(85, 10, n_points),
-        'Cost Saved ($K)': np.random.normal(50, 20, n_points),
-        'Volunteers': np.random.normal(100, 30, n_points)
-    })
+    data = pd.DataFrame(synthetic_data.normal_columns(rng, {
+        'ROI (%)': (28, 10),
+        'Speed (days)': (2, 1),
+        'Volunteers': (100, 30)
+    }, n_points))
     
     # Add some correlation
-    data['Quality Score'] = data['ROI (%)'] * 2 + np.random.normal(0, 5, n_points)
-    data['Cost Saved ($K)'] = data['ROI (%)'] * 1.5 + np.random.normal(0, 10, n_points)
+    data['Quality Score'] = synthetic_data.jitter(rng, data['ROI (%)'] * 2, 5)
+    data['Cost Saved ($K)'] = synthetic_data.jitter(rng, data['ROI (%)'] * 1.5, 10)
     
     fig = px.scatter_matrix(data,
                             dimensions=['ROI (%)', 'Speed (days)', 'Quality Score', 'Cost Saved ($K)', 'Volunteers'],
@@ -198,7 +206,7 @@ def create_scatter_matrix():
         coloraxis_colorbar=dict(title="ROI %")
     )
     
-    return save_figure(fig, 'scatter_matrix_analysis')
+    return fig
 
 # 5. ADVANCED HEATMAP - Geographic Impact with Annotations
 def create_advanced_heatmap():
@@ -206,17 +214,16 @@ def create_advanced_heatmap():
     metrics = ['Speed', 'Quality', 'Cost Savings', 'Volunteer Growth', 'IA Uptake', 'Community Trust']
     
     # Generate realistic looking data
-    z_values = []
-    for metric in metrics:
-        row = []
-        for state in states:
-            if state in ['TX', 'FL', 'LA']:  # High performing states
-                row.append(np.random.randint(80, 100))
-            elif state in ['TN', 'KY', 'CA']:  # Medium performing
-                row.append(np.random.randint(65, 85))
-            else:  # Lower performing
-                row.append(np.random.randint(50, 75))
-        z_values.append(row)
+    tiers = {}
+    for state in states:
+        if state in ['TX', 'FL', 'LA']:  # High performing states
+            tiers[state] = (80, 100)
+        elif state in ['TN', 'KY', 'CA']:  # Medium performing
+            tiers[state] = (65, 85)
+        else:  # Lower performing
+            tiers[state] = (50, 75)
+    rng = synthetic_data.chart_rng('create_advanced_heatmap')
+    z_values = synthetic_data.tiered_integers(rng, tiers, states, len(metrics)).tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
@@ -252,7 +259,7 @@ def create_advanced_heatmap():
         yaxis=dict(tickmode='linear')
     )
     
-    return save_figure(fig, 'advanced_heatmap')
+    return fig
 
 # 6. PARALLEL COORDINATES - Partner Performance Profiles
 def create_parallel_coordinates():
@@ -260,13 +267,16 @@ def create_parallel_coordinates():
     partners = ['Resilience Hub', 'Community Gateway', 'Hunger Partner', 
                 'Health Partner', 'Housing Partner'] * 5
     
+    _, partner_roi = metrics_store.series('roi_by_partner')
+    
+    rng = synthetic_data.chart_rng('create_parallel_coordinates')
     data = pd.DataFrame({
         'Partner': partners,
-        'ROI': [33.5, 30.1, 26.3, 23.0, 4.9] * 5 + np.random.normal(0, 2, 25),
-        'Speed': [95, 88, 82, 75, 65] * 5 + np.random.normal(0, 5, 25),
-        'Quality': [98, 92, 88, 83, 75] * 5 + np.random.normal(0, 3, 25),
-        'Cost Efficiency': [92, 85, 78, 72, 60] * 5 + np.random.normal(0, 4, 25),
-        'Community Impact': [96, 90, 85, 80, 70] * 5 + np.random.normal(0, 3, 25)
+        'ROI': synthetic_data.jitter(rng, partner_roi * 5, 2),
+        'Speed': synthetic_data.jitter(rng, [95, 88, 82, 75, 65] * 5, 5),
+        'Quality': synthetic_data.jitter(rng, [98, 92, 88, 83, 75] * 5, 3),
+        'Cost Efficiency': synthetic_data.jitter(rng, [92, 85, 78, 72, 60] * 5, 4),
+        'Community Impact': synthetic_data.jitter(rng, [96, 90, 85, 80, 70] * 5, 3)
     })
     
     # Normalize values
@@ -287,48 +297,42 @@ def create_parallel_coordinates():
         coloraxis_colorbar=dict(title="ROI %")
     )
     
-    return save_figure(fig, 'parallel_coordinates')
+    return fig
 
 # 7. VIOLIN PLOT - Distribution Analysis
 def create_violin_distribution():
-    # Generate realistic distributions
-    categories = ['Hurricane', 'Tornado', 'Flood', 'Wildfire', 'Storm']
-    data = []
-    
-    for cat in categories:
-        if cat == 'Hurricane':
-            values = np.random.normal(85, 10, 100)
-        elif cat == 'Tornado':
-            values = np.random.normal(75, 12, 80)
-        elif cat == 'Flood':
-            values = np.random.normal(70, 15, 90)
-        elif cat == 'Wildfire':
-            values = np.random.normal(68, 8, 70)
-        else:
-            values = np.random.normal(72, 11, 85)
-        
-        for v in values:
-            data.append({'Disaster Type': cat, 'Performance Score': v})
-    
-    df = pd.DataFrame(data)
-    
-    fig = px.violin(df, x='Disaster Type', y='Performance Score',
-                   color='Disaster Type',
-                   color_discrete_sequence=[ARC_RED, '#E53E3E', ARC_GRAY, ARC_DARK_GRAY, '#F56565'],
-                   box=True, points='all',
-                   title='Performance Distribution by Disaster Type')
+    # Generate realistic distributions: (category, mean, sd, count)
+    rng = synthetic_data.chart_rng('create_violin_distribution')
+    categories, scores = synthetic_data.normal_groups(rng, [
+        ('Hurricane', 85, 10, 100),
+        ('Tornado', 75, 12, 80),
+        ('Flood', 70, 15, 90),
+        ('Wildfire', 68, 8, 70),
+        ('Storm', 72, 11, 85),
+    ])
+    
+    disaster_types = ['Hurricane', 'Tornado', 'Flood', 'Wildfire', 'Storm']
+    violin_colors = [ARC_RED, '#E53E3E', ARC_GRAY, ARC_DARK_GRAY, '#F56565']
+    
+    # KDE and quartiles computed here; only the curves go into the HTML
+    fig = go.Figure()
+    for i, disaster in enumerate(disaster_types):
+        fig.add_traces(distribution_summary.violin_traces(
+            scores[categories == disaster], i, disaster, violin_colors[i]))
     
     fig.update_layout(
+        title='Performance Distribution by Disaster Type',
         title_font=dict(size=22, family='Arial Black', color=ARC_RED),
+        xaxis=dict(title='Disaster Type', tickvals=list(range(len(disaster_types))), ticktext=disaster_types),
         paper_bgcolor=ARC_WHITE,
         plot_bgcolor='#FAFAFA',
         height=700,
         width=1400,
         showlegend=False,
-        yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
+        yaxis=dict(title='Performance Score', gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'violin_distribution')
+    return fig
 
 # 8. SANKEY DIAGRAM - Resource Flow
 def create_sankey_flow():
@@ -363,14 +367,14 @@ def create_sankey_flow():
         font_size=12
     )
     
-    return save_figure(fig, 'sankey_resource_flow')
+    return fig
 
 # 9. SCATTER WITH MARGINAL PLOTS
 def create_scatter_marginal():
     # Generate correlated data
-    np.random.seed(42)
-    investment = np.random.exponential(50000, 100)
-    returns = investment * np.random.normal(0.283, 0.1, 100)  # 28.3% ROI with variation
+    rng = synthetic_data.chart_rng('create_scatter_marginal')
+    investment = rng.exponential(50000, 100)
+    returns = investment * rng.normal(metrics_store.value('roi.overall') / 100, 0.1, 100)  # overall ROI with variation
     
     df = pd.DataFrame({
         'Investment ($)': investment,
@@ -384,7 +388,8 @@ def create_scatter_marginal():
                     marginal_x='histogram',
                     marginal_y='box',
                     title='Investment vs Return Analysis with Distribution Profiles',
-                    hover_data=['ROI (%)'])
+                    hover_data=['ROI (%)'],
+                    render_mode=large_data.render_mode(len(df)))
     
     fig.update_traces(marker=dict(size=8, opacity=0.7))
     
@@ -398,7 +403,7 @@ def create_scatter_marginal():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'scatter_marginal_analysis')
+    return fig
 
 # 10. TREEMAP - Hierarchical Impact
 def create_treemap_impact():
@@ -443,7 +448,7 @@ def create_treemap_impact():
         width=1400
     )
     
-    return save_figure(fig, 'treemap_impact')
+    return fig
 
 # 11. FUNNEL CHART - Service Delivery Pipeline
 def create_funnel_pipeline():
@@ -472,48 +477,39 @@ def create_funnel_pipeline():
         width=1400
     )
     
-    return save_figure(fig, 'funnel_pipeline')
+    return fig
 
 # 12. NETWORK GRAPH - Partner Connections
 def create_network_graph():
-    # Create network data
+    # Real coalition graph when available, laid out once and cached
+    graph = network_charts.partner_graph()
+    pos = network_charts.cached_layout(graph)
+    degree = graph.degree()
+    
+    # All edges in one trace, NaN-separated
+    edge_x, edge_y = network_charts.edge_segments(pos, graph.edges)
     edge_trace = go.Scatter(
-        x=[], y=[],
+        x=edge_x, y=edge_y,
         line=dict(width=0.5, color=ARC_LIGHT_GRAY),
         hoverinfo='none',
         mode='lines')
     
-    # Generate positions
-    np.random.seed(42)
-    n_nodes = 30
-    pos = {}
-    for i in range(n_nodes):
-        pos[i] = (np.random.randn(), np.random.randn())
-    
-    # Add edges
-    for i in range(n_nodes):
-        for j in range(i+1, min(i+4, n_nodes)):
-            x0, y0 = pos[i]
-            x1, y1 = pos[j]
-            edge_trace['x'] += (x0, x1, None)
-            edge_trace['y'] += (y0, y1, None)
-    
-    # Node trace
+    # Node trace; labels only fit on small graphs
     node_trace = go.Scatter(
-        x=[pos[i][0] for i in range(n_nodes)],
-        y=[pos[i][1] for i in range(n_nodes)],
-        mode='markers+text',
+        x=pos[:, 0],
+        y=pos[:, 1],
+        mode='markers+text' if graph.n_nodes <= 60 else 'markers',
         hoverinfo='text',
         marker=dict(
             showscale=True,
             colorscale=[[0, ARC_GRAY], [1, ARC_RED]],
-            size=[20 + i for i in range(n_nodes)],
-            color=list(range(n_nodes)),
+            size=np.clip(10 + 2 * degree, 10, 40),
+            color=degree,
             colorbar=dict(thickness=15, title='Connections', xanchor='left', titleside='right'),
             line_width=2,
             line_color='white'
         ),
-        text=['Red Cross' if i == 0 else f'Partner {i}' for i in range(n_nodes)],
+        text=graph.labels,
         textposition='top center'
     )
     
@@ -532,7 +528,7 @@ def create_network_graph():
         yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
     )
     
-    return save_figure(fig, 'network_graph')
+    return fig
 
 # 13. ANIMATED LINE RACE - Growth Over Time
 def create_line_race():
@@ -578,7 +574,7 @@ def create_line_race():
         legend=dict(x=0.02, y=0.98)
     )
     
-    return save_figure(fig, 'growth_race')
+    return fig
 
 # 14. POLAR BAR CHART - 360° Impact View
 def create_polar_bar():
@@ -629,33 +625,24 @@ def create_polar_bar():
         legend=dict(x=0.85, y=0.95)
     )
     
-    return save_figure(fig, 'polar_360_view')
+    return fig
 
 # 15. DENSITY CONTOUR - Performance Clusters
 def create_density_contour():
     # Generate clustered data
-    np.random.seed(42)
-    
-    # High performers cluster
-    x1 = np.random.normal(80, 5, 100)
-    y1 = np.random.normal(85, 5, 100)
-    
-    # Medium performers cluster
-    x2 = np.random.normal(60, 8, 80)
-    y2 = np.random.normal(65, 8, 80)
+    rng = synthetic_data.chart_rng('create_density_contour')
     
-    # Low performers cluster
-    x3 = np.random.normal(40, 6, 50)
-    y3 = np.random.normal(45, 6, 50)
-    
-    x = np.concatenate([x1, x2, x3])
-    y = np.concatenate([y1, y2, y3])
+    # High, medium and low performer clusters
+    counts = [100, 80, 50]
+    sds = np.repeat([5, 8, 6], counts)
+    x = rng.normal(np.repeat([80, 60, 40], counts), sds)
+    y = rng.normal(np.repeat([85, 65, 45], counts), sds)
     
     fig = go.Figure()
     
-    fig.add_trace(go.Histogram2dContour(
-        x=x,
-        y=y,
+    fig.add_trace(large_data.density_contour(
+        x,
+        y,
         colorscale=[[0, ARC_WHITE], [0.5, '#FEB2B2'], [1, ARC_RED]],
         reversescale=False,
         xaxis='x',
@@ -667,10 +654,9 @@ def create_density_contour():
         )
     ))
     
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
-        mode='markers',
+    fig.add_trace(large_data.density_points(
+        x,
+        y,
         marker=dict(
             color='rgba(0,0,0,0.3)',
             size=3
@@ -691,7 +677,7 @@ def create_density_contour():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'density_clusters')
+    return fig
 
 # 16. SURFACE PLOT - 3D Performance Landscape
 def create_surface_landscape():
@@ -729,7 +715,7 @@ def create_surface_landscape():
         width=1400
     )
     
-    return save_figure(fig, 'surface_landscape')
+    return fig
 
 # 17. RIDGELINE PLOT - Distribution Evolution
 def create_ridgeline():
@@ -737,37 +723,33 @@ def create_ridgeline():
     
     years = ['FY21', 'FY22', 'FY23', 'FY24', 'FY25']
     
+    # Generate distributions that improve over time, one row per year
+    rng = synthetic_data.chart_rng('create_ridgeline')
+    steps = np.arange(len(years))[:, None]
+    distributions = rng.normal(60 + steps*8, 15 - steps*2, size=(len(years), 1000))
+    
+    # One KDE curve per year, resting on that year's row
     for i, year in enumerate(years):
-        # Generate distribution that improves over time
-        y_values = np.random.normal(60 + i*8, 15 - i*2, 1000)
-        
-        fig.add_trace(go.Violin(
-            x=y_values,
-            y=[year] * len(y_values),
-            name=year,
-            side='positive',
-            line_color=[ARC_GRAY, ARC_GRAY, '#F56565', '#E53E3E', ARC_RED][i],
-            fillcolor=[ARC_GRAY, ARC_GRAY, '#F56565', '#E53E3E', ARC_RED][i],
-            opacity=0.6,
-            meanline_visible=True
+        fig.add_traces(distribution_summary.ridge_traces(
+            distributions[i], i, year,
+            [ARC_GRAY, ARC_GRAY, '#F56565', '#E53E3E', ARC_RED][i],
+            opacity=0.6
         ))
     
     fig.update_layout(
         title='Performance Distribution Evolution - The Journey to Excellence',
         title_font=dict(size=22, family='Arial Black', color=ARC_RED),
         xaxis_title='Performance Score',
-        yaxis_title='Fiscal Year',
         paper_bgcolor=ARC_WHITE,
         plot_bgcolor='#FAFAFA',
         height=700,
         width=1400,
         showlegend=False,
         xaxis=dict(gridcolor=ARC_LIGHT_GRAY),
-        violingap=0,
-        violinmode='overlay'
+        yaxis=dict(title='Fiscal Year', tickvals=list(range(len(years))), ticktext=years)
     )
     
-    return save_figure(fig, 'ridgeline_evolution')
+    return fig
 
 # 18. SPIDER WEB COMPARISON
 def create_spider_comparison():
@@ -816,48 +798,28 @@ def create_spider_comparison():
         showlegend=True
     )
     
-    return save_figure(fig, 'spider_comparison')
+    return fig
 
 # 19. BOX PLOT WITH JITTER - Statistical Excellence
 def create_box_jitter():
-    # Generate data for different metrics
-    metrics = []
-    scores = []
+    # Generate data for different metrics: (metric, mean, sd, count)
+    rng = synthetic_data.chart_rng('create_box_jitter')
+    metrics, scores = synthetic_data.normal_groups(rng, [
+        ('Speed', 85, 10, 100),
+        ('Quality', 88, 8, 100),
+        ('Cost Efficiency', 82, 12, 100),
+        ('Community Impact', 78, 15, 100),
+    ])
     
     metric_names = ['Speed', 'Quality', 'Cost Efficiency', 'Community Impact']
     
-    for metric in metric_names:
-        if metric == 'Quality':
-            values = np.random.normal(88, 8, 100)
-        elif metric == 'Speed':
-            values = np.random.normal(85, 10, 100)
-        elif metric == 'Cost Efficiency':
-            values = np.random.normal(82, 12, 100)
-        else:
-            values = np.random.normal(78, 15, 100)
-        
-        metrics.extend([metric] * 100)
-        scores.extend(values)
-    
     fig = go.Figure()
     
-    # Add box plots
+    # Add box plots from precomputed quartiles; only outliers are drawn as points
     for metric in metric_names:
-        metric_scores = [s for m, s in zip(metrics, scores) if m == metric]
-        
-        fig.add_trace(go.Box(
-            y=metric_scores,
-            name=metric,
-            boxpoints='all',
-            jitter=0.3,
-            pointpos=-1.8,
-            marker=dict(
-                color=ARC_RED if metric == 'Quality' else ARC_GRAY,
-                size=4,
-                opacity=0.5
-            ),
-            line=dict(color=ARC_RED if metric == 'Quality' else ARC_GRAY),
-            fillcolor=(ARC_RED if metric == 'Quality' else ARC_GRAY)
+        fig.add_traces(distribution_summary.box_traces(
+            scores[metrics == metric], metric,
+            ARC_RED if metric == 'Quality' else ARC_GRAY
         ))
     
     fig.update_layout(
@@ -872,7 +834,7 @@ def create_box_jitter():
         yaxis=dict(gridcolor=ARC_LIGHT_GRAY)
     )
     
-    return save_figure(fig, 'box_jitter_stats')
+    return fig
 
 # 20. COMPOUND DASHBOARD - Executive Summary
 def create_executive_dashboard():
@@ -935,13 +897,14 @@ def create_executive_dashboard():
                  row=3, col=2)
     
     # Future Projection
+    projection = [metrics_store.value('roi.overall') + i * 0.5 for i in range(4)]
     fig.add_trace(go.Scatter(x=quarters + list(range(13, 17)),
-                             y=roi_values + [28.3 + i * 0.5 for i in range(4)],
+                             y=roi_values + projection,
                              mode='lines',
                              line=dict(color=ARC_RED, dash='solid')),
                  row=3, col=3)
     fig.add_trace(go.Scatter(x=list(range(13, 17)),
-                             y=[28.3 + i * 0.5 for i in range(4)],
+                             y=projection,
                              mode='lines',
                              line=dict(color=ARC_GRAY, dash='dash')),
                  row=3, col=3)
@@ -955,39 +918,48 @@ def create_executive_dashboard():
         showlegend=False
     )
     
-    return save_figure(fig, 'executive_dashboard_complete')
+    return fig
+
+# Output name -> figure builder
+VISUALIZATIONS = [
+    ('3d_performance_matrix', create_3d_performance),
+    ('animated_bubble_evolution', create_animated_bubbles),
+    ('sunburst_cost_hierarchy', create_sunburst_breakdown),
+    ('scatter_matrix_analysis', create_scatter_matrix),
+    ('advanced_heatmap', create_advanced_heatmap),
+    ('parallel_coordinates', create_parallel_coordinates),
+    ('violin_distribution', create_violin_distribution),
+    ('sankey_resource_flow', create_sankey_flow),
+    ('scatter_marginal_analysis', create_scatter_marginal),
+    ('treemap_impact', create_treemap_impact),
+    ('funnel_pipeline', create_funnel_pipeline),
+    ('network_graph', create_network_graph),
+    ('growth_race', create_line_race),
+    ('polar_360_view', create_polar_bar),
+    ('density_clusters', create_density_contour),
+    ('surface_landscape', create_surface_landscape),
+    ('ridgeline_evolution', create_ridgeline),
+    ('spider_comparison', create_spider_comparison),
+    ('box_jitter_stats', create_box_jitter),
+    ('executive_dashboard_complete', create_executive_dashboard)
+]
 
 # Main execution
 def create_all_cool_visualizations():
     print("\n🚀 Creating 20 COOL, MODERN Visualizations\n")
     print("=" * 60)
     
-    visualizations = [
-        create_3d_performance(),
-        create_animated_bubbles(),
-        create_sunburst_breakdown(),
-        create_scatter_matrix(),
-        create_advanced_heatmap(),
-        create_parallel_coordinates(),
-        create_violin_distribution(),
-        create_sankey_flow(),
-        create_scatter_marginal(),
-        create_treemap_impact(),
-        create_funnel_pipeline(),
-        create_network_graph(),
-        create_line_race(),
-        create_polar_bar(),
-        create_density_contour(),
-        create_surface_landscape(),
-        create_ridgeline(),
-        create_spider_comparison(),
-        create_box_jitter(),
-        create_executive_dashboard()
-    ]
+    # Build every figure, then save each as HTML + PNG
+    visualizations = [save_figure(builder(), name) for name, builder in VISUALIZATIONS]
     
+    # One page with every chart, loading plotly.js once
+    html_export.write_gallery(visualizations, f'{COOL_DIR}/index.html',
+                              title="CAP Cool Visualizations")
+
     print("=" * 60)
     print(f"\n🎨 Successfully created {len(visualizations)} COOL visualizations!")
-    print(f"📁 Location: /Users/jefffranzen/cap-data/cool_visualizations/")
+    print(f"📁 Location: {COOL_DIR}/")
+    print(f"🌐 Gallery: {COOL_DIR}/index.html")
     print("\n✨ Features:")
     print("   • 3D scatter plots and surface plots")
     print("   • Animated bubble charts")
@@ -13,49 +13,35 @@ Creates a professional, board-ready PDF report with:
 import os
 import sys
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import HexColor, black, white, red
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from reportlab.lib.colors import black, red
+from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle,
     Image, Frame, PageTemplate, BaseDocTemplate, NextPageTemplate
 )
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.lib import colors
-from reportlab.pdfgen import canvas
 from reportlab.platypus.flowables import KeepTogether
 from reportlab.lib.units import mm
 from datetime import datetime
 import textwrap
 import subprocess
 
+import brand_styles
+import metrics_store
+import page_decoration
+import pdf_images
+
 # American Red Cross Brand Colors
-ARC_RED = HexColor('#CC0000')
-ARC_GRAY = HexColor('#6B7C93')
-ARC_LIGHT_GRAY = HexColor('#F5F5F5')
-ARC_DARK_GRAY = HexColor('#333333')
+ARC_RED = brand_styles.ARC_RED
+ARC_GRAY = brand_styles.ARC_GRAY
+ARC_LIGHT_GRAY = brand_styles.ARC_LIGHT_GRAY
+ARC_DARK_GRAY = brand_styles.ARC_DARK_GRAY
 
-class NumberedCanvas(canvas.Canvas):
+class NumberedCanvas(page_decoration.NumberedCanvas):
     """Canvas with page numbering and headers"""
     
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-        self.page_num = 0
-
-    def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
-
-    def save(self):
-        num_pages = len(self._saved_page_states)
-        for (page_num, state) in enumerate(self._saved_page_states):
-            self.__dict__.update(state)
-            self.draw_page_number(page_num + 1, num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
     def draw_page_number(self, page_num, total_pages):
         """Draw page number and header"""
         if page_num == 1:  # Skip title page
@@ -78,142 +64,8 @@ class NumberedCanvas(canvas.Canvas):
         self.drawString(72, letter[1] - 60, "CAP EVALUATION REPORT")
 
 def create_styles():
-    """Create custom paragraph styles"""
-    from reportlab.lib.styles import StyleSheet1
-    
-    styles = StyleSheet1()
-    
-    # Base styles first
-    styles.add(ParagraphStyle(
-        name='Normal',
-        fontName='Helvetica',
-        fontSize=10,
-        leading=12,
-    ))
-    
-    # Title page styles
-    styles.add(ParagraphStyle(
-        name='MainTitle',
-        parent=styles['Normal'],
-        fontSize=28,
-        textColor=ARC_RED,
-        alignment=TA_CENTER,
-        spaceBefore=30,
-        spaceAfter=20,
-        fontName='Helvetica-Bold'
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='Subtitle',
-        parent=styles['Normal'],
-        fontSize=16,
-        textColor=ARC_GRAY,
-        alignment=TA_CENTER,
-        spaceBefore=10,
-        spaceAfter=30,
-        fontName='Helvetica'
-    ))
-    
-    # Section headers
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Normal'],
-        fontSize=18,
-        textColor=ARC_RED,
-        spaceBefore=24,
-        spaceAfter=12,
-        fontName='Helvetica-Bold',
-        borderWidth=2,
-        borderColor=ARC_RED,
-        borderPadding=8,
-        backColor=ARC_LIGHT_GRAY
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SubsectionHeader',
-        parent=styles['Normal'],
-        fontSize=14,
-        textColor=ARC_DARK_GRAY,
-        spaceBefore=18,
-        spaceAfter=8,
-        fontName='Helvetica-Bold'
-    ))
-    
-    # Body text
-    styles.add(ParagraphStyle(
-        name='BodyText',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        alignment=TA_JUSTIFY,
-        spaceBefore=6,
-        spaceAfter=6,
-        fontName='Helvetica'
-    ))
-    
-    # Executive summary
-    styles.add(ParagraphStyle(
-        name='ExecutiveSummary',
-        parent=styles['Normal'],
-        fontSize=12,
-        leading=16,
-        alignment=TA_JUSTIFY,
-        spaceBefore=8,
-        spaceAfter=8,
-        fontName='Helvetica',
-        backColor=ARC_LIGHT_GRAY,
-        borderWidth=1,
-        borderColor=ARC_GRAY,
-        borderPadding=12
-    ))
-    
-    # Key findings
-    styles.add(ParagraphStyle(
-        name='KeyFinding',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        leftIndent=20,
-        bulletIndent=10,
-        spaceBefore=4,
-        spaceAfter=4,
-        fontName='Helvetica'
-    ))
-    
-    # Callout boxes
-    styles.add(ParagraphStyle(
-        name='CalloutBox',
-        parent=styles['Normal'],
-        fontSize=12,
-        leading=15,
-        alignment=TA_CENTER,
-        backColor=ARC_RED,
-        textColor=white,
-        borderWidth=2,
-        borderColor=ARC_RED,
-        borderPadding=15,
-        spaceBefore=12,
-        spaceAfter=12,
-        fontName='Helvetica-Bold'
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='MetricBox',
-        parent=styles['Normal'],
-        fontSize=14,
-        leading=18,
-        alignment=TA_CENTER,
-        backColor=ARC_LIGHT_GRAY,
-        textColor=ARC_DARK_GRAY,
-        borderWidth=1,
-        borderColor=ARC_GRAY,
-        borderPadding=10,
-        spaceBefore=8,
-        spaceAfter=8,
-        fontName='Helvetica-Bold'
-    ))
-    
-    return styles
+    """Shared Red Cross stylesheet for this report"""
+    return brand_styles.get_stylesheet('fortune500')
 
 def create_title_page(story, styles):
     """Create professional title page"""
@@ -245,11 +97,11 @@ def create_title_page(story, styles):
     story.append(Spacer(1, 1*inch))
     
     # Key metrics callout
-    metrics_text = """
+    metrics_text = f"""
     <b>KEY PERFORMANCE INDICATORS</b><br/>
-    $1.6M+ Cost Containment Achieved | 28.3% Return on Investment<br/>
-    93% IA Completion Rate | 1-4 Days Faster Response Time<br/>
-    35.9% Increase in Volunteer Engagement | 66.2% Increase in Homes Made Safer
+    {metrics_store.millions('cost_containment.total')}+ Cost Containment Achieved | {metrics_store.percent('roi.overall')} Return on Investment<br/>
+    {metrics_store.percent('ia.completion.cap', 0)} IA Completion Rate | 1-4 Days Faster Response Time<br/>
+    {metrics_store.percent('volunteers.growth')} Increase in Volunteer Engagement | {metrics_store.percent('homes_safer.growth')} Increase in Homes Made Safer
     """
     story.append(Paragraph(metrics_text, styles['CalloutBox']))
     
@@ -309,18 +161,18 @@ def add_visualization(story, styles, viz_path, title, description, width=6*inch,
     
     if os.path.exists(viz_path):
         try:
-            img = Image(viz_path, width=width, height=height)
+            img = Image(pdf_images.optimize_for_pdf(viz_path, width, height), width=width, height=height)
             img.hAlign = 'CENTER'
             story.append(img)
         except Exception as e:
             # Fallback if image doesn't load
-            story.append(Paragraph(f"[Visualization: {title}]", styles['BodyText']))
+            story.append(Paragraph(f"[Visualization: {title}]", styles['CustomBody']))
     else:
-        story.append(Paragraph(f"[Visualization: {title} - File not found: {viz_path}]", styles['BodyText']))
+        story.append(Paragraph(f"[Visualization: {title} - File not found: {viz_path}]", styles['CustomBody']))
     
     if description:
         story.append(Spacer(1, 6))
-        story.append(Paragraph(description, styles['BodyText']))
+        story.append(Paragraph(description, styles['CustomBody']))
     
     story.append(Spacer(1, 12))
 
@@ -336,7 +188,7 @@ def create_executive_summary(story, styles):
     delivery, and scalability potential. Since its inception in 2022, CAP has proven to be a critical 
     force multiplier for American Red Cross operations.
     """
-    story.append(Paragraph(exec_text, styles['BodyText']))
+    story.append(Paragraph(exec_text, styles['CustomBody']))
     
     story.append(Spacer(1, 12))
     
@@ -352,10 +204,13 @@ def create_executive_summary(story, styles):
     story.append(Spacer(1, 12))
     
     metrics = [
-        ("Quality Enhancement", "93% IA completion rate in CAP parishes vs. 67% overall"),
-        ("Cost Containment", "$1.6M+ total savings with 28.3% ROI on investments"),
+        ("Quality Enhancement", f"{metrics_store.percent('ia.completion.cap', 0)} IA completion rate in CAP parishes "
+                                f"vs. {metrics_store.percent('ia.completion.overall', 0)} overall"),
+        ("Cost Containment", f"{metrics_store.millions('cost_containment.total')}+ total savings with "
+                             f"{metrics_store.percent('roi.overall')} ROI on investments"),
         ("Response Speed", "1-4 days faster service delivery in most disaster operations"),
-        ("Community Impact", "35.9% increase in volunteer engagement, 66.2% increase in homes made safer")
+        ("Community Impact", f"{metrics_store.percent('volunteers.growth')} increase in volunteer engagement, "
+                             f"{metrics_store.percent('homes_safer.growth')} increase in homes made safer")
     ]
     
     for metric_title, metric_value in metrics:
@@ -376,7 +231,7 @@ def create_methodology_section(story, styles):
     key informant interviews. This comprehensive methodology ensures maximum clarity and 
     value for Red Cross leadership decision-making.
     """
-    story.append(Paragraph(overview_text, styles['BodyText']))
+    story.append(Paragraph(overview_text, styles['CustomBody']))
     
     story.append(Spacer(1, 12))
     
@@ -406,14 +261,16 @@ def create_dro_findings_section(story, styles):
     ensuring culturally appropriate aid, and reaching "invisible populations" often overlooked by 
     traditional response channels.
     """
-    story.append(Paragraph(quality_text, styles['BodyText']))
+    story.append(Paragraph(quality_text, styles['CustomBody']))
     
     # IA Uptake visualization
     add_visualization(
         story, styles,
         "/Users/jefffranzen/cap-data/graphics/ia_uptake.png",
         "Immediate Assistance Uptake Rates",
-        "CAP jurisdictions consistently demonstrate higher IA completion rates, with Terrebonne Parish achieving 93% completion during Hurricane Francine compared to 67% overall."
+        f"CAP jurisdictions consistently demonstrate higher IA completion rates, with Terrebonne Parish achieving "
+        f"{metrics_store.percent('ia.completion.cap', 0)} completion during Hurricane Francine compared to "
+        f"{metrics_store.percent('ia.completion.overall', 0)} overall."
     )
     
     # Speed of Response
@@ -424,7 +281,7 @@ def create_dro_findings_section(story, styles):
     Partners are frequently "first on the ground—feeding within hours," leveraging pre-existing 
     relationships and local readiness to respond faster than centralized operations.
     """
-    story.append(Paragraph(speed_text, styles['BodyText']))
+    story.append(Paragraph(speed_text, styles['CustomBody']))
     
     # Speed advantage visualization
     add_visualization(
@@ -455,14 +312,14 @@ def create_financial_analysis_section(story, styles):
     Partner contributions substantially reduce Red Cross operational costs by providing in-kind donations 
     of facilities, volunteers, meals, and supplies.
     """
-    story.append(Paragraph(roi_text, styles['BodyText']))
+    story.append(Paragraph(roi_text, styles['CustomBody']))
     
     # Cost containment visualization
     add_visualization(
         story, styles,
         "/Users/jefffranzen/cap-data/graphics/cost_containment.png",
         "Cost Containment Analysis",
-        "Total documented cost containment of $1.6M+ across multiple DROs, demonstrating clear financial value to Red Cross operations."
+        f"Total documented cost containment of {metrics_store.millions('cost_containment.total')}+ across multiple DROs, demonstrating clear financial value to Red Cross operations."
     )
     
     # ROI by partner type
@@ -478,14 +335,15 @@ def create_financial_analysis_section(story, styles):
         story, styles,
         "/Users/jefffranzen/cap-data/graphics/roi_disaster_type.png",
         "ROI Analysis by Disaster Type",
-        "Hurricane responses demonstrate the highest ROI at 37.3%, followed by flooding events at 25.5%."
+        f"Hurricane responses demonstrate the highest ROI at {metrics_store.percent('roi.disaster.hurricane')}, "
+        f"followed by flooding events at {metrics_store.percent('roi.disaster.flooding')}."
     )
     
     # Financial highlights callout
-    financial_highlights = """
+    financial_highlights = f"""
     <b>FINANCIAL PERFORMANCE HIGHLIGHTS</b><br/>
     • Hurricane Francine: $250,000 in tracked cost containment<br/>
-    • Overall Program: 28.3% Return on Investment<br/>
+    • Overall Program: {metrics_store.percent('roi.overall')} Return on Investment<br/>
     • Kentucky Storms: $670,000 in feeding cost offsets<br/>
     • Consistent cost reduction across all disaster types
     """
@@ -503,14 +361,15 @@ def create_halo_effect_section(story, styles):
     contributing to broader community resilience and enhancing American Red Cross mission 
     effectiveness during non-disaster periods.
     """
-    story.append(Paragraph(halo_text, styles['BodyText']))
+    story.append(Paragraph(halo_text, styles['CustomBody']))
     
     # Volunteer trends
     add_visualization(
         story, styles,
         "/Users/jefffranzen/cap-data/graphics/volunteer_trends.png",
         "Volunteer Engagement Growth",
-        "CAP jurisdictions show 35.92% increase in volunteer engagement compared to 16.05% national average, demonstrating enhanced community mobilization."
+        f"CAP jurisdictions show {metrics_store.percent('volunteers.growth', 2)} increase in volunteer engagement compared to "
+        f"{metrics_store.percent('volunteers.growth.national', 2)} national average, demonstrating enhanced community mobilization."
     )
     
     # Homes made safer
@@ -518,7 +377,8 @@ def create_halo_effect_section(story, styles):
         story, styles,
         "/Users/jefffranzen/cap-data/graphics/homes_safer.png",
         "Homes Made Safer Initiative Impact",
-        "CAP jurisdictions achieved 66.24% increase in homes made safer compared to 14.02% national increase, showing enhanced preparedness outcomes."
+        f"CAP jurisdictions achieved {metrics_store.percent('homes_safer.growth', 2)} increase in homes made safer compared to "
+        f"{metrics_store.percent('homes_safer.growth.national', 2)} national increase, showing enhanced preparedness outcomes."
     )
     
     # Stakeholder sentiment
@@ -540,7 +400,7 @@ def create_challenges_section(story, styles):
     While CAP demonstrates significant value, the evaluation transparently identifies areas 
     for improvement and potential risks that must be addressed for future success.
     """
-    story.append(Paragraph(challenges_text, styles['BodyText']))
+    story.append(Paragraph(challenges_text, styles['CustomBody']))
     
     challenges = [
         ("Integration Gaps", "CAP often perceived as separate from Disaster Services, leading to confusion and occasional resentment among Red Cross staff"),
@@ -575,7 +435,7 @@ def create_recommendations_section(story, styles):
     provide actionable pathways for integrating CAP's successful principles into broader 
     Red Cross operations while addressing identified challenges.
     """
-    story.append(Paragraph(rec_intro, styles['BodyText']))
+    story.append(Paragraph(rec_intro, styles['CustomBody']))
     
     recommendations = [
         ("Invest in Blue-Sky Relationships", "Prioritize ongoing relationship-building with hyper-local partners before disasters strike to build trust and accelerate response"),
@@ -606,7 +466,7 @@ def create_implementation_section(story, styles):
     strategic planning and phased implementation to preserve program benefits while 
     achieving sustainable scalability.
     """
-    story.append(Paragraph(implementation_text, styles['BodyText']))
+    story.append(Paragraph(implementation_text, styles['CustomBody']))
     
     # Implementation phases
     phases = [
@@ -644,19 +504,19 @@ def create_conclusion_section(story, styles):
     modest pre-event investments, and embedded liaison integration, CAP has demonstrably 
     achieved its core objectives.
     """
-    story.append(Paragraph(conclusion_text, styles['BodyText']))
+    story.append(Paragraph(conclusion_text, styles['CustomBody']))
     
     story.append(Spacer(1, 12))
     
-    key_achievements = """
+    key_achievements = f"""
     <b>Key Achievements:</b><br/>
     • Significantly accelerated initial aid delivery with partners often first on the ground<br/>
     • Improved service quality by expanding reach to "invisible populations"<br/>
-    • Generated meaningful cost containment with 28.3% ROI and $1.6M+ savings<br/>
+    • Generated meaningful cost containment with {metrics_store.percent('roi.overall')} ROI and {metrics_store.millions('cost_containment.total')}+ savings<br/>
     • Enhanced Red Cross reputation and steady-state program outcomes<br/>
     • Provided critical buffer against brand risk through localized service delivery
     """
-    story.append(Paragraph(key_achievements, styles['BodyText']))
+    story.append(Paragraph(key_achievements, styles['CustomBody']))
     
     story.append(Spacer(1, 12))
     
@@ -686,7 +546,7 @@ def create_appendices_section(story, styles):
     
     for app_letter, app_title, app_desc in appendices:
         story.append(Paragraph(f"<b>{app_letter}: {app_title}</b>", styles['SubsectionHeader']))
-        story.append(Paragraph(app_desc, styles['BodyText']))
+        story.append(Paragraph(app_desc, styles['CustomBody']))
         story.append(Spacer(1, 12))
 
 def create_pdf_report():
@@ -754,6 +614,7 @@ def create_pdf_report():
     print(f"Fortune 500 quality PDF report created successfully!")
     print(f"Location: {output_path}")
     print(f"File size: {os.path.getsize(output_path) / 1024 / 1024:.1f} MB")
+    pdf_images.print_savings_report(output_path)
     
     return output_path
 
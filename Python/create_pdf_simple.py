@@ -6,120 +6,34 @@ Simplified version without image dependencies
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import Paragraph, Spacer, PageBreak
 from reportlab.platypus import Table, TableStyle, KeepTogether
-from reportlab.platypus.flowables import Flowable
-from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.pdfgen import canvas
+from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from datetime import datetime
 import re
 
-class CalloutBox(Flowable):
+import brand_styles
+import callout_box
+import incremental_pdf
+import metrics_store
+import page_decoration
+import report_parser
+
+class CalloutBox(callout_box.CalloutBox):
     """Custom flowable for professional call-out boxes"""
-    def __init__(self, title, content, box_type='metric'):
-        Flowable.__init__(self)
-        self.title = title
-        self.content = content
-        self.box_type = box_type
-        
-        # Define colors for different box types
-        self.colors = {
-            'metric': colors.HexColor('#CC0000'),  # Red Cross red
-            'quote': colors.HexColor('#6B7C93'),   # Gray
-            'success': colors.HexColor('#4CAF50'),  # Green
-            'priority': colors.HexColor('#FF6B35'), # Orange
-            'speed': colors.HexColor('#2196F3'),    # Blue
-        }
-        
-        # Calculate dimensions
-        self.width = 5.5 * inch
-        self.height = self._calculate_height()
-    
-    def _calculate_height(self):
-        # Better height calculation
-        char_count = len(self.content)
-        if char_count < 50:
-            return 1.0 * inch
-        elif char_count < 100:
-            return 1.3 * inch
-        elif char_count < 150:
-            return 1.6 * inch
-        else:
-            return 2.0 * inch
-    
-    def draw(self):
-        # Draw the box with rounded corners effect
-        color = self.colors.get(self.box_type, colors.black)
-        self.canv.setStrokeColor(color)
-        self.canv.setLineWidth(2)
-        
-        # Main box
-        self.canv.rect(0, 0, self.width, self.height)
-        
-        # Title bar
-        self.canv.setFillColor(color)
-        self.canv.rect(0, self.height - 0.35*inch, self.width, 0.35*inch, fill=1)
-        
-        # Title text
-        self.canv.setFillColor(colors.white)
-        self.canv.setFont("Helvetica-Bold", 11)
-        self.canv.drawCentredString(self.width/2, self.height - 0.23*inch, self.title)
-        
-        # Content - better text wrapping
-        self.canv.setFillColor(colors.black)
-        self.canv.setFont("Helvetica", 9)
-        
-        # Split content into lines
-        max_chars_per_line = 65
-        lines = []
-        words = self.content.split()
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= max_chars_per_line:
-                current_line = current_line + " " + word if current_line else word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
-        # Draw lines
-        y_position = self.height - 0.55*inch
-        for line in lines:
-            if y_position > 0.2*inch:
-                self.canv.drawCentredString(self.width/2, y_position, line.strip())
-                y_position -= 0.18*inch
+    box_width = 5.5 * inch
+    title_size = 11
+    body_size = 9
 
-class NumberedCanvas(canvas.Canvas):
+class NumberedCanvas(page_decoration.NumberedCanvas):
     """Custom canvas for page numbers and headers"""
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-    
-    def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
-    
-    def save(self):
-        """Add page numbers and headers"""
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self.draw_page_number(num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-    
-    def draw_page_number(self, page_count):
+    def draw_page_number(self, page_num, page_count):
         """Draw page numbers and header"""
         self.saveState()
         
         # Skip header/footer on first page
-        if self._pageNumber > 1:
+        if page_num > 1:
             # Header
             self.setFont("Helvetica", 8)
             self.setFillColor(colors.HexColor('#6B7C93'))
@@ -134,11 +48,11 @@ class NumberedCanvas(canvas.Canvas):
             self.line(1*inch, letter[1] - 0.55*inch, letter[0] - 1*inch, letter[1] - 0.55*inch)
         
         # Page number (all pages except first)
-        if self._pageNumber > 1:
+        if page_num > 1:
             self.setFont("Helvetica", 9)
             self.setFillColor(colors.HexColor('#6B7C93'))
             self.drawCentredString(letter[0]/2, 0.5*inch,
-                                  f"Page {self._pageNumber} of {page_count}")
+                                  f"Page {page_num} of {page_count}")
         
         self.restoreState()
 
@@ -168,12 +82,12 @@ def create_data_table(title, data_rows):
     
     return table
 
-def create_professional_pdf():
+def create_professional_pdf(force_full=False):
     """Main function to create the PDF report"""
     
     # Set up the document
     pdf_file = '/Users/jefffranzen/cap-data/CAP_Evaluation_Report_Professional.pdf'
-    doc = SimpleDocTemplate(
+    doc = incremental_pdf.TrackingDocTemplate(
         pdf_file,
         pagesize=letter,
         rightMargin=0.75*inch,
@@ -188,65 +102,7 @@ def create_professional_pdf():
     elements = []
     
     # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    styles.add(ParagraphStyle(
-        name='CustomTitle',
-        parent=styles['Title'],
-        fontSize=26,
-        textColor=colors.HexColor('#CC0000'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        leading=32
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#6B7C93'),
-        alignment=TA_CENTER,
-        spaceAfter=12
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#CC0000'),
-        spaceAfter=12,
-        spaceBefore=24,
-        keepWithNext=True,
-        leftIndent=0
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SubsectionHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#6B7C93'),
-        spaceAfter=6,
-        spaceBefore=12,
-        keepWithNext=True
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='CustomBody',
-        parent=styles['BodyText'],
-        fontSize=10,
-        alignment=TA_JUSTIFY,
-        spaceAfter=10,
-        leading=13
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='BulletText',
-        parent=styles['CustomBody'],
-        leftIndent=20,
-        bulletIndent=10,
-        spaceAfter=6
-    ))
+    styles = brand_styles.get_stylesheet('simple')
     
     # Title Page
     elements.append(Spacer(1, 1.5*inch))
@@ -292,16 +148,13 @@ def create_professional_pdf():
     ))
     elements.append(Spacer(1, 0.2*inch))
     
-    # Read the report content
-    with open('/Users/jefffranzen/cap-data/Updated_CAP_Report_September_30_2025_COMPLETE.txt', 'r') as f:
-        full_content = f.read()
-    
-    # Extract executive summary content
-    exec_summary_start = full_content.find("The Community Adaptation Program (CAP)")
-    exec_summary_end = full_content.find("Key Findings:")
+    # Parse the report content into a document tree
+    report = report_parser.parse_report('/Users/jefffranzen/cap-data/Updated_CAP_Report_September_30_2025_COMPLETE.txt')
     
-    if exec_summary_start > 0 and exec_summary_end > 0:
-        exec_text = full_content[exec_summary_start:exec_summary_end].strip()
+    # Executive summary content: the paragraphs ahead of Key Findings
+    exec_summary = report.section('Executive Summary')
+    if exec_summary and exec_summary.intro():
+        exec_text = ' '.join(node.text for node in exec_summary.intro())
         elements.append(Paragraph(exec_text, styles['CustomBody']))
     
     elements.append(Spacer(1, 0.2*inch))
@@ -309,7 +162,8 @@ def create_professional_pdf():
     # ROI Callout
     elements.append(CalloutBox(
         "💰 RETURN ON INVESTMENT",
-        "$1.6M IN COST CONTAINMENT - 28.3% ROI on $5.67M partner investment",
+        f"{metrics_store.millions('cost_containment.total')} IN COST CONTAINMENT - "
+        f"{metrics_store.percent('roi.overall')} ROI on {metrics_store.millions('investment.partner', 2)} partner investment",
         'success'
     ))
     elements.append(Spacer(1, 0.2*inch))
@@ -348,7 +202,8 @@ def create_professional_pdf():
         "• <b>Adapted Meals:</b> Culturally sensitive foods provided in Latino and farming communities",
         "• <b>Bilingual Support:</b> Crucial translation services where Red Cross staff lacked language capacity",
         "• <b>Trusted Messengers:</b> Local leaders like pastors used to overcome literacy and connectivity challenges",
-        "• <b>93% IA Completion Rate</b> in Terrebonne Parish (Hurricane Francine) vs. 67% overall rate",
+        f"• <b>{metrics_store.percent('ia.completion.cap', 0)} IA Completion Rate</b> in Terrebonne Parish "
+        f"(Hurricane Francine) vs. {metrics_store.percent('ia.completion.overall', 0)} overall rate",
         "• <b>58.3% IA Pick-up Rate</b> in South Texas Floods vs. 51% nationwide average"
     ]
     
@@ -361,10 +216,10 @@ def create_professional_pdf():
     roi_table = create_data_table(
         "Return on Investment by Partner Type",
         [
-            ["Resilience Hubs", "33.48%"],
-            ["Community Gateways", "30.11%"],
-            ["Hunger Partners", "26.33%"],
-            ["Overall Program ROI", "28.30%"]
+            ["Resilience Hubs", metrics_store.percent('roi.partner.resilience_hub', 2)],
+            ["Community Gateways", metrics_store.percent('roi.partner.community_gateway', 2)],
+            ["Hunger Partners", metrics_store.percent('roi.partner.hunger', 2)],
+            ["Overall Program ROI", metrics_store.percent('roi.overall', 2)]
         ]
     )
     elements.append(roi_table)
@@ -382,9 +237,10 @@ def create_professional_pdf():
     ))
     elements.append(Spacer(1, 0.2*inch))
     
-    cost_text = """
+    cost_text = f"""
     The Community Adaptation Program has demonstrably reduced Red Cross operational costs through 
-    partner contributions of in-kind donations and services. Total documented savings exceed $1.6 million.
+    partner contributions of in-kind donations and services. Total documented savings exceed 
+    ${metrics_store.value('cost_containment.total') / 1e6:.1f} million.
     """
     elements.append(Paragraph(cost_text, styles['CustomBody']))
     
@@ -392,11 +248,11 @@ def create_professional_pdf():
     cost_table = create_data_table(
         "Cost Containment Breakdown (FY23-FY25)",
         [
-            ["Hurricane Francine", "$243,237"],
+            ["Hurricane Francine", metrics_store.dollars('cost_containment.francine')],
             ["Tennessee Tornados", "$80,000-100,000"],
             ["Kentucky Floods", "$125,000+"],
-            ["Other DROs", "$1,157,768"],
-            ["Total Documented Savings", "$1,606,305"]
+            ["Other DROs", metrics_store.dollars('cost_containment.other_dros')],
+            ["Total Documented Savings", metrics_store.dollars('cost_containment.total')]
         ]
     )
     elements.append(cost_table)
@@ -441,7 +297,8 @@ def create_professional_pdf():
     
     elements.append(CalloutBox(
         "📈 VOLUNTEER SURGE",
-        "+35.92% INCREASE in volunteer engagement in CAP jurisdictions vs. +16.05% national average",
+        f"+{metrics_store.percent('volunteers.growth', 2)} INCREASE in volunteer engagement in CAP jurisdictions "
+        f"vs. +{metrics_store.percent('volunteers.growth.national', 2)} national average",
         'success'
     ))
     elements.append(Spacer(1, 0.2*inch))
@@ -453,8 +310,10 @@ def create_professional_pdf():
     elements.append(Paragraph(halo_text, styles['CustomBody']))
     
     halo_points = [
-        "• <b>Volunteer Engagement:</b> +35.92% increase in CAP jurisdictions vs. +16.05% nationally",
-        "• <b>Homes Made Safer:</b> +66.24% increase in CAP areas vs. +14.02% national average",
+        f"• <b>Volunteer Engagement:</b> +{metrics_store.percent('volunteers.growth', 2)} increase in CAP jurisdictions "
+        f"vs. +{metrics_store.percent('volunteers.growth.national', 2)} nationally",
+        f"• <b>Homes Made Safer:</b> +{metrics_store.percent('homes_safer.growth', 2)} increase in CAP areas "
+        f"vs. +{metrics_store.percent('homes_safer.growth.national', 2)} national average",
         "• <b>Youth Preparedness:</b> +101.23% increase vs. +39.13% national average",
         "• <b>Brand Protection:</b> 12 service delivery failures prevented or resolved in FY25",
         "• <b>Partner Satisfaction:</b> 97% report improved disaster response capability"
@@ -524,14 +383,20 @@ def create_professional_pdf():
     ))
     
     # Build the PDF
-    doc.build(elements, canvasmaker=NumberedCanvas)
+    # Reuse pages ahead of the first changed flowable from the previous build
+    mode, page_count = incremental_pdf.build(doc, elements, NumberedCanvas,
+                                             salt=incremental_pdf.source_salt(__file__),
+                                             force_full=force_full)
+    print(f"📄 {page_count} pages ({mode} build)")
     
     return pdf_file
 
 # Create the PDF
 if __name__ == "__main__":
+    import sys
     try:
-        pdf_path = create_professional_pdf()
+        # --full skips page reuse and lays out the whole report
+        pdf_path = create_professional_pdf(force_full='--full' in sys.argv[1:])
         print(f"\n✅ Professional PDF successfully created!")
         print(f"📄 Location: {pdf_path}")
         print("\n📊 The PDF includes:")
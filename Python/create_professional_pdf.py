@@ -6,111 +6,38 @@ with integrated graphics and call-out boxes
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.platypus import Table, TableStyle, KeepTogether, Image
-from reportlab.platypus.flowables import Flowable
-from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.pdfgen import canvas
+from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.lib.utils import ImageReader
 from reportlab.platypus.frames import Frame
 from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.platypus.tableofcontents import TableOfContents
-import plotly.graph_objects as go
-import plotly.io as pio
 import os
 from datetime import datetime
 import re
 
-class CalloutBox(Flowable):
+import brand_styles
+import callout_box
+import figure_assets
+import metrics_store
+import page_decoration
+import pdf_images
+import report_parser
+
+class CalloutBox(callout_box.CalloutBox):
     """Custom flowable for professional call-out boxes"""
-    def __init__(self, title, content, box_type='metric'):
-        Flowable.__init__(self)
-        self.title = title
-        self.content = content
-        self.box_type = box_type
-        
-        # Define colors for different box types
-        self.colors = {
-            'metric': colors.HexColor('#CC0000'),  # Red Cross red
-            'quote': colors.HexColor('#6B7C93'),   # Gray
-            'success': colors.HexColor('#4CAF50'),  # Green
-            'priority': colors.HexColor('#FF6B35'), # Orange
-        }
-        
-        # Calculate dimensions
-        self.width = 5 * inch
-        self.height = self._calculate_height()
-    
-    def _calculate_height(self):
-        # Estimate height based on content length
-        lines = len(self.content) / 50  # Rough estimate
-        return max(1.5 * inch, (0.5 + lines * 0.2) * inch)
-    
-    def draw(self):
-        # Draw the box
-        self.canv.setStrokeColor(self.colors.get(self.box_type, colors.black))
-        self.canv.setLineWidth(2)
-        self.canv.rect(0, 0, self.width, self.height)
-        
-        # Draw the title background
-        self.canv.setFillColor(self.colors.get(self.box_type, colors.black))
-        self.canv.rect(0, self.height - 0.35*inch, self.width, 0.35*inch, fill=1)
-        
-        # Draw the title text
-        self.canv.setFillColor(colors.white)
-        self.canv.setFont("Helvetica-Bold", 12)
-        self.canv.drawCentredString(self.width/2, self.height - 0.25*inch, self.title)
-        
-        # Draw the content
-        self.canv.setFillColor(colors.black)
-        self.canv.setFont("Helvetica", 10)
-        
-        # Wrap text manually
-        y_position = self.height - 0.6*inch
-        words = self.content.split()
-        line = ""
-        line_width = 0
-        max_width = self.width - 0.4*inch
-        
-        for word in words:
-            test_line = line + " " + word if line else word
-            test_width = self.canv.stringWidth(test_line, "Helvetica", 10)
-            
-            if test_width < max_width:
-                line = test_line
-                line_width = test_width
-            else:
-                if line:
-                    self.canv.drawCentredString(self.width/2, y_position, line)
-                    y_position -= 0.2*inch
-                line = word
-                line_width = self.canv.stringWidth(word, "Helvetica", 10)
-        
-        if line:
-            self.canv.drawCentredString(self.width/2, y_position, line)
+    box_width = 5 * inch
+    title_size = 12
+    body_size = 10
+    title_baseline = 0.25 * inch
+    first_baseline = 0.6 * inch
+    line_height = 0.2 * inch
 
-class NumberedCanvas(canvas.Canvas):
+class NumberedCanvas(page_decoration.NumberedCanvas):
     """Custom canvas for page numbers and headers"""
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-    
-    def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
-    
-    def save(self):
-        """Add page numbers and headers"""
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self.draw_page_number(num_pages)
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-    
-    def draw_page_number(self, page_count):
+    def draw_page_number(self, page_num, page_count):
         """Draw page numbers and header"""
         self.saveState()
         
@@ -124,7 +51,7 @@ class NumberedCanvas(canvas.Canvas):
         
         # Page number
         self.drawCentredString(letter[0]/2, 0.5*inch,
-                              f"Page {self._pageNumber} of {page_count}")
+                              f"Page {page_num} of {page_count}")
         
         # Red line under header
         self.setStrokeColor(colors.HexColor('#CC0000'))
@@ -133,12 +60,24 @@ class NumberedCanvas(canvas.Canvas):
         
         self.restoreState()
 
+def add_figure(elements, figures, name):
+    """Embed a prebuilt figure asset from the manifest"""
+    entry = figures.get(name)
+    if entry is None:
+        print(f"⚠️  Missing figure asset: {name} - run: python figure_assets.py")
+        return
+    width, height = 5*inch, 3.33*inch
+    elements.append(Image(pdf_images.optimize_for_pdf(entry['path'], width, height), width=width, height=height))
+
 def create_professional_pdf():
     """Main function to create the PDF report"""
     
     # Create output directory
     os.makedirs('/Users/jefffranzen/cap-data/output', exist_ok=True)
     
+    # Figures are rendered ahead of time by figure_assets.py; only the manifest is read here
+    figures = figure_assets.load_manifest()
+    
     # Set up the document
     pdf_file = '/Users/jefffranzen/cap-data/output/CAP_Evaluation_Report_Professional.pdf'
     doc = SimpleDocTemplate(
@@ -156,53 +95,7 @@ def create_professional_pdf():
     elements = []
     
     # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    styles.add(ParagraphStyle(
-        name='CustomTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        textColor=colors.HexColor('#CC0000'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#CC0000'),
-        spaceAfter=12,
-        spaceBefore=24,
-        keepWithNext=True
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SubsectionHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#6B7C93'),
-        spaceAfter=6,
-        spaceBefore=12,
-        keepWithNext=True
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        alignment=TA_JUSTIFY,
-        spaceAfter=12,
-        leading=14
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='BulletText',
-        parent=styles['CustomBody'],
-        leftIndent=20,
-        bulletIndent=10
-    ))
+    styles = brand_styles.get_stylesheet('professional')
     
     # Title Page
     elements.append(Spacer(1, 2*inch))
@@ -236,29 +129,21 @@ def create_professional_pdf():
     ))
     elements.append(Spacer(1, 0.25*inch))
     
-    # Read the report content
-    with open('/Users/jefffranzen/cap-data/Updated_CAP_Report_September_30_2025_COMPLETE.txt', 'r') as f:
-        content = f.read()
-    
-    # Parse sections
-    sections = content.split('\n\n')
+    # Parse the report content once into a document tree
+    report = report_parser.parse_report('/Users/jefffranzen/cap-data/Updated_CAP_Report_September_30_2025_COMPLETE.txt')
     
     # Process executive summary
-    exec_summary_found = False
-    for section in sections:
-        if 'Executive Summary' in section and not exec_summary_found:
-            exec_summary_found = True
-            # Skip the title line
-            lines = section.split('\n')[1:]
-            for line in lines[:10]:  # First part of exec summary
-                if line.strip():
-                    elements.append(Paragraph(line, styles['CustomBody']))
+    exec_summary = report.section('Executive Summary')
+    if exec_summary:
+        for node in exec_summary.intro()[:10]:  # First part of exec summary
+            elements.append(Paragraph(node.text, styles['CustomBody']))
     
     # Add ROI callout
     elements.append(Spacer(1, 0.25*inch))
     elements.append(CalloutBox(
         "RETURN ON INVESTMENT",
-        "$1.6M IN COST CONTAINMENT - 28.3% ROI on $5.67M partner investment",
+        f"{metrics_store.millions('cost_containment.total')} IN COST CONTAINMENT - "
+        f"{metrics_store.percent('roi.overall')} ROI on {metrics_store.millions('investment.partner', 2)} partner investment",
         'success'
     ))
     elements.append(Spacer(1, 0.25*inch))
@@ -266,15 +151,7 @@ def create_professional_pdf():
     # Convert and add first graphic
     elements.append(Paragraph("Figure 1: Return on Investment Analysis", styles['Normal']))
     
-    # Create ROI comparison chart as PNG
-    import create_cap_graphics
-    fig = create_cap_graphics.create_roi_comparison()
-    img_path = '/Users/jefffranzen/cap-data/output/roi_comparison.png'
-    pio.write_image(fig, img_path, width=600, height=400, scale=2)
-    
-    if os.path.exists(img_path):
-        img = Image(img_path, width=5*inch, height=3.33*inch)
-        elements.append(img)
+    add_figure(elements, figures, 'roi_comparison')
     
     elements.append(PageBreak())
     
@@ -291,25 +168,16 @@ def create_professional_pdf():
     elements.append(Spacer(1, 0.25*inch))
     
     # Find and add quality section content
-    for section in sections:
-        if 'Quality of Service:' in section:
-            lines = section.split('\n')
-            for line in lines[1:8]:  # Get key points
-                if line.strip() and '•' in line:
-                    elements.append(Paragraph(line, styles['BulletText']))
-                elif line.strip():
-                    elements.append(Paragraph(line, styles['CustomBody']))
+    for node in report.labeled_block('Quality of Service')[:8]:  # Get key points
+        if node.kind in ('bullet', 'sub_bullet'):
+            elements.append(Paragraph(node.text, styles['BulletText']))
+        elif node.kind == 'paragraph':
+            elements.append(Paragraph(node.text, styles['CustomBody']))
     
     # Add Speed Comparison graphic
     elements.append(Spacer(1, 0.25*inch))
     elements.append(Paragraph("Figure 2: Speed of Service Delivery", styles['Normal']))
-    fig2 = create_cap_graphics.create_speed_comparison()
-    img_path2 = '/Users/jefffranzen/cap-data/output/speed_comparison.png'
-    pio.write_image(fig2, img_path2, width=600, height=400, scale=2)
-    
-    if os.path.exists(img_path2):
-        img2 = Image(img_path2, width=5*inch, height=3.33*inch)
-        elements.append(img2)
+    add_figure(elements, figures, 'speed_comparison')
     
     elements.append(PageBreak())
     
@@ -324,13 +192,7 @@ def create_professional_pdf():
     
     # Add cost breakdown graphic
     elements.append(Paragraph("Figure 3: Cost Containment Breakdown", styles['Normal']))
-    fig3 = create_cap_graphics.create_cost_breakdown()
-    img_path3 = '/Users/jefffranzen/cap-data/output/cost_breakdown.png'
-    pio.write_image(fig3, img_path3, width=600, height=400, scale=2)
-    
-    if os.path.exists(img_path3):
-        img3 = Image(img_path3, width=5*inch, height=3.33*inch)
-        elements.append(img3)
+    add_figure(elements, figures, 'cost_breakdown')
     
     elements.append(PageBreak())
     
@@ -346,13 +208,15 @@ def create_professional_pdf():
     doc.build(elements, canvasmaker=NumberedCanvas)
     
     print(f"Professional PDF created: {pdf_file}")
+    pdf_images.print_savings_report(pdf_file)
     return pdf_file
 
 # Create the PDF
 if __name__ == "__main__":
-    # First ensure we have the graphics module
+    # Charts come from the asset stage; --build-assets refreshes them first
     import sys
-    sys.path.append('/Users/jefffranzen/cap-data')
+    if '--build-assets' in sys.argv[1:]:
+        figure_assets.build_assets()
     
     pdf_path = create_professional_pdf()
     print(f"\nPDF successfully created at: {pdf_path}")
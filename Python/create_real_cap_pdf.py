@@ -5,54 +5,42 @@ With selected graphics integrated at appropriate points
 """
 
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus import Paragraph, Spacer, PageBreak, Image
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER, TA_LEFT
-from reportlab.pdfgen import canvas
+from reportlab.lib.enums import TA_LEFT
 import os
 import base64
 from io import BytesIO
 
+import brand_styles
+import incremental_pdf
+import metrics_store
+import page_decoration
+import report_parser
+
 # American Red Cross colors
 ARC_RED = colors.HexColor('#CC0000')
 ARC_GRAY = colors.HexColor('#6B7C93')
 
-class NumberedCanvas(canvas.Canvas):
-    def __init__(self, *args, **kwargs):
-        canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
-        self._pageNumber = 0
-
-    def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
+class NumberedCanvas(page_decoration.NumberedCanvas):
+    # Only the page number is printed, so partial rebuilds may change the page count
+    shows_page_count = False
 
-    def save(self):
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self._pageNumber += 1
-            self.draw_page_number()
-            canvas.Canvas.showPage(self)
-        canvas.Canvas.save(self)
-
-    def draw_page_number(self):
-        if self._pageNumber > 1:  # Skip page number on first page
+    def draw_page_number(self, page_num, page_count):
+        if page_num > 1:  # Skip page number on first page
             self.setFont("Times-Roman", 10)
             self.setFillColor(colors.black)
-            self.drawRightString(letter[0] - 0.75*inch, 0.5*inch, str(self._pageNumber))
+            self.drawRightString(letter[0] - 0.75*inch, 0.5*inch, str(page_num))
 
-def create_cap_report_pdf():
-    # Read the final report content
-    with open('/Users/jefffranzen/cap-data/FINAL_CAP_Report_With_Updates.txt', 'r') as f:
-        content = f.read()
+def create_cap_report_pdf(force_full=False):
+    # Parse the final report content into a document tree
+    report = report_parser.parse_report('/Users/jefffranzen/cap-data/FINAL_CAP_Report_With_Updates.txt')
     
     # Create the PDF
     pdf_file = '/Users/jefffranzen/cap-data/CAP_Final_Report_September_2025.pdf'
-    doc = SimpleDocTemplate(
+    doc = incremental_pdf.TrackingDocTemplate(
         pdf_file,
         pagesize=letter,
         rightMargin=1*inch,
@@ -61,62 +49,8 @@ def create_cap_report_pdf():
         bottomMargin=1*inch
     )
     
-    # Create styles matching the Friday report format
-    styles = getSampleStyleSheet()
-    
-    # Title style
-    styles.add(ParagraphStyle(
-        name='ReportTitle',
-        parent=styles['Title'],
-        fontSize=16,
-        textColor=colors.black,
-        alignment=TA_CENTER,
-        spaceAfter=12,
-        fontName='Times-Bold'
-    ))
-    
-    # Section headers - Roman numerals
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading1'],
-        fontSize=14,
-        textColor=colors.black,
-        spaceAfter=12,
-        spaceBefore=18,
-        fontName='Times-Bold',
-        leftIndent=0
-    ))
-    
-    # Subsection headers - Letters (A, B, C)
-    styles.add(ParagraphStyle(
-        name='SubsectionHeader',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.black,
-        spaceAfter=6,
-        spaceBefore=12,
-        fontName='Times-Bold'
-    ))
-    
-    # Body text - justified like Friday report
-    styles.add(ParagraphStyle(
-        name='BodyJustified',
-        parent=styles['BodyText'],
-        fontSize=11,
-        alignment=TA_JUSTIFY,
-        spaceAfter=12,
-        fontName='Times-Roman',
-        leading=14
-    ))
-    
-    # Bullet style
-    styles.add(ParagraphStyle(
-        name='BulletStyle',
-        parent=styles['BodyJustified'],
-        leftIndent=36,
-        bulletIndent=20,
-        spaceAfter=6
-    ))
+    # Styles matching the Friday report format
+    styles = brand_styles.get_stylesheet('real_cap')
     
     # Build the document elements
     elements = []
@@ -132,26 +66,23 @@ def create_cap_report_pdf():
     elements.append(Spacer(1, 0.5*inch))
     
     # Process content sections
-    lines = content.split('\n')
     in_bullet = False
+    elements.append(Paragraph(report.title, styles['CustomBody']))
     
-    for line in lines:
-        line = line.strip()
-        if not line:
+    for node in report.walk():
+        kind = node.kind
+        if kind == 'blank':
             if not in_bullet:
                 elements.append(Spacer(1, 0.1*inch))
             in_bullet = False
-            continue
         
         # Section headers (Roman numerals)
-        if line.startswith('I. ') or line.startswith('II. ') or line.startswith('III. ') or \
-           line.startswith('IV. ') or line.startswith('V. ') or line.startswith('VI. ') or \
-           line.startswith('VII. ') or line.startswith('VIII. ') or line.startswith('IX. '):
-            elements.append(Paragraph(line, styles['SectionHeader']))
+        elif kind == 'section':
+            elements.append(Paragraph(node.heading, styles['SectionHeader']))
             in_bullet = False
             
             # Add relevant graphics after certain sections
-            if 'Executive Summary' in line:
+            if 'Executive Summary' in node.text:
                 # Add ROI comparison chart after executive summary
                 if os.path.exists('/Users/jefffranzen/cap-data/visualizations/roi_by_disaster.html'):
                     elements.append(Spacer(1, 0.2*inch))
@@ -164,36 +95,34 @@ def create_cap_report_pdf():
                     elements.append(Spacer(1, 0.2*inch))
             
         # Subsection headers (Letters)
-        elif line.startswith('A. ') or line.startswith('B. ') or line.startswith('C. ') or \
-             line.startswith('D. ') or line.startswith('E. '):
-            elements.append(Paragraph(line, styles['SubsectionHeader']))
+        elif kind == 'subsection':
+            elements.append(Paragraph(node.heading, styles['SubsectionHeader']))
             in_bullet = False
             
         # Key Findings header
-        elif line == 'Key Findings:':
-            elements.append(Paragraph("<b>" + line + "</b>", styles['BodyJustified']))
+        elif kind == 'key_findings':
+            elements.append(Paragraph("<b>" + node.text + "</b>", styles['CustomBody']))
             in_bullet = False
             
         # Bullet points
-        elif line.startswith('• '):
-            elements.append(Paragraph(line, styles['BulletStyle']))
+        elif kind == 'bullet':
+            elements.append(Paragraph(node.text, styles['BulletText']))
             in_bullet = True
             
         # Sub-bullets
-        elif line.startswith('o '):
-            elements.append(Paragraph('    ' + line, styles['BulletStyle']))
+        elif kind == 'sub_bullet':
+            elements.append(Paragraph('    ' + node.text, styles['BulletText']))
             in_bullet = True
             
         # Quotes in italics
-        elif line.startswith('"') and line.endswith('"'):
-            elements.append(Paragraph("<i>" + line + "</i>", styles['BodyJustified']))
+        elif kind == 'quote':
+            elements.append(Paragraph("<i>" + node.text + "</i>", styles['CustomBody']))
             in_bullet = False
             
         # Regular body text
-        else:
-            if in_bullet and not line.startswith(' '):
-                in_bullet = False
-            elements.append(Paragraph(line, styles['BodyJustified']))
+        elif kind == 'paragraph':
+            in_bullet = False
+            elements.append(Paragraph(node.text, styles['CustomBody']))
     
     # Add strategic graphics placement notes at end
     elements.append(PageBreak())
@@ -201,23 +130,24 @@ def create_cap_report_pdf():
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph(
         "The following visualizations support the findings presented in this report:",
-        styles['BodyJustified']
+        styles['CustomBody']
     ))
     elements.append(Spacer(1, 0.1*inch))
     
     viz_list = [
-        "1. Return on Investment by Disaster Type (37.3% for hurricanes)",
-        "2. Cost Containment Breakdown ($1.6M total savings)",
+        f"1. Return on Investment by Disaster Type ({metrics_store.percent('roi.disaster.hurricane')} for hurricanes)",
+        f"2. Cost Containment Breakdown ({metrics_store.millions('cost_containment.total')} total savings)",
         "3. Speed Advantage Analysis (1-4 days faster response)",
-        "4. Immediate Assistance Uptake Rates (93% in CAP areas vs 67% overall)",
-        "5. Volunteer Engagement Trends (+35.92% in CAP jurisdictions)",
-        "6. Homes Made Safer Impact (+66.24% increase)",
+        f"4. Immediate Assistance Uptake Rates ({metrics_store.percent('ia.completion.cap', 0)} in CAP areas "
+        f"vs {metrics_store.percent('ia.completion.overall', 0)} overall)",
+        f"5. Volunteer Engagement Trends (+{metrics_store.percent('volunteers.growth', 2)} in CAP jurisdictions)",
+        f"6. Homes Made Safer Impact (+{metrics_store.percent('homes_safer.growth', 2)} increase)",
         "7. Geographic Impact by State",
         "8. Stakeholder Sentiment Analysis"
     ]
     
     for viz in viz_list:
-        elements.append(Paragraph("• " + viz, styles['BulletStyle']))
+        elements.append(Paragraph("• " + viz, styles['BulletText']))
     
     elements.append(Spacer(1, 0.2*inch))
     elements.append(Paragraph(
@@ -226,7 +156,11 @@ def create_cap_report_pdf():
     ))
     
     # Build the PDF
-    doc.build(elements, canvasmaker=NumberedCanvas)
+    # Reuse pages ahead of the first changed flowable from the previous build
+    mode, page_count = incremental_pdf.build(doc, elements, NumberedCanvas,
+                                             salt=incremental_pdf.source_salt(__file__),
+                                             force_full=force_full)
+    print(f"📄 {page_count} pages ({mode} build)")
     
     print(f"\n✅ CAP Report PDF Created Successfully!")
     print(f"📄 Location: {pdf_file}")
@@ -234,12 +168,14 @@ def create_cap_report_pdf():
     print("  • Same section structure (Roman numerals, letters)")
     print("  • Justified text formatting")
     print("  • 150+ interviews update")
-    print("  • $1.6M cost containment")
-    print("  • 28.3% ROI")
+    print(f"  • {metrics_store.millions('cost_containment.total')} cost containment")
+    print(f"  • {metrics_store.percent('roi.overall')} ROI")
     print("  • All 8 disasters included")
     print("  • References to visualizations at appropriate points")
     
     return pdf_file
 
 if __name__ == "__main__":
-    pdf_path = create_cap_report_pdf()
\ No newline at end of file
+    import sys
+    # --full skips page reuse and lays out the whole report
+    pdf_path = create_cap_report_pdf(force_full='--full' in sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Duplicate detection for the transcript corpus
+The same interview turns up as the zip member, an extracted .docx, a
+"copy.pdf" rendering and a "_CLEANED" edit. Exact copies are dropped before
+parsing using the CRC32 and size already stored in each zip's directory.
+Near-duplicates are found after parsing with MinHash signatures over word
+shingles, LSH banding for candidate pairs and union-find to group them. Each
+group is one interview with one canonical source.
+
+Usage:
+    python dedup_transcripts.py          # summarize the last ingest's dedup index
+"""
+
+import json
+import os
+import re
+import zipfile
+import zlib
+
+import numpy as np
+
+CORPUS_DIR = '/Users/jefffranzen/cap-data/corpus'
+DEDUP_INDEX_PATH = f'{CORPUS_DIR}/dedup_index.json'
+
+SHINGLE_WORDS = 3
+NUM_PERMUTATIONS = 128
+# 32 bands of 4 rows: pairs above ~0.42 estimated Jaccard become candidates
+BANDS = 32
+# Docx vs its cleaned edit measures ~0.7; unrelated interviews stay under ~0.05
+NEAR_DUPLICATE_THRESHOLD = 0.5
+
+MERSENNE_PRIME = (1 << 31) - 1
+TOKEN = re.compile(r"[a-z0-9']+")
+
+# 1. EXACT DUPLICATES
+
+def content_key(job):
+    """(crc32, size) of a source's bytes; free for zip members, one read for loose files"""
+    path, member = job
+    if member is not None:
+        with zipfile.ZipFile(path) as archive:
+            info = archive.getinfo(member)
+        return info.CRC, info.file_size
+    with open(path, 'rb') as f:
+        data = f.read()
+    return zlib.crc32(data), len(data)
+
+def drop_exact_duplicates(jobs):
+    """Keep the first job per content key; returns (unique jobs, {skipped job: kept job})"""
+    kept = {}
+    unique = []
+    skipped = {}
+    for job in jobs:
+        key = content_key(job)
+        if key in kept:
+            skipped[job] = kept[key]
+        else:
+            kept[key] = job
+            unique.append(job)
+    return unique, skipped
+
+# 2. NEAR DUPLICATES
+
+def shingle_hashes(texts):
+    """crc32 of every SHINGLE_WORDS-word shingle in the document"""
+    tokens = TOKEN.findall(' '.join(texts).lower())
+    count = max(len(tokens) - SHINGLE_WORDS + 1, 1)
+    return np.unique(np.fromiter(
+        (zlib.crc32(' '.join(tokens[i:i + SHINGLE_WORDS]).encode('utf-8')) for i in range(count)),
+        dtype=np.uint64, count=count))
+
+class MinHasher:
+    """NUM_PERMUTATIONS universal hashes (a*x + b) mod p, applied to all shingles at once"""
+    def __init__(self, num_permutations=NUM_PERMUTATIONS, seed=42):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MERSENNE_PRIME, num_permutations, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, MERSENNE_PRIME, num_permutations, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes):
+        # a, x < 2^32, so a*x + b stays inside uint64
+        return ((self.a * (hashes[None, :] % MERSENNE_PRIME) + self.b) % MERSENNE_PRIME).min(axis=1)
+
+class UnionFind:
+    def __init__(self, items):
+        self.parent = {item: item for item in items}
+
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+    def groups(self):
+        groups = {}
+        for item in self.parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
+def near_duplicate_groups(signatures, bands=BANDS, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """
+    Group documents whose estimated Jaccard similarity reaches threshold
+    signatures: {doc key: MinHash signature}; returns (groups, {(a, b): similarity})
+    """
+    keys = list(signatures)
+    rows = NUM_PERMUTATIONS // bands
+    buckets = {}
+    for key in keys:
+        signature = signatures[key]
+        for band in range(bands):
+            buckets.setdefault((band, signature[band * rows:(band + 1) * rows].tobytes()), []).append(key)
+
+    union_find = UnionFind(keys)
+    similarities = {}
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if (a, b) in similarities:
+                    continue
+                similarity = float(np.mean(signatures[a] == signatures[b]))
+                similarities[(a, b)] = similarity
+                if similarity >= threshold:
+                    union_find.union(a, b)
+    return union_find.groups(), {pair: s for pair, s in similarities.items() if s >= threshold}
+
+def canonical_rank(doc):
+    """Prefer Word over PDF renderings, then cleaned edits, then the longest transcript"""
+    return (doc['format'] == 'docx', '_CLEANED' in doc['file_name'], doc['utterances'], -len(doc['file_name']))
+
+# 3. INDEX
+
+def build_index(documents, exact_skipped):
+    """
+    documents: {doc_id: {'label', 'file_name', 'format', 'utterances', 'texts'}}
+    exact_skipped: {skipped source label: kept source label}
+    Returns ({doc_id: (interview_id, is_canonical)}, index dict for DEDUP_INDEX_PATH)
+    """
+    hasher = MinHasher()
+    signatures = {doc_id: hasher.signature(shingle_hashes(doc['texts'])) for doc_id, doc in documents.items()}
+    groups, similarities = near_duplicate_groups(signatures)
+
+    assignments = {}
+    interviews = []
+    for group in groups:
+        canonical = max(group, key=lambda doc_id: canonical_rank(documents[doc_id]))
+        interview_id = canonical[:16]
+        for doc_id in group:
+            assignments[doc_id] = (interview_id, doc_id == canonical)
+        duplicates = [
+            {'source': documents[doc_id]['label'],
+             'similarity': round(max(s for pair, s in similarities.items() if doc_id in pair), 3)}
+            for doc_id in group if doc_id != canonical
+        ]
+        interviews.append({
+            'interview_id': interview_id,
+            'canonical': documents[canonical]['label'],
+            'duplicates': sorted(duplicates, key=lambda entry: entry['source']),
+        })
+
+    index = {
+        'interviews': len(interviews),
+        'documents': len(documents),
+        'exact_duplicates': [{'source': skipped, 'same_as': kept} for skipped, kept in sorted(exact_skipped.items())],
+        'groups': sorted(interviews, key=lambda entry: entry['canonical']),
+    }
+    return assignments, index
+
+def save_index(index, path=DEDUP_INDEX_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(index, f, indent=2)
+
+def load_index(path=DEDUP_INDEX_PATH):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def interview_count(path=DEDUP_INDEX_PATH):
+    """Distinct interviews in the corpus, as computed by the last ingest"""
+    return load_index(path)['interviews']
+
+if __name__ == "__main__":
+    try:
+        index = load_index()
+    except OSError:
+        print(f"⚠️  No dedup index at {DEDUP_INDEX_PATH} - run: python ingest_transcripts.py")
+        raise SystemExit(1)
+    near = sum(len(group['duplicates']) for group in index['groups'])
+    print(f"\n🧬 {index['interviews']} interviews from {index['documents'] + len(index['exact_duplicates'])} sources")
+    print(f"   Exact copies skipped before parsing: {len(index['exact_duplicates'])}")
+    print(f"   Near-duplicate variants:             {near}")
+    for group in index['groups']:
+        for duplicate in group['duplicates']:
+            print(f"   {duplicate['similarity']:.2f}  {duplicate['source']}  →  {group['canonical']}")
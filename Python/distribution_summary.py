@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Server-side distribution summaries for violin, ridgeline and box charts
+Plotly's Violin and Box traces ship every raw sample into the HTML and run
+the KDE in the browser. These helpers compute the KDE (binned, FFT-convolved)
+and the quartiles in NumPy and draw them as plain filled-curve and
+precomputed-box traces, so the payload is a fixed number of curve points no
+matter how many samples feed the chart.
+"""
+
+import numpy as np
+
+# Points on each KDE curve; the figure size no longer depends on sample count
+GRID_POINTS = 256
+
+def silverman_bandwidth(samples):
+    """Silverman's rule of thumb, the same default Plotly's violins use"""
+    n = len(samples)
+    sd = samples.std(ddof=1) if n > 1 else 0.0
+    q25, q75 = np.percentile(samples, [25, 75])
+    spread = min(sd, (q75 - q25) / 1.349) if q75 > q25 else sd
+    return 0.9 * spread * n ** -0.2 if spread > 0 else 1.0
+
+def kde(samples, grid_points=GRID_POINTS, bandwidth=None, cut=3):
+    """
+    Gaussian KDE on an evenly spaced grid; returns (grid, density)
+    Samples are linearly binned onto the grid and convolved with the kernel
+    by FFT, so cost is O(n + grid log grid) instead of O(n * grid).
+    """
+    samples = np.asarray(samples, dtype=float)
+    bandwidth = bandwidth or silverman_bandwidth(samples)
+    low = samples.min() - cut * bandwidth
+    high = samples.max() + cut * bandwidth
+    grid = np.linspace(low, high, grid_points)
+    step = grid[1] - grid[0]
+
+    # Linear binning: each sample splits its weight between its two nearest grid points
+    position = (samples - low) / step
+    left = np.clip(np.floor(position).astype(int), 0, grid_points - 2)
+    right_weight = position - left
+    counts = (np.bincount(left, weights=1 - right_weight, minlength=grid_points)
+              + np.bincount(left + 1, weights=right_weight, minlength=grid_points))
+
+    # Zero-padded circular convolution with the kernel sampled at every grid offset
+    size = 2 * grid_points
+    offsets = np.arange(size)
+    offsets = np.where(offsets < grid_points, offsets, offsets - size) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel), size)[:grid_points]
+    return grid, np.maximum(density / len(samples), 0)
+
+def box_stats(samples):
+    """Quartiles, Tukey fences (clipped to the data), mean and outliers"""
+    samples = np.asarray(samples, dtype=float)
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    iqr = q3 - q1
+    inside = (samples >= q1 - 1.5 * iqr) & (samples <= q3 + 1.5 * iqr)
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'mean': samples.mean(),
+        'lowerfence': samples[inside].min(),
+        'upperfence': samples[inside].max(),
+        'outliers': samples[~inside],
+    }
+
+# 1. TRACES
+
+def ridge_traces(samples, baseline, name, color, height=0.9, opacity=0.6):
+    """Filled KDE curve resting on y=baseline (peak = height) plus its mean line"""
+    import plotly.graph_objects as go
+    grid, density = kde(samples)
+    curve = baseline + density / density.max() * height
+    mean = float(np.mean(samples))
+
+    return [
+        go.Scatter(
+            x=np.concatenate([grid, grid[::-1]]),
+            y=np.concatenate([curve, np.full(len(grid), float(baseline))]),
+            fill='toself', mode='lines', name=name,
+            line=dict(color=color, width=1), fillcolor=color, opacity=opacity,
+            hoveron='fills', hoverinfo='name'
+        ),
+        go.Scatter(
+            x=[mean, mean], y=[baseline, np.interp(mean, grid, curve)],
+            mode='lines', line=dict(color=color, width=2),
+            hoverinfo='skip', showlegend=False
+        ),
+    ]
+
+def violin_traces(samples, position, name, color, half_width=0.4, opacity=0.6, box=True):
+    """Mirrored KDE outline centered on x=position, with an optional inner box"""
+    import plotly.graph_objects as go
+    grid, density = kde(samples)
+    width = density / density.max() * half_width
+
+    traces = [go.Scatter(
+        x=np.concatenate([position - width, (position + width)[::-1]]),
+        y=np.concatenate([grid, grid[::-1]]),
+        fill='toself', mode='lines', name=name,
+        line=dict(color=color, width=1), fillcolor=color, opacity=opacity,
+        hoveron='fills', hoverinfo='name'
+    )]
+    if box:
+        stats = box_stats(samples)
+        traces += [
+            # Whiskers, then the interquartile bar, then the median
+            go.Scatter(x=[position, position], y=[stats['lowerfence'], stats['upperfence']],
+                       mode='lines', line=dict(color='#333333', width=1),
+                       hoverinfo='skip', showlegend=False),
+            go.Scatter(x=[position, position], y=[stats['q1'], stats['q3']],
+                       mode='lines', line=dict(color='#333333', width=8),
+                       hoverinfo='skip', showlegend=False),
+            go.Scatter(x=[position], y=[stats['median']], mode='markers',
+                       marker=dict(color='white', size=6, line=dict(color='#333333', width=1)),
+                       hovertemplate=f'{name}<br>Median: %{{y:.1f}}<extra></extra>', showlegend=False),
+        ]
+    return traces
+
+def box_traces(samples, name, color, **kwargs):
+    """Box drawn from precomputed quartiles, plus only its outliers as points"""
+    import plotly.graph_objects as go
+    stats = box_stats(samples)
+    traces = [go.Box(
+        x=[name], name=name,
+        q1=[stats['q1']], median=[stats['median']], q3=[stats['q3']],
+        lowerfence=[stats['lowerfence']], upperfence=[stats['upperfence']],
+        mean=[stats['mean']],
+        line=dict(color=color), fillcolor=color,
+        **kwargs
+    )]
+    if len(stats['outliers']):
+        traces.append(go.Scatter(
+            x=[name] * len(stats['outliers']), y=stats['outliers'],
+            mode='markers', marker=dict(color=color, size=4, opacity=0.5),
+            hoverinfo='y', showlegend=False
+        ))
+    return traces
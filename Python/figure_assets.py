@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Figure asset stage for the PDF builders
+Renders every chart a PDF needs ahead of the build (in parallel, through the
+render cache) and records the finished images in a manifest. The PDF builders
+only read the manifest, so text-only edits never touch plotly or kaleido.
+
+Usage:
+    python figure_assets.py              # build assets + manifest
+    python figure_assets.py --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+OUTPUT_DIR = '/Users/jefffranzen/cap-data/output'
+MANIFEST_PATH = f'{OUTPUT_DIR}/figure_manifest.json'
+
+# Asset name -> (module, builder function, width, height, scale)
+PDF_ASSETS = [
+    ('roi_comparison', 'create_cap_graphics', 'create_roi_comparison', 600, 400, 2),
+    ('speed_comparison', 'create_cap_graphics', 'create_speed_comparison', 600, 400, 2),
+    ('cost_breakdown', 'create_cap_graphics', 'create_cost_breakdown', 600, 400, 2),
+]
+
+def _sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def build_assets(assets=PDF_ASSETS, workers=None, manifest_path=MANIFEST_PATH):
+    """
+    Render all assets and merge them into the manifest; returns the manifest dict
+    An asset that fails to render keeps its entry from the last good build.
+    """
+    import importlib
+    from image_export import DEFAULT_WORKERS, export_figures
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    jobs = []
+    specs = {}
+    for name, module_name, func_name, width, height, scale in assets:
+        try:
+            builder = getattr(importlib.import_module(module_name), func_name)
+            fig = builder()
+        except Exception as e:
+            print(f"❌ Failed: {name} - {e}")
+            continue
+        path = f'{OUTPUT_DIR}/{name}.png'
+        specs[name] = (path, width, height, scale)
+        jobs.append((name, fig, (width, height, scale), [(path, None)]))
+
+    results = export_figures(jobs, workers=workers or DEFAULT_WORKERS)
+
+    manifest = _read_manifest(manifest_path) or {}
+    for name, _, error in results:
+        if error:
+            if name in manifest:
+                print(f"⚠️  {name}: keeping the image from {manifest[name]['built_at']}")
+            continue
+        path, width, height, scale = specs[name]
+        manifest[name] = {
+            'path': path,
+            'width': width,
+            'height': height,
+            'scale': scale,
+            'sha256': _sha256(path),
+            'built_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+    tmp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+def _read_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Read the asset manifest, keeping only entries whose image still exists"""
+    manifest = _read_manifest(manifest_path)
+    if manifest is None:
+        print(f"⚠️  No figure manifest at {manifest_path} - run: python figure_assets.py")
+        return {}
+    return {name: entry for name, entry in manifest.items() if os.path.exists(entry['path'])}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Render the figure assets used by the PDF builders')
+    parser.add_argument('--workers', type=int, default=None, help='parallel kaleido workers')
+    args = parser.parse_args()
+
+    print("\n🖼️  Building PDF figure assets...\n")
+    start = time.perf_counter()
+    manifest = build_assets(workers=args.workers)
+    print(f"\n✅ {len(manifest)} of {len(PDF_ASSETS)} assets ready in {time.perf_counter() - start:.1f}s")
+    print(f"📄 Manifest: {MANIFEST_PATH}")
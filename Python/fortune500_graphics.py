@@ -17,6 +17,10 @@ import numpy as np
 import os
 from datetime import datetime
 
+import html_export
+import metrics_store
+import render_cache
+
 # ==========================================
 # AMERICAN RED CROSS BRAND COLORS (OFFICIAL)
 # ==========================================
@@ -91,8 +95,8 @@ def setup_professional_layout(fig, title, subtitle="", height=DEFAULT_HEIGHT):
 
 def create_roi_by_disaster_type():
     """1. ROI by Disaster Type - Horizontal Bar Chart"""
-    disasters = ['Hurricane', 'Flooding', 'Tornado']
-    roi_values = [37.30, 25.53, 9.77]
+    disasters, roi_values = metrics_store.series('roi_by_disaster')
+    overall = metrics_store.value('roi.overall')
     
     fig = go.Figure()
     
@@ -117,7 +121,7 @@ def create_roi_by_disaster_type():
     setup_professional_layout(
         fig,
         "Return on Investment by Disaster Type",
-        "28.3% Overall ROI on $5.67M Partner Investment",
+        f"{overall:.1f}% Overall ROI on {metrics_store.millions('investment.partner', 2)} Partner Investment",
         height=500
     )
     
@@ -126,10 +130,10 @@ def create_roi_by_disaster_type():
     
     # Add benchmark line at overall ROI
     fig.add_vline(
-        x=28.3, 
+        x=overall, 
         line_dash="dot", 
         line_color=ARC_COLORS['primary'],
-        annotation_text="Overall ROI: 28.3%",
+        annotation_text=f"Overall ROI: {overall:.1f}%",
         annotation_position="top right"
     )
     
@@ -137,8 +141,8 @@ def create_roi_by_disaster_type():
 
 def create_roi_by_partner_type():
     """2. ROI by Partner Type - Waterfall/Ranked Bar Chart"""
-    partners = ['Resilience Hub', 'Community Gateway', 'Hunger Partners', 'Health Partners', 'Housing Partners']
-    roi_values = [33.48, 30.11, 26.33, 22.99, 4.91]
+    partners, roi_values = metrics_store.series('roi_by_partner')
+    overall = metrics_store.value('roi.overall')
     
     fig = go.Figure()
     
@@ -177,10 +181,10 @@ def create_roi_by_partner_type():
     
     # Add benchmark line
     fig.add_hline(
-        y=28.3, 
+        y=overall, 
         line_dash="dot", 
         line_color=ARC_COLORS['primary'],
-        annotation_text="Overall ROI: 28.3%",
+        annotation_text=f"Overall ROI: {overall:.1f}%",
         annotation_position="bottom right"
     )
     
@@ -212,12 +216,12 @@ def create_cost_containment_donut():
     setup_professional_layout(
         fig,
         "Cost Containment Breakdown",
-        "$1.6M Total Value from Partner Contributions"
+        f"{metrics_store.millions('cost_containment.total')} Total Value from Partner Contributions"
     )
     
     # Center annotation
     fig.add_annotation(
-        text='<b>$1.6M</b><br>Total Savings',
+        text=f"<b>{metrics_store.millions('cost_containment.total')}</b><br>Total Savings",
         x=0.5, y=0.5,
         font=dict(size=24, color=ARC_COLORS['primary'], family=FONT_FAMILY),
         showarrow=False
@@ -230,8 +234,12 @@ def create_ia_uptake_comparison():
     locations = ['Terrebonne Parish<br>(Hurricane Francine)', 'McNairy County<br>(TN Tornados)',
                  'Warren County<br>(KY Floods)', 'Cameron/Hidalgo<br>(South TX Floods)']
     
-    cap_rates = [93.0, 80.7, 53.8, 58.3]
-    overall_rates = [67.0, 75.3, 34.3, 51.0]
+    cap_rates = [metrics_store.value(key) for key in (
+        'ia.completion.cap', 'ia.completion.tn_tornados.cap',
+        'ia.completion.ky_floods.cap', 'ia.completion.south_tx_floods.cap')]
+    overall_rates = [metrics_store.value(key) for key in (
+        'ia.completion.overall', 'ia.completion.tn_tornados.overall',
+        'ia.completion.ky_floods.overall', 'ia.completion.south_tx_floods.overall')]
     
     fig = go.Figure()
     
@@ -357,8 +365,9 @@ def create_volunteer_engagement_trends():
     years = ['FY20', 'FY21', 'FY22', 'FY23', 'FY24', 'FY25']
     
     # Index values (base year FY20 = 100)
-    national_trend = [100, 102, 105, 110, 113, 116]  # +16.05% over period
-    cap_jurisdictions = [100, 103, 107, 125, 132, 136]  # +35.92% over period
+    # FY25 is FY20 (= 100) plus the stored growth
+    national_trend = [100, 102, 105, 110, 113, round(100 + metrics_store.value('volunteers.growth.national'))]
+    cap_jurisdictions = [100, 103, 107, 125, 132, round(100 + metrics_store.value('volunteers.growth'))]
     
     fig = go.Figure()
     
@@ -389,7 +398,8 @@ def create_volunteer_engagement_trends():
     setup_professional_layout(
         fig,
         "Volunteer Engagement: The CAP Halo Effect",
-        "+35.92% Growth in CAP Jurisdictions vs +16.05% National Average"
+        f"+{metrics_store.percent('volunteers.growth', 2)} Growth in CAP Jurisdictions vs "
+        f"+{metrics_store.percent('volunteers.growth.national', 2)} National Average"
     )
     
     fig.update_yaxes(title_text="Volunteer Index (FY20 Base = 100)")
@@ -423,7 +433,8 @@ def create_homes_safer_impact():
     counties = ['Cameron County, TX', 'Butte County, CA', 'Montgomery County, AL', 
                 'Sarasota County, FL', 'Other CAP Counties', 'National Average']
     
-    percentage_increase = [1366.67, 828.57, 167.39, 165.47, 66.24, 14.02]
+    percentage_increase = [1366.67, 828.57, 167.39, 165.47,
+                           metrics_store.value('homes_safer.growth'), metrics_store.value('homes_safer.growth.national')]
     bubble_sizes = [min(x/5, 100) for x in percentage_increase]  # Scale bubble sizes
     
     # Color by performance tier
@@ -477,90 +488,99 @@ def create_homes_safer_impact():
     
     # Add national average reference line
     fig.add_hline(
-        y=14.02,
+        y=metrics_store.value('homes_safer.growth.national'),
         line_dash="dash",
         line_color=ARC_COLORS['warning'],
-        annotation_text="National Average: +14.02%",
+        annotation_text=f"National Average: +{metrics_store.percent('homes_safer.growth.national', 2)}",
         annotation_position="left"
     )
     
     # Add CAP average reference line
     fig.add_hline(
-        y=66.24,
+        y=metrics_store.value('homes_safer.growth'),
         line_dash="dot",
         line_color=ARC_COLORS['primary'],
-        annotation_text="CAP Average: +66.24%",
+        annotation_text=f"CAP Average: +{metrics_store.percent('homes_safer.growth', 2)}",
         annotation_position="right"
     )
     
     return fig
 
+# Analysis PDFs with a sentiment grid (pdf_extract.ANALYSIS_PDFS keys) -> subplot title
+SENTIMENT_DISASTERS = [
+    ('ky_april_storms', 'Kentucky April Storms'),
+    ('south_texas_floods', 'South Texas Floods'),
+    ('mo_ar_april_storms', 'MO/AR April Storms'),
+    ('tn_april_storms', 'Tennessee April Storms'),
+]
+
 def create_stakeholder_sentiment_radar():
-    """8. Stakeholder Sentiment Analysis - Radar Chart"""
-    categories = ['Service Quality', 'Response Speed', 'Cultural Competence', 
-                  'Cost Effectiveness', 'Partner Satisfaction', 'Community Trust']
-    
-    # Scores out of 100 based on qualitative analysis
-    cap_scores = [95, 92, 88, 85, 97, 90]  # CAP performance
-    baseline_scores = [75, 70, 65, 70, 80, 75]  # Pre-CAP baseline
-    
-    fig = go.Figure()
-    
-    # Baseline performance
-    fig.add_trace(go.Scatterpolar(
-        r=baseline_scores + [baseline_scores[0]],  # Close the polygon
-        theta=categories + [categories[0]],
-        fill='toself',
-        fillcolor=f'rgba(107, 124, 147, 0.3)',
-        line=dict(color=ARC_COLORS['secondary'], width=2),
-        name='Pre-CAP Baseline',
-        hovertemplate='<b>%{theta}</b><br>Score: %{r}<extra></extra>'
-    ))
+    """8. Stakeholder Sentiment Analysis - Radar Chart per disaster"""
+    # Each analysis rates its own themes, so every disaster gets its own polar axis
+    fig = make_subplots(
+        rows=2, cols=2,
+        specs=[[{"type": "polar"}, {"type": "polar"}], [{"type": "polar"}, {"type": "polar"}]],
+        subplot_titles=[title for _, title in SENTIMENT_DISASTERS],
+        vertical_spacing=0.18,
+        horizontal_spacing=0.25
+    )
     
-    # CAP performance
-    fig.add_trace(go.Scatterpolar(
-        r=cap_scores + [cap_scores[0]],  # Close the polygon
-        theta=categories + [categories[0]],
-        fill='toself',
-        fillcolor=f'rgba(204, 0, 0, 0.3)',
-        line=dict(color=ARC_COLORS['primary'], width=3),
-        name='With CAP',
-        hovertemplate='<b>%{theta}</b><br>Score: %{r}<extra></extra>'
-    ))
+    for i, (disaster, title) in enumerate(SENTIMENT_DISASTERS):
+        try:
+            themes, shares = metrics_store.series(f'sentiment_{disaster}')
+        except KeyError as e:
+            raise KeyError(f"{e.args[0]} (run: python pdf_extract.py)") from None
+        fig.add_trace(go.Scatterpolar(
+            r=shares + [shares[0]],  # Close the polygon
+            theta=themes + [themes[0]],
+            fill='toself',
+            fillcolor='rgba(204, 0, 0, 0.3)',
+            line=dict(color=ARC_COLORS['primary'], width=2),
+            name=title,
+            hovertemplate='<b>%{theta}</b><br>Positive: %{r:.0f}% of stakeholder groups<extra></extra>'
+        ), row=i // 2 + 1, col=i % 2 + 1)
+    
+    fig.update_polars(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 100],
+            ticksuffix='%',
+            tickfont=dict(size=9),
+            gridcolor='rgba(0,0,0,0.1)'
+        ),
+        angularaxis=dict(
+            tickfont=dict(size=9, family=FONT_FAMILY)
+        )
+    )
     
     fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(size=10),
-                gridcolor='rgba(0,0,0,0.1)'
-            ),
-            angularaxis=dict(
-                tickfont=dict(size=12, family=FONT_FAMILY)
-            )
-        ),
         title={
-            'text': f"<b>Stakeholder Sentiment Analysis</b><br><span style='font-size:{SUBTITLE_FONT_SIZE}px;color:{ARC_COLORS['secondary']}'>Comprehensive Performance Assessment Across Key Dimensions</span>",
+            'text': f"<b>Stakeholder Sentiment Analysis</b><br><span style='font-size:{SUBTITLE_FONT_SIZE}px;color:{ARC_COLORS['secondary']}'>Share of Stakeholder Groups Rating Each Theme Positive or Very Positive</span>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': TITLE_FONT_SIZE, 'color': ARC_COLORS['text'], 'family': FONT_FAMILY}
         },
         font=dict(family=FONT_FAMILY, size=AXIS_FONT_SIZE),
         paper_bgcolor=ARC_COLORS['background'],
-        height=600,
+        height=900,
         margin=MARGIN_SETTINGS,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.1,
-            xanchor="center",
-            x=0.5
-        )
+        showlegend=False
     )
     
     return fig
 
+# Output name -> figure builder, exported at DEFAULT_WIDTH x DEFAULT_HEIGHT
+CHARTS = [
+    ('roi_disaster_type', create_roi_by_disaster_type),
+    ('roi_partner_type', create_roi_by_partner_type),
+    ('cost_containment', create_cost_containment_donut),
+    ('ia_uptake', create_ia_uptake_comparison),
+    ('speed_advantage', create_speed_advantage_chart),
+    ('volunteer_trends', create_volunteer_engagement_trends),
+    ('homes_safer', create_homes_safer_impact),
+    ('stakeholder_sentiment', create_stakeholder_sentiment_radar)
+]
+
 def export_all_visualizations():
     """Generate and export all visualizations"""
     
@@ -571,31 +591,30 @@ def export_all_visualizations():
     print("🎨 Generating Fortune 500 Quality CAP Visualizations...")
     print("=" * 60)
     
-    # Generate all charts
-    charts = {
-        'roi_disaster_type': create_roi_by_disaster_type(),
-        'roi_partner_type': create_roi_by_partner_type(),
-        'cost_containment': create_cost_containment_donut(),
-        'ia_uptake': create_ia_uptake_comparison(),
-        'speed_advantage': create_speed_advantage_chart(),
-        'volunteer_trends': create_volunteer_engagement_trends(),
-        'homes_safer': create_homes_safer_impact(),
-        'stakeholder_sentiment': create_stakeholder_sentiment_radar()
-    }
+    # Generate all charts; one that can't be built (e.g. sentiment not extracted yet) is skipped
+    charts = {}
+    for name, builder in CHARTS:
+        try:
+            charts[name] = builder()
+        except KeyError as e:
+            print(f"  ⚠️  Skipped {name}: {e.args[0]}")
     
     # Export as HTML (interactive)
     print("\n📊 Exporting Interactive HTML Files:")
     for name, fig in charts.items():
         html_path = f"{graphics_dir}/{name}.html"
-        fig.write_html(html_path)
+        html_export.write_html(fig, html_path)
         print(f"  ✅ {name}.html")
+    html_export.write_gallery(list(charts.values()), f"{graphics_dir}/index.html",
+                              title="CAP Evaluation - Fortune 500 Graphics")
+    print("  ✅ index.html (gallery)")
     
     # Export as PNG (static - for presentations)
     print("\n🖼️  Exporting Static PNG Files:")
     try:
         for name, fig in charts.items():
             png_path = f"{graphics_dir}/{name}.png"
-            fig.write_image(png_path, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=2)
+            render_cache.write_image(fig, png_path, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=2)
             print(f"  ✅ {name}.png")
     except Exception as e:
         print(f"  ⚠️  PNG export failed: {e}")
@@ -615,15 +634,15 @@ def export_all_visualizations():
     print("  • High-resolution exports")
     print("  • Consistent styling across all charts")
 
-def create_executive_dashboard(charts):
-    """Create a combined executive dashboard"""
+def build_executive_dashboard():
+    """Build the combined executive dashboard figure"""
     
     # Create 2x4 subplot layout
     fig = make_subplots(
         rows=4, cols=2,
         subplot_titles=[
             "ROI by Disaster Type", "ROI by Partner Type",
-            "Cost Containment ($1.6M)", "IA Uptake Rates",
+            f"Cost Containment ({metrics_store.millions('cost_containment.total')})", "IA Uptake Rates",
             "Speed Advantage (Days)", "Volunteer Growth Trends",
             "Homes Made Safer Impact", "Stakeholder Sentiment"
         ],
@@ -653,12 +672,18 @@ def create_executive_dashboard(charts):
         showlegend=False
     )
     
+    return fig
+
+def create_executive_dashboard(charts):
+    """Create a combined executive dashboard"""
+    fig = build_executive_dashboard()
+    
     # Save dashboard
     graphics_dir = "/Users/jefffranzen/cap-data/graphics"
-    fig.write_html(f"{graphics_dir}/executive_dashboard.html")
+    html_export.write_html(fig, f"{graphics_dir}/executive_dashboard.html")
     
     try:
-        fig.write_image(f"{graphics_dir}/executive_dashboard.png", width=1600, height=1600, scale=2)
+        render_cache.write_image(fig, f"{graphics_dir}/executive_dashboard.png", width=1600, height=1600, scale=2)
     except:
         pass
     
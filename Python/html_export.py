@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Interactive HTML export that shares one copy of plotly.js
+Each output directory gets a single plotly-<version>.min.js that every chart
+page references, instead of embedding the ~3.5 MB library in every file. The
+plotly.js version is in the file name, so upgrading plotly writes a new bundle
+while pages built before the upgrade keep loading the one they were made with.
+"""
+
+import os
+
+def plotlyjs_name():
+    """'plotly-2.35.2.min.js' for the plotly.js bundled with the installed plotly"""
+    from plotly.offline import get_plotlyjs_version
+    return f'plotly-{get_plotlyjs_version()}.min.js'
+
+def ensure_plotlyjs(directory):
+    """Write this plotly version's bundle into a directory once; returns its file name"""
+    name = plotlyjs_name()
+    bundle_path = os.path.join(directory, name)
+    if not os.path.exists(bundle_path):
+        from plotly.offline import get_plotlyjs
+
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{bundle_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+        os.replace(tmp_path, bundle_path)
+    return name
+
+def write_html(fig, path):
+    """Write a standalone chart page that loads the shared plotly.js bundle beside it"""
+    bundle = ensure_plotlyjs(os.path.dirname(path))
+    fig.write_html(path, include_plotlyjs=bundle, full_html=True)
+
+def write_gallery(figures, path, title="CAP Visualizations"):
+    """Write every figure into one HTML page that loads plotly.js a single time"""
+    import plotly.io as pio
+
+    bundle = ensure_plotlyjs(os.path.dirname(path))
+
+    charts = []
+    for i, fig in enumerate(figures, 1):
+        div = pio.to_html(fig, include_plotlyjs=False, full_html=False,
+                          div_id=f'chart-{i}', default_width='100%')
+        charts.append(f'<section class="chart">{div}</section>')
+
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{bundle}"></script>
+<style>
+  body {{ font-family: Arial, Helvetica, sans-serif; margin: 24px; background: #FFFFFF; }}
+  h1 {{ color: #CC0000; }}
+  .chart {{ margin-bottom: 48px; border-bottom: 1px solid #E2E8F0; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{''.join(charts)}
+</body>
+</html>
+"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return path
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Parallel static image export engine for Plotly figures
+Each worker process keeps its own warm kaleido instance and renders concurrently.
+Every figure is rasterized once; all requested formats and thumbnail sizes
+are encoded from that single PNG buffer. Rasters are looked up in the render
+cache first, so unchanged figures never reach kaleido.
+"""
+
+import importlib.util
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import render_cache
+
+DEFAULT_WORKERS = os.cpu_count() or 4
+
+# File extension -> encoder format name
+FORMATS = {
+    '.png': 'png',
+    '.jpg': 'jpeg',
+    '.jpeg': 'jpeg',
+    '.webp': 'webp',
+}
+
+# Per-process plotly.io handle, set once by the pool initializer
+_pio = None
+
+def _init_worker():
+    """Start kaleido once per worker so every later job reuses the warm instance"""
+    global _pio
+    import plotly.io as pio
+    import plotly.graph_objects as go
+
+    pio.kaleido.scope.mathjax = None
+    # Warm-up render pays the Chromium startup before real jobs arrive
+    pio.to_image(go.Figure(), format='png', width=10, height=10)
+    _pio = pio
+
+def _have_pil():
+    return importlib.util.find_spec('PIL') is not None
+
+def _format_for(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported image format: {path}")
+    return FORMATS[ext]
+
+def encode_outputs(png_bytes, outputs):
+    """
+    Derive every requested output from one rasterized PNG buffer
+
+    outputs: list of (path, size) where size is None for full resolution
+             or a (max_width, max_height) box for a thumbnail
+    """
+    from PIL import Image
+
+    base = Image.open(io.BytesIO(png_bytes))
+    base.load()
+
+    for path, size in outputs:
+        fmt = _format_for(path)
+
+        # Full-size PNG is the raster itself, no re-encode needed
+        if fmt == 'png' and size is None:
+            with open(path, 'wb') as f:
+                f.write(png_bytes)
+            continue
+
+        img = base
+        if size is not None:
+            img = base.copy()
+            img.thumbnail(size, Image.LANCZOS)
+
+        if fmt == 'jpeg':
+            # JPEG has no alpha channel; flatten onto the white page background
+            if img.mode in ('RGBA', 'LA', 'P'):
+                rgba = img.convert('RGBA')
+                flat = Image.new('RGB', rgba.size, (255, 255, 255))
+                flat.paste(rgba, mask=rgba.split()[-1])
+                img = flat
+            img.save(path, 'JPEG', quality=92, optimize=True)
+        elif fmt == 'webp':
+            img.save(path, 'WEBP', quality=90, method=4)
+        else:
+            img.save(path, 'PNG', optimize=True)
+
+def _render_outputs_separately(fig, raster, outputs):
+    """Fallback without Pillow: one kaleido render per output"""
+    width, height, scale = raster
+    for path, size in outputs:
+        out_scale = scale
+        if size is not None:
+            out_scale = scale * min(size[0] / (width * scale), size[1] / (height * scale))
+        render_cache.write_image(fig, path, width=width, height=height, scale=out_scale,
+                                 format=_format_for(path))
+
+def _render_job(job):
+    """Rasterize one figure and encode all of its outputs, returning elapsed time"""
+    name, fig_json, raster, outputs, key = job
+    start = time.perf_counter()
+    try:
+        fig = _pio.from_json(fig_json)
+        width, height, scale = raster
+        if not _have_pil():
+            _render_outputs_separately(fig, raster, outputs)
+        else:
+            png_bytes = _pio.to_image(fig, format='png', width=width, height=height, scale=scale)
+            render_cache.put(key, png_bytes)
+            encode_outputs(png_bytes, outputs)
+        return name, time.perf_counter() - start, None
+    except Exception as e:
+        return name, time.perf_counter() - start, str(e)
+
+def export_figures(jobs, workers=DEFAULT_WORKERS):
+    """
+    Render figures to static images across a pool of kaleido workers
+
+    jobs: list of (name, fig, raster, outputs) where raster is the
+          (width, height, scale) to rasterize at and outputs is a list of
+          (path, size) pairs; the format comes from the path extension and
+          size is None for full resolution or a (max_width, max_height) thumbnail box
+    Figures whose raster is already in the render cache skip the worker pool;
+    the pool is only started when at least one figure needs kaleido.
+    Returns a list of (name, seconds, error) in completion order
+    """
+    have_pil = _have_pil()
+
+    results = []
+    payloads = []
+    for name, fig, raster, outputs in jobs:
+        for path, _ in outputs:
+            _format_for(path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        key = render_cache.figure_key(fig, *raster)
+        cached = render_cache.get(key) if have_pil else None
+        if cached is not None:
+            # Unchanged figure: encode straight from the cached raster, no kaleido
+            start = time.perf_counter()
+            try:
+                encode_outputs(cached, outputs)
+                error = None
+                print(f"⚡ Cached: {name}")
+            except Exception as e:
+                error = str(e)
+                print(f"❌ Failed: {name} - {error}")
+            results.append((name, time.perf_counter() - start, error))
+            continue
+
+        # Figures travel to the workers as JSON; builders stay in the parent process
+        payloads.append((name, fig.to_json(), raster, outputs, key))
+
+    if payloads:
+        workers = max(1, min(workers, len(payloads)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_render_job, payload) for payload in payloads]
+            for future in as_completed(futures):
+                name, seconds, error = future.result()
+                if error:
+                    print(f"❌ Failed: {name} - {error}")
+                else:
+                    print(f"✅ Rendered: {name} ({seconds:.2f}s)")
+                results.append((name, seconds, error))
+        render_cache.evict()
+
+    return results
+
+def print_timing_report(results, wall_seconds):
+    """Summarize per-figure render times against total wall time"""
+    rendered = sorted((r for r in results if not r[2]), key=lambda r: r[1], reverse=True)
+    render_total = sum(seconds for _, seconds, _ in rendered)
+
+    print("\n⏱️  Per-figure render time:")
+    for name, seconds, _ in rendered:
+        print(f"   {name:<30} {seconds:6.2f}s")
+
+    print(f"\n   Total render time: {render_total:.2f}s")
+    print(f"   Wall time:         {wall_seconds:.2f}s")
+    if wall_seconds > 0:
+        print(f"   Parallel speedup:  {render_total / wall_seconds:.1f}x")
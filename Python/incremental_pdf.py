@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Incremental PDF rebuilds for the report builders
+Each build records a signature for every story flowable and which flowable
+starts each page. The next build finds the first changed flowable, keeps the
+previous PDF's pages before the last clean page break ahead of it, re-flows
+only the rest of the story and splices the two with pypdf. Anything that
+can't be reused safely falls back to a full doc.build.
+
+Usage:
+    python incremental_pdf.py    # check that a last-section edit rebuilds incrementally
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from reportlab.lib.styles import PropertySet
+from reportlab.platypus import SimpleDocTemplate
+from reportlab.platypus.doctemplate import ActionFlowable
+
+STATE_DIR = '/Users/jefffranzen/cap-data/.pdf_layout'
+# Shared modules that shape every report's layout; source_salt() always includes them
+LAYOUT_MODULES = ('brand_styles.py', 'callout_box.py', 'page_decoration.py', 'report_parser.py', 'incremental_pdf.py')
+
+class TrackingDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that records which story flowable starts each page"""
+    def __init__(self, filename, **kwargs):
+        SimpleDocTemplate.__init__(self, filename, **kwargs)
+        self._init_kwargs = kwargs
+        self._story_index = {}
+        self._pages_seen = set()
+        self.page_starts = {}
+
+    def track(self, flowables, first_index=0):
+        self._story_index = {id(f): first_index + i for i, f in enumerate(flowables)}
+        self._pages_seen = set()
+        self.page_starts = {}
+
+    def afterFlowable(self, flowable):
+        # ReportLab's own frame/template actions (LCActionFlowable, ...) aren't story content
+        if isinstance(flowable, ActionFlowable) or self.page in self._pages_seen:
+            return
+        self._pages_seen.add(self.page)
+        # Split fragments are new objects: a page opening mid-flowable isn't a clean restart point
+        index = self._story_index.get(id(flowable))
+        if index is not None:
+            self.page_starts[self.page] = index
+
+    def copy_to(self, filename):
+        """Same page setup, different output"""
+        return type(self)(filename, **self._init_kwargs)
+
+# 1. SIGNATURES
+
+def _simple(value):
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_simple(v) for v in value)
+    return False
+
+def _style_signature(style):
+    # Every resolved attribute, so a font size change is seen even when the style name isn't
+    return ','.join(f'{name}={value!r}' for name, value in sorted(vars(style).items()) if name != 'parent')
+
+def flowable_signature(flowable):
+    """Hash a flowable's content: its class, plain attributes and resolved style"""
+    parts = [type(flowable).__name__]
+    if hasattr(flowable, 'getPlainText'):
+        parts.append(flowable.getPlainText())
+    for name, value in sorted(vars(flowable).items()):
+        if name in ('_cellvalues', '_colWidths', '_rowHeights', '_argW', '_argH'):
+            parts.append(f'{name}={value!r}' if _simple(value) else f'{name}={len(value)}')
+        elif name.startswith('_') or name in ('canv', 'frags', 'blPara'):
+            continue
+        elif _simple(value):
+            parts.append(f'{name}={value!r}')
+        elif isinstance(value, PropertySet):
+            parts.append(f'{name}=<{value.name}:{_style_signature(value)}>')
+        elif isinstance(getattr(value, 'name', None), str):
+            parts.append(f'{name}=<{value.name}>')
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:24]
+
+def source_salt(*paths):
+    """
+    Hash of builder source files, the LAYOUT_MODULES and the ReportLab version;
+    any change to them forces a full rebuild
+    """
+    import reportlab
+    here = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256(reportlab.Version.encode('utf-8'))
+    for path in list(paths) + [os.path.join(here, name) for name in LAYOUT_MODULES]:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# 2. STATE
+
+def _state_path(pdf_path):
+    return os.path.join(STATE_DIR, os.path.basename(pdf_path) + '.json')
+
+def _load_state(pdf_path):
+    try:
+        with open(_state_path(pdf_path), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_state(pdf_path, signatures, page_starts, page_count, salt):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    state = {
+        'salt': salt,
+        'signatures': signatures,
+        'page_starts': {str(page): index for page, index in sorted(page_starts.items())},
+        'page_count': page_count,
+        'pdf_sha256': _file_sha256(pdf_path),
+    }
+    with open(_state_path(pdf_path), 'w') as f:
+        json.dump(state, f)
+
+# 3. BUILD
+
+def _full_build(doc, flowables, signatures, canvasmaker, salt):
+    doc.track(flowables)
+    doc.build(list(flowables), canvasmaker=canvasmaker)
+    _save_state(doc.filename, signatures, doc.page_starts, doc.page, salt)
+    return 'full', doc.page
+
+def _restart_page(state, first_changed):
+    """Last page that begins cleanly at or before the first changed flowable"""
+    restart = None
+    for page, index in state['page_starts'].items():
+        page = int(page)
+        if index <= first_changed and page > 1 and (restart is None or page > restart[0]):
+            restart = (page, index)
+    return restart
+
+def build(doc, flowables, canvasmaker, salt='', force_full=False):
+    """
+    Build doc from flowables, reusing unchanged leading pages of the last build
+    Returns ('full' | 'incremental' | 'unchanged', page_count)
+    """
+    signatures = [flowable_signature(f) for f in flowables]
+    state = None if force_full else _load_state(doc.filename)
+
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        if state is not None:
+            print("ℹ️  Install pypdf for incremental rebuilds: pip install pypdf")
+        state = None
+
+    if (state is None or state.get('salt') != salt or not os.path.exists(doc.filename)
+            or _file_sha256(doc.filename) != state.get('pdf_sha256')):
+        return _full_build(doc, flowables, signatures, canvasmaker, salt)
+
+    old_signatures = state['signatures']
+    if old_signatures == signatures:
+        return 'unchanged', state['page_count']
+
+    first_changed = next((i for i, (old, new) in enumerate(zip(old_signatures, signatures)) if old != new),
+                         min(len(old_signatures), len(signatures)))
+    restart = _restart_page(state, first_changed)
+    if restart is None:
+        return _full_build(doc, flowables, signatures, canvasmaker, salt)
+    restart_page, restart_index = restart
+    kept_pages = restart_page - 1
+
+    # Re-flow the tail of the story on its own, numbered as if it followed the kept pages
+    tail_canvas = type(canvasmaker.__name__, (canvasmaker,), {'page_offset': kept_pages})
+    tail_buffer = io.BytesIO()
+    tail_doc = doc.copy_to(tail_buffer)
+    tail = flowables[restart_index:]
+    tail_doc.track(tail, first_index=restart_index)
+    tail_doc.build(list(tail), canvasmaker=tail_canvas)
+
+    page_count = kept_pages + tail_doc.page
+    if getattr(canvasmaker, 'shows_page_count', True) and page_count != state['page_count']:
+        # Kept pages print the old "of N" total
+        return _full_build(doc, flowables, signatures, canvasmaker, salt)
+
+    with open(doc.filename, 'rb') as f:
+        previous = PdfReader(io.BytesIO(f.read()))
+    writer = PdfWriter()
+    for page in previous.pages[:kept_pages]:
+        writer.add_page(page)
+    for page in PdfReader(tail_buffer).pages:
+        writer.add_page(page)
+    writer.add_metadata({'/Title': str(doc.title), '/Author': str(doc.author)})
+    with open(doc.filename, 'wb') as f:
+        writer.write(f)
+
+    page_starts = {int(page): index for page, index in state['page_starts'].items() if int(page) < restart_page}
+    page_starts.update({page + kept_pages: index for page, index in tail_doc.page_starts.items()})
+    _save_state(doc.filename, signatures, page_starts, page_count, salt)
+    print(f"♻️  Reused {kept_pages} pages, re-flowed {page_count - kept_pages} from page {restart_page}")
+    return 'incremental', page_count
+
+# 4. SELF-CHECK
+
+def self_check():
+    """Build a throwaway report twice, editing only its last section; the second build must be partial"""
+    import tempfile
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import PageBreak, Paragraph
+    from page_decoration import NumberedCanvas
+
+    styles = getSampleStyleSheet()
+
+    def story(closing):
+        flowables = []
+        for section in range(4):
+            flowables.append(Paragraph(f'Section {section + 1}', styles['Heading1']))
+            flowables.extend(Paragraph(f'Paragraph {section + 1}.{i + 1} ' + 'lorem ipsum dolor sit amet ' * 8,
+                                       styles['BodyText']) for i in range(20))
+            flowables.append(PageBreak())
+        flowables.append(Paragraph(closing, styles['BodyText']))
+        return flowables
+
+    global STATE_DIR
+    saved_state_dir = STATE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        STATE_DIR = os.path.join(tmp, 'layout')
+        try:
+            pdf_path = os.path.join(tmp, 'check.pdf')
+            first, _ = build(TrackingDocTemplate(pdf_path), story('Closing remarks.'), NumberedCanvas)
+            second, _ = build(TrackingDocTemplate(pdf_path), story('Revised closing remarks.'), NumberedCanvas)
+        finally:
+            STATE_DIR = saved_state_dir
+    if (first, second) != ('full', 'incremental'):
+        raise AssertionError(f"Editing the last section gave a {second!r} rebuild (first build: {first!r})")
+    return second
+
+if __name__ == "__main__":
+    self_check()
+    print("✅ Editing only the last section re-flows just the tail pages")
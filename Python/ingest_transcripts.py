@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Transcript ingestion: OneDrive zips and loose files -> one Parquet corpus
+Interview transcripts are read straight out of the OneDrive zip archives
+(nothing is extracted to disk), document.xml is parsed incrementally with
+iterparse, and every document is handled in a process pool. The output is
+one row per utterance in a columnar corpus the analysis scripts query.
+Duplicate copies of an interview are grouped by dedup_transcripts; each row
+carries its interview_id and whether it comes from the canonical source.
+
+Usage:
+    python ingest_transcripts.py                 # scan cap-data, write the corpus
+    python ingest_transcripts.py --workers 8
+    python ingest_transcripts.py --list          # show what would be ingested
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from xml.etree.ElementTree import iterparse
+
+import dedup_transcripts
+
+CAP_DATA = '/Users/jefffranzen/cap-data'
+CORPUS_DIR = f'{CAP_DATA}/corpus'
+CORPUS_PATH = f'{CORPUS_DIR}/transcripts.parquet'
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+TRANSCRIPT_EXTENSIONS = ('.docx', '.pdf')
+
+# Loose transcript files; analysis and codebook PDFs have spaces in their names
+TRANSCRIPT_NAME = re.compile(r'^(Transcript|CAP_Staff|CAP_Partner|CAP_CommunityStakeholder|Community_Stakeholder|Region_Chapter)')
+
+# "00:03:41 Respondent" starts an utterance; the following lines are its text
+SPEAKER_LINE = re.compile(r'^(?P<h>\d{1,2}):(?P<m>\d{2}):(?P<s>\d{2})\s+(?P<speaker>\S.{0,60})$')
+
+# Filename metadata
+ROLES = [
+    (re.compile(r'CAP_Staff'), 'CAP Staff'),
+    (re.compile(r'CAP_Partner'), 'CAP Partner'),
+    (re.compile(r'Region_Chapter'), 'Region/Chapter'),
+    (re.compile(r'Community_?Stakeholder'), 'Community Stakeholder'),
+]
+DR_CODE = re.compile(r'DRO?(\d{3})(?:[-_](\d{2}))?')
+INTERVIEW_DATE = re.compile(r'(20\d{2})_(\d{2})_?(\d{2})')
+
+# Transcribers label speakers inconsistently ("Interviewer 2", "Respodent", "SPK_1")
+INTERVIEWER_SPEAKER = re.compile(r'^interview', re.IGNORECASE)
+RESPONDENT_SPEAKER = re.compile(r'^resp', re.IGNORECASE)
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Corpus columns, in order
+COLUMNS = ['doc_id', 'interview_id', 'canonical', 'collection', 'source', 'member', 'file_name', 'format',
+           'role', 'dr_code', 'interview_date', 'utterance', 'start_seconds', 'speaker', 'speaker_role', 'text']
+
+# Filled in after every document is parsed, once duplicates are grouped
+DEDUP_COLUMNS = ('interview_id', 'canonical')
+
+# 1. DISCOVERY
+
+def find_sources(root=CAP_DATA):
+    """
+    Jobs as (path, member): every transcript inside each zip, plus loose
+    transcript files. Folders that are extracted copies of a zip are skipped.
+    """
+    jobs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames
+                             if not d.startswith('.') and d not in ('Python', 'corpus')
+                             and f'{d}.zip' not in filenames)
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if name.lower().endswith('.zip'):
+                with zipfile.ZipFile(path) as archive:
+                    for member in archive.namelist():
+                        if member.lower().endswith(TRANSCRIPT_EXTENSIONS) and not os.path.basename(member).startswith('~$'):
+                            jobs.append((path, member))
+            elif name.lower().endswith(TRANSCRIPT_EXTENSIONS) and TRANSCRIPT_NAME.match(name):
+                jobs.append((path, None))
+    return jobs
+
+# 2. PARSING
+
+def docx_lines(data):
+    """Stream the text lines of a .docx; runs are joined, breaks and paragraphs end lines"""
+    with zipfile.ZipFile(io.BytesIO(data)) as docx:
+        with docx.open('word/document.xml') as xml:
+            line = []
+            for _, elem in iterparse(xml, events=('end',)):
+                tag = elem.tag
+                if tag == f'{W}t':
+                    line.append(elem.text or '')
+                elif tag == f'{W}tab':
+                    line.append('\t')
+                elif tag in (f'{W}br', f'{W}cr', f'{W}p'):
+                    yield ''.join(line)
+                    line = []
+                if tag in (f'{W}r', f'{W}p'):
+                    # Runs are fully consumed; drop them so memory stays flat
+                    elem.clear()
+            if line:
+                yield ''.join(line)
+
+def pdf_lines(data):
+    """Text lines of a PDF transcript (needs pypdf)"""
+    from pypdf import PdfReader
+    for page in PdfReader(io.BytesIO(data)).pages:
+        yield from (page.extract_text() or '').splitlines()
+
+def utterances(lines):
+    """Group lines into (start_seconds, speaker, text) utterances"""
+    start = speaker = None
+    text = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        match = SPEAKER_LINE.match(line)
+        if match:
+            if speaker is not None and text:
+                yield start, speaker, ' '.join(text)
+            start = int(match['h']) * 3600 + int(match['m']) * 60 + int(match['s'])
+            speaker = match['speaker'].strip()
+            text = []
+        elif speaker is not None:
+            text.append(line)
+    if speaker is not None and text:
+        yield start, speaker, ' '.join(text)
+
+def file_metadata(file_name):
+    """Interviewee role, DR code and interview date from the transcript's file name"""
+    role = next((label for pattern, label in ROLES if pattern.search(file_name)), None)
+    if role is None and 'Steady_State' in file_name:
+        role = 'CAP Staff'
+    dr = DR_CODE.search(file_name)
+    dr_code = None
+    if dr:
+        dr_code = f'DR{dr.group(1)}-{dr.group(2)}' if dr.group(2) else f'DR{dr.group(1)}'
+    elif 'Steady_State' in file_name:
+        dr_code = 'Steady State'
+    date = INTERVIEW_DATE.search(file_name)
+    interview_date = f'{date.group(1)}-{date.group(2)}-{date.group(3)}' if date else None
+    return role, dr_code, interview_date
+
+def speaker_role(speaker):
+    """'Interviewer', 'Respondent' or None when the label doesn't say"""
+    if INTERVIEWER_SPEAKER.match(speaker):
+        return 'Interviewer'
+    if RESPONDENT_SPEAKER.match(speaker):
+        return 'Respondent'
+    return None
+
+def _collection(path, root):
+    """Top-level cap-data folder a source lives in, e.g. 'HURRICANE FRANCINE'"""
+    relative = os.path.relpath(path, root)
+    return relative.split(os.sep)[0] if os.sep in relative else ''
+
+def _label(job):
+    path, member = job
+    return f"{os.path.basename(path)}:{member}" if member else os.path.basename(path)
+
+def ingest_document(job, root=CAP_DATA):
+    """
+    Parse one transcript; returns (columns dict, error)
+    Runs in a worker process: opens the archive itself and reads one member.
+    """
+    path, member = job
+    try:
+        if member is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        else:
+            with zipfile.ZipFile(path) as archive:
+                data = archive.read(member)
+
+        file_name = os.path.basename(member or path)
+        fmt = file_name.rsplit('.', 1)[-1].lower()
+        lines = docx_lines(data) if fmt == 'docx' else pdf_lines(data)
+        rows = list(utterances(lines))
+    except ImportError:
+        return None, 'pypdf not installed (pip install pypdf)'
+    except Exception as e:
+        return None, str(e)
+
+    role, dr_code, interview_date = file_metadata(file_name)
+    n = len(rows)
+    columns = {
+        'doc_id': [hashlib.sha256(data).hexdigest()] * n,
+        'collection': [_collection(path, root)] * n,
+        'source': [path] * n,
+        'member': [member] * n,
+        'file_name': [file_name] * n,
+        'format': [fmt] * n,
+        'role': [role] * n,
+        'dr_code': [dr_code] * n,
+        'interview_date': [interview_date] * n,
+        'utterance': list(range(n)),
+        'start_seconds': [start for start, _, _ in rows],
+        'speaker': [speaker for _, speaker, _ in rows],
+        'speaker_role': [speaker_role(speaker) for _, speaker, _ in rows],
+        'text': [text for _, _, text in rows],
+    }
+    return columns, None
+
+# 3. CORPUS
+
+def ingest(root=CAP_DATA, workers=DEFAULT_WORKERS, corpus_path=CORPUS_PATH):
+    """Ingest every transcript under root into a Parquet corpus; returns a summary dict"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("❌ The transcript corpus needs pyarrow: pip install pyarrow")
+        return None
+
+    jobs, exact = dedup_transcripts.drop_exact_duplicates(find_sources(root))
+    for skipped, kept in exact.items():
+        print(f"♻️  {_label(skipped)} - same bytes as {_label(kept)}")
+
+    merged = {column: [] for column in COLUMNS if column not in DEDUP_COLUMNS}
+    documents = {}
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for job, (columns, error) in zip(jobs, pool.map(partial(ingest_document, root=root), jobs, chunksize=4)):
+            label = _label(job)
+            if error:
+                failed += 1
+                print(f"❌ {label} - {error}")
+                continue
+            if not columns['text']:
+                print(f"⚠️  {label} - no timestamped utterances found")
+                continue
+            documents[columns['doc_id'][0]] = {
+                'label': label,
+                'file_name': columns['file_name'][0],
+                'format': columns['format'][0],
+                'utterances': len(columns['text']),
+                'texts': columns['text'],
+            }
+            for column in merged:
+                merged[column].extend(columns[column])
+
+    assignments, index = dedup_transcripts.build_index(
+        documents, {_label(skipped): _label(kept) for skipped, kept in exact.items()})
+    merged['interview_id'] = [assignments[doc_id][0] for doc_id in merged['doc_id']]
+    merged['canonical'] = [assignments[doc_id][1] for doc_id in merged['doc_id']]
+
+    table = pa.table({
+        **{column: pa.array(merged[column], type=pa.string()) for column in COLUMNS
+           if column not in ('canonical', 'utterance', 'start_seconds')},
+        'canonical': pa.array(merged['canonical'], type=pa.bool_()),
+        'utterance': pa.array(merged['utterance'], type=pa.int32()),
+        'start_seconds': pa.array(merged['start_seconds'], type=pa.int32()),
+    }).select(COLUMNS)
+
+    os.makedirs(os.path.dirname(corpus_path), exist_ok=True)
+    tmp_path = f'{corpus_path}.{os.getpid()}.tmp'
+    pq.write_table(table, tmp_path, compression='zstd',
+                   use_dictionary=['collection', 'source', 'member', 'file_name', 'format',
+                                   'role', 'dr_code', 'interview_date', 'speaker', 'speaker_role', 'doc_id',
+                                   'interview_id'])
+    os.replace(tmp_path, corpus_path)
+    dedup_transcripts.save_index(index, os.path.join(os.path.dirname(corpus_path), 'dedup_index.json'))
+    return {'sources': len(jobs) + len(exact), 'documents': len(documents), 'interviews': index['interviews'],
+            'failed': failed, 'utterances': table.num_rows}
+
+def load_corpus(columns=None, corpus_path=CORPUS_PATH, canonical_only=False, doc_ids=None):
+    """
+    Read the corpus as a pyarrow Table, optionally only some columns, one
+    source per interview (canonical_only) or the rows of some documents
+    """
+    import pyarrow.parquet as pq
+    filters = []
+    if canonical_only:
+        filters.append(('canonical', '=', True))
+    if doc_ids is not None:
+        filters.append(('doc_id', 'in', list(doc_ids)))
+    return pq.read_table(corpus_path, columns=columns, filters=filters or None)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Ingest interview transcripts into a Parquet corpus')
+    parser.add_argument('--root', default=CAP_DATA, help='folder to scan for zips and transcripts')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='parallel parser processes')
+    parser.add_argument('--list', action='store_true', help='list sources without ingesting')
+    args = parser.parse_args()
+
+    if args.list:
+        for path, member in find_sources(args.root):
+            print(f"  {os.path.relpath(path, args.root)}" + (f" :: {member}" if member else ''))
+        raise SystemExit(0)
+
+    print("\n📚 Ingesting transcripts...\n")
+    start = time.perf_counter()
+    summary = ingest(args.root, workers=args.workers)
+    if summary:
+        print(f"\n✅ {summary['documents']} of {summary['sources']} transcripts "
+              f"({summary['interviews']} interviews), "
+              f"{summary['utterances']:,} utterances in {time.perf_counter() - start:.1f}s")
+        print(f"📄 Corpus: {CORPUS_PATH}")
+
+        # Keep quote search in step with the corpus; only new documents are tokenized
+        import transcript_index
+        added, removed = transcript_index.update()
+        print(f"🗂️  Search index: +{added} / -{removed} documents ({transcript_index.INDEX_PATH})")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Large-data trace selection for the scatter and density charts
+Below the threshold charts keep their SVG traces. Above it, point traces
+switch to WebGL (Scattergl / Scatterpolargl), contours are drawn from counts
+binned with NumPy instead of shipping every point to the browser, and point
+overlays past the raster threshold become a binned count raster.
+
+Thresholds come from the environment so real service records can be fed in
+without code changes:
+    CAP_LARGE_DATA_THRESHOLD=5000    # points before switching to WebGL / pre-binning
+    CAP_RASTER_THRESHOLD=200000      # points before overlays become a raster
+"""
+
+import os
+
+import numpy as np
+
+LARGE_DATA_THRESHOLD = int(os.environ.get('CAP_LARGE_DATA_THRESHOLD', '5000'))
+RASTER_THRESHOLD = int(os.environ.get('CAP_RASTER_THRESHOLD', '200000'))
+
+# Grid used for pre-binned contours and for overlay rasters
+CONTOUR_BINS = 80
+RASTER_BINS = (400, 300)
+
+def is_large(n_points):
+    return n_points > LARGE_DATA_THRESHOLD
+
+def render_mode(n_points):
+    """render_mode for plotly.express scatter charts"""
+    return 'webgl' if is_large(n_points) else 'svg'
+
+def scatter(x, y, **kwargs):
+    """go.Scatter, or go.Scattergl above the threshold"""
+    import plotly.graph_objects as go
+    trace = go.Scattergl if is_large(len(x)) else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+def scatterpolar(r, theta, **kwargs):
+    """go.Scatterpolar, or go.Scatterpolargl above the threshold"""
+    import plotly.graph_objects as go
+    trace = go.Scatterpolargl if is_large(len(r)) else go.Scatterpolar
+    return trace(r=r, theta=theta, **kwargs)
+
+def binned_counts(x, y, bins=CONTOUR_BINS):
+    """Bin centers and a (y, x) count grid, ready for Contour/Heatmap z"""
+    counts, x_edges, y_edges = np.histogram2d(np.asarray(x), np.asarray(y), bins=bins)
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts.T
+
+def density_contour(x, y, bins=CONTOUR_BINS, **kwargs):
+    """go.Histogram2dContour, or a go.Contour over pre-binned counts above the threshold"""
+    import plotly.graph_objects as go
+    if not is_large(len(x)):
+        return go.Histogram2dContour(x=x, y=y, **kwargs)
+    x_centers, y_centers, counts = binned_counts(x, y, bins)
+    return go.Contour(x=x_centers, y=y_centers, z=counts, **kwargs)
+
+def density_points(x, y, **kwargs):
+    """
+    Point overlay for a density chart: markers (SVG or WebGL), or past
+    RASTER_THRESHOLD a log-scaled count raster with empty cells left clear
+    """
+    import plotly.graph_objects as go
+    if len(x) <= RASTER_THRESHOLD:
+        return scatter(x, y, mode='markers', **kwargs)
+    x_centers, y_centers, counts = binned_counts(x, y, RASTER_BINS)
+    return go.Heatmap(
+        x=x_centers, y=y_centers,
+        z=np.where(counts > 0, np.log1p(counts), np.nan),
+        colorscale=[[0, 'rgba(0,0,0,0.15)'], [1, 'rgba(0,0,0,0.6)']],
+        showscale=False,
+        hoverinfo='skip',
+        showlegend=kwargs.get('showlegend', False)
+    )
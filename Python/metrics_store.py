@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Central store for the CAP report's headline numbers
+ROI, cost containment and uptake figures live in one SQLite table instead of
+being typed into every chart and PDF builder. Reads go through an in-process
+snapshot that is memoized on the database's mtime, so a chart build costs one
+query no matter how many numbers it pulls. Builders run under recording() in
+the chart registry, which keeps the values each chart read; changing a number
+rebuilds only the charts that used it.
+
+Usage:
+    python metrics_store.py                          # list every metric
+    python metrics_store.py set roi.overall 28.4     # change one value
+    python metrics_store.py --reset                  # restore the defaults below (drops extracted metrics)
+"""
+
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+
+METRICS_DB = '/Users/jefffranzen/cap-data/metrics.db'
+
+# (key, series, label, value, unit, source); series rows keep this order
+DEFAULT_METRICS = [
+    ('roi.overall', None, 'Overall Program ROI', 28.30, 'percent', 'CAP ROI analysis FY23-25'),
+    ('investment.partner', None, 'Partner Investment', 5670000, 'dollars', 'CAP ROI analysis FY23-25'),
+
+    ('roi.disaster.hurricane', 'roi_by_disaster', 'Hurricane', 37.30, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.disaster.flooding', 'roi_by_disaster', 'Flooding', 25.53, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.disaster.tornado', 'roi_by_disaster', 'Tornado', 9.77, 'percent', 'CAP ROI analysis FY23-25'),
+
+    ('roi.partner.resilience_hub', 'roi_by_partner', 'Resilience Hub', 33.48, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.partner.community_gateway', 'roi_by_partner', 'Community Gateway', 30.11, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.partner.hunger', 'roi_by_partner', 'Hunger Partners', 26.33, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.partner.health', 'roi_by_partner', 'Health Partners', 22.99, 'percent', 'CAP ROI analysis FY23-25'),
+    ('roi.partner.housing', 'roi_by_partner', 'Housing Partners', 4.91, 'percent', 'CAP ROI analysis FY23-25'),
+
+    ('cost_containment.total', None, 'Total Documented Savings', 1606305, 'dollars', 'DRO cost containment reports'),
+    ('cost_containment.francine', None, 'Hurricane Francine', 243237, 'dollars', 'DRO cost containment reports'),
+    ('cost_containment.other_dros', None, 'Other DROs', 1157768, 'dollars', 'DRO cost containment reports'),
+
+    ('ia.completion.cap', None, 'IA Completion Rate (Terrebonne Parish)', 93.0, 'percent', 'Hurricane Francine IA data'),
+    ('ia.completion.overall', None, 'IA Completion Rate (overall)', 67.0, 'percent', 'Hurricane Francine IA data'),
+    ('ia.completion.tn_tornados.cap', None, 'IA Completion Rate (McNairy County)', 80.7, 'percent', 'TN Tornados IA data'),
+    ('ia.completion.tn_tornados.overall', None, 'IA Completion Rate (TN overall)', 75.3, 'percent', 'TN Tornados IA data'),
+    ('ia.completion.ky_floods.cap', None, 'IA Completion Rate (Warren County)', 53.8, 'percent', 'KY Floods IA data'),
+    ('ia.completion.ky_floods.overall', None, 'IA Completion Rate (KY overall)', 34.3, 'percent', 'KY Floods IA data'),
+    ('ia.completion.south_tx_floods.cap', None, 'IA Completion Rate (Cameron/Hidalgo)', 58.3, 'percent', 'South TX Floods IA data'),
+    ('ia.completion.south_tx_floods.overall', None, 'IA Completion Rate (South TX overall)', 51.0, 'percent', 'South TX Floods IA data'),
+
+    ('volunteers.growth', None, 'Volunteer Engagement Increase', 35.92, 'percent', 'Volunteer Connection'),
+    ('volunteers.growth.national', None, 'Volunteer Engagement Increase (national)', 16.05, 'percent', 'Volunteer Connection'),
+    ('homes_safer.growth', None, 'Homes Made Safer Increase', 66.24, 'percent', 'Home Fire Campaign data'),
+    ('homes_safer.growth.national', None, 'Homes Made Safer Increase (national)', 14.02, 'percent', 'Home Fire Campaign data'),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    key      TEXT PRIMARY KEY,
+    series   TEXT,
+    position INTEGER NOT NULL,
+    label    TEXT NOT NULL,
+    value    REAL NOT NULL,
+    unit     TEXT NOT NULL CHECK (unit IN ('percent', 'dollars', 'count', 'days')),
+    source   TEXT
+)
+"""
+
+class Metric:
+    """One stored number with its display label, unit and provenance"""
+    __slots__ = ('key', 'series', 'label', 'value', 'unit', 'source')
+
+    def __init__(self, key, series, label, value, unit, source):
+        self.key = key
+        self.series = series
+        self.label = label
+        self.value = value
+        self.unit = unit
+        self.source = source
+
+    def __repr__(self):
+        return f'Metric({self.key!r}, {self.value!r} {self.unit})'
+
+# 1. STORAGE
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute(SCHEMA)
+    return connection
+
+def reset(path=METRICS_DB):
+    """Write DEFAULT_METRICS to the store, replacing any edited values"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _connect(path) as connection:
+        connection.execute('DELETE FROM metrics')
+        connection.executemany(
+            'INSERT INTO metrics (key, series, position, label, value, unit, source) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(key, series, position, label, value, unit, source)
+             for position, (key, series, label, value, unit, source) in enumerate(DEFAULT_METRICS)])
+    connection.close()
+
+def store(rows, path=METRICS_DB, replace_series=()):
+    """
+    Add or update (key, series, label, value, unit, source) rows that come from
+    elsewhere than DEFAULT_METRICS (e.g. pdf_extract); new keys go after the rest.
+    Every row of the replace_series series is dropped first, in the same transaction.
+    """
+    if not os.path.exists(path):
+        reset(path)
+    with _connect(path) as connection:
+        connection.executemany('DELETE FROM metrics WHERE series = ?', [(name,) for name in replace_series])
+        position = connection.execute('SELECT COALESCE(MAX(position), -1) FROM metrics').fetchone()[0]
+        for offset, (key, series, label, value, unit, source) in enumerate(rows, 1):
+            connection.execute(
+                'INSERT INTO metrics (key, series, position, label, value, unit, source) VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET series = excluded.series, label = excluded.label, '
+                'value = excluded.value, unit = excluded.unit, source = excluded.source',
+                (key, series, position + offset, label, value, unit, source))
+    connection.close()
+
+def set_value(key, value, path=METRICS_DB):
+    """Change one stored number; the next read in any process sees it"""
+    with _connect(path) as connection:
+        updated = connection.execute('UPDATE metrics SET value = ? WHERE key = ?', (float(value), key)).rowcount
+    connection.close()
+    if not updated:
+        raise KeyError(f"Unknown metric: {key}")
+
+# 2. READS
+
+@lru_cache(maxsize=4)
+def _snapshot(path, mtime_ns, size):
+    """Every metric keyed by name; memoized until the database file changes"""
+    connection = _connect(path)
+    try:
+        rows = connection.execute(
+            'SELECT key, series, label, value, unit, source FROM metrics ORDER BY position').fetchall()
+    finally:
+        connection.close()
+    return {row[0]: Metric(*row) for row in rows}
+
+def _add_missing_defaults(path):
+    # Stores created before a default was added get it without losing edited values
+    with _connect(path) as connection:
+        connection.executemany(
+            'INSERT OR IGNORE INTO metrics (key, series, position, label, value, unit, source) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(key, series, position, label, value, unit, source)
+             for position, (key, series, label, value, unit, source) in enumerate(DEFAULT_METRICS)])
+    connection.close()
+
+def _metrics(path=METRICS_DB):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        reset(path)
+        stat = os.stat(path)
+    metrics = _snapshot(path, stat.st_mtime_ns, stat.st_size)
+    if any(key not in metrics for key, *_ in DEFAULT_METRICS):
+        _add_missing_defaults(path)
+        stat = os.stat(path)
+        metrics = _snapshot(path, stat.st_mtime_ns, stat.st_size)
+    return metrics
+
+# Active recording() dicts; every read is logged into each of them
+_recorders = []
+
+@contextmanager
+def recording():
+    """Collect {key: value} for every metric read inside the block"""
+    reads = {}
+    _recorders.append(reads)
+    try:
+        yield reads
+    finally:
+        _recorders.remove(reads)
+
+def metric(key):
+    """The Metric for key; raises KeyError for unknown keys"""
+    found = _metrics().get(key)
+    if found is None:
+        raise KeyError(f"Unknown metric: {key}")
+    for reads in _recorders:
+        reads[key] = found.value
+    return found
+
+def value(key):
+    return metric(key).value
+
+def series(name):
+    """(labels, values) for a series, in stored order"""
+    members = [metric(key) for key, found in _metrics().items() if found.series == name]
+    if not members:
+        raise KeyError(f"Unknown metric series: {name}")
+    return [m.label for m in members], [m.value for m in members]
+
+def current_values(keys):
+    """{key: value} without recording, or None for keys no longer stored"""
+    metrics = _metrics()
+    return {key: metrics[key].value if key in metrics else None for key in keys}
+
+# 3. FORMATTING
+
+def percent(key, digits=1):
+    """'28.3%'"""
+    return f'{value(key):.{digits}f}%'
+
+def dollars(key):
+    """'$1,606,305'"""
+    return f'${value(key):,.0f}'
+
+def millions(key, digits=1):
+    """'$1.6M'"""
+    return f'${value(key) / 1e6:.{digits}f}M'
+
+def _display(found):
+    if found.unit == 'percent':
+        return f'{found.value:.2f}%'
+    if found.unit == 'dollars':
+        return f'${found.value:,.0f}'
+    return f'{found.value:g} {found.unit}'
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args == ['--reset']:
+        reset()
+        print(f"✅ Restored {len(DEFAULT_METRICS)} default metrics in {METRICS_DB}")
+    elif len(args) == 3 and args[0] == 'set':
+        set_value(args[1], args[2])
+        print(f"✅ {args[1]} = {args[2]}")
+        print("   Run: python chart_registry.py   # rebuilds only the charts that use it")
+    elif args:
+        print(__doc__)
+        raise SystemExit(1)
+    else:
+        print(f"📊 Metrics store: {METRICS_DB}\n")
+        for found in _metrics().values():
+            print(f"  {found.key:32} {_display(found):>14}  {found.label}")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Network chart engine for the partner graphs
+Edges are drawn as one line trace whose coordinates are written into
+preallocated NumPy buffers (x0, x1, NaN per edge), so building the trace is
+linear in the number of edges. Layouts come from a vectorized
+Fruchterman-Reingold pass and are cached on disk by graph content, so a
+coalition graph with thousands of nodes is only laid out once.
+
+Usage:
+    python network_charts.py                      # lay out the partner graph
+    python network_charts.py edges.csv --iterations 100
+"""
+
+import csv
+import hashlib
+import os
+
+import numpy as np
+
+PARTNER_GRAPH_CSV = '/Users/jefffranzen/cap-data/partner_network.csv'
+LAYOUT_CACHE_DIR = '/Users/jefffranzen/cap-data/.layout_cache'
+
+# Rows of the pairwise repulsion matrix computed at once (chunk x n x 2 floats)
+REPULSION_CHUNK = 256
+LAYOUT_ITERATIONS = 50
+
+class Graph:
+    """Node labels plus an (m, 2) array of edges given as node indices"""
+    def __init__(self, labels, edges, weights=None):
+        self.labels = list(labels)
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.weights = np.ones(len(self.edges)) if weights is None else np.asarray(weights, dtype=float)
+
+    @property
+    def n_nodes(self):
+        return len(self.labels)
+
+    def degree(self):
+        return np.bincount(self.edges.ravel(), minlength=self.n_nodes)
+
+    def fingerprint(self):
+        digest = hashlib.sha256('\n'.join(self.labels).encode('utf-8'))
+        digest.update(self.edges.tobytes())
+        digest.update(self.weights.tobytes())
+        return digest.hexdigest()[:24]
+
+# 1. GRAPHS
+
+def load_edge_list(path):
+    """CSV with source,target[,weight] columns -> Graph"""
+    index = {}
+    edges = []
+    weights = []
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            pair = []
+            for label in (row['source'].strip(), row['target'].strip()):
+                if label not in index:
+                    index[label] = len(index)
+                pair.append(index[label])
+            edges.append(pair)
+            weights.append(float(row.get('weight') or 1))
+    return Graph(list(index), edges, weights)
+
+def demo_graph(n_nodes=30, span=3):
+    """Red Cross plus partners, each linked to the next few partners"""
+    labels = ['Red Cross'] + [f'Partner {i}' for i in range(1, n_nodes)]
+    edges = [(i, j) for i in range(n_nodes) for j in range(i + 1, min(i + span + 1, n_nodes))]
+    return Graph(labels, edges)
+
+def partner_graph():
+    """The real coalition graph when its edge list exists, otherwise the demo graph"""
+    if os.path.exists(PARTNER_GRAPH_CSV):
+        return load_edge_list(PARTNER_GRAPH_CSV)
+    return demo_graph()
+
+# 2. EDGES
+
+def edge_segments(positions, edges):
+    """
+    x and y arrays for a single line trace: (x0, x1, NaN) per edge
+    Plotly breaks the line at each NaN, so one trace draws every edge.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    segments = np.full((2, len(edges), 3), np.nan)
+    segments[:, :, 0] = positions[edges[:, 0]].T
+    segments[:, :, 1] = positions[edges[:, 1]].T
+    return segments[0].ravel(), segments[1].ravel()
+
+# 3. LAYOUT
+
+def force_layout(graph, iterations=LAYOUT_ITERATIONS, seed=42):
+    """
+    Fruchterman-Reingold layout in [-1, 1]^2
+    Repulsion is computed in row chunks so memory stays bounded for large graphs.
+    """
+    n = graph.n_nodes
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-1, 1, (n, 2))
+    if n < 2:
+        return positions
+
+    k = np.sqrt(4.0 / n)   # ideal edge length for the 2x2 box
+    temperature = 0.2
+    cooling = temperature / (iterations + 1)
+    sources, targets = graph.edges[:, 0], graph.edges[:, 1]
+
+    for _ in range(iterations):
+        displacement = np.zeros((n, 2))
+
+        # Repulsion between every pair: k^2 / d along the separating vector
+        for start in range(0, n, REPULSION_CHUNK):
+            block = positions[start:start + REPULSION_CHUNK]
+            delta = block[:, None, :] - positions[None, :, :]
+            dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+            displacement[start:start + len(block)] += (delta * (k * k / dist2)[:, :, None]).sum(axis=1)
+
+        # Attraction along edges: d^2 / k
+        delta = positions[sources] - positions[targets]
+        dist = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * (dist / k * graph.weights)[:, None]
+        np.add.at(displacement, sources, -pull)
+        np.add.at(displacement, targets, pull)
+
+        # Move each node at most `temperature`, cooling every iteration
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    positions -= positions.mean(axis=0)
+    return positions / max(np.abs(positions).max(), 1e-9)
+
+def cached_layout(graph, iterations=LAYOUT_ITERATIONS, seed=42):
+    """force_layout, cached in LAYOUT_CACHE_DIR by graph content and parameters"""
+    path = os.path.join(LAYOUT_CACHE_DIR, f'{graph.fingerprint()}_{iterations}_{seed}.npz')
+    try:
+        with np.load(path) as cached:
+            return cached['positions']
+    except (OSError, KeyError, ValueError):
+        pass
+
+    positions = force_layout(graph, iterations, seed)
+    os.makedirs(LAYOUT_CACHE_DIR, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, positions=positions)
+    os.replace(tmp_path, path)
+    return positions
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Lay out a partner network and cache the result')
+    parser.add_argument('edges', nargs='?', default=None, help=f'edge list CSV (default: {PARTNER_GRAPH_CSV})')
+    parser.add_argument('--iterations', type=int, default=LAYOUT_ITERATIONS)
+    args = parser.parse_args()
+
+    graph = load_edge_list(args.edges) if args.edges else partner_graph()
+    print(f"🕸️  {graph.n_nodes} nodes, {len(graph.edges)} edges")
+    start = time.perf_counter()
+    cached_layout(graph, iterations=args.iterations)
+    print(f"✅ Layout ready in {time.perf_counter() - start:.2f}s ({LAYOUT_CACHE_DIR})")
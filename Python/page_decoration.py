@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Shared page decoration for the PDF builders
+Headers and "Page X of Y" footers are drawn into one small PDF form per page.
+Each page only references its form when it is finished; the forms are filled
+in at save() time once the page count is known. No per-page canvas state is
+kept, so memory stays flat regardless of report length.
+"""
+
+from reportlab.pdfgen import canvas
+
+class NumberedCanvas(canvas.Canvas):
+    """
+    Canvas base class for page numbers and headers
+
+    Subclasses implement draw_page_number(page_num, page_count) and draw
+    with the usual canvas calls; the output lands in that page's form.
+    """
+    # Pages that precede this canvas's first page (set for partial rebuilds)
+    page_offset = 0
+    # False when the decoration never shows the total page count
+    shows_page_count = True
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._decorated_pages = 0
+
+    def showPage(self):
+        # Reference the (not yet defined) decoration form, then flush the page
+        self._decorated_pages += 1
+        self.saveState()
+        self.doForm(self._decoration_form(self._decorated_pages))
+        self.restoreState()
+        canvas.Canvas.showPage(self)
+
+    def save(self):
+        """Fill in every page's decoration now that the page count is known"""
+        page_count = self._decorated_pages
+        for page_num in range(1, page_count + 1):
+            self.beginForm(self._decoration_form(page_num))
+            self.draw_page_number(page_num + self.page_offset, page_count + self.page_offset)
+            self.endForm()
+        canvas.Canvas.save(self)
+
+    @staticmethod
+    def _decoration_form(page_num):
+        return f'PageDecoration{page_num}'
+
+    def draw_page_number(self, page_num, page_count):
+        """Draw the header/footer for one page; override in each builder"""
+        pass
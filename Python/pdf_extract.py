@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Cached page-level text and table extraction for the analysis and codebook PDFs
+Pages of every PDF that isn't cached yet are spread over a worker pool, and
+each page keeps its plain text plus positioned text runs (y, x, text) so
+tables can be rebuilt from coordinates. Results are cached under the file's
+SHA-256, so a re-run only opens PDFs that are new or have changed. The
+sentiment grids in the per-disaster analyses are loaded into metrics_store.
+
+Usage:
+    python pdf_extract.py                     # extract the analyses, load their metrics
+    python pdf_extract.py --workers 4 --no-metrics
+    python pdf_extract.py some.pdf other.pdf  # extract (and cache) any PDFs
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ingest_transcripts
+import metrics_store
+
+CAP_DATA = ingest_transcripts.CAP_DATA
+CACHE_DIR = f'{ingest_transcripts.CORPUS_DIR}/pdf_cache'
+DEFAULT_WORKERS = ingest_transcripts.DEFAULT_WORKERS
+
+ANALYSIS_PDFS = {
+    'ky_april_storms': f'{CAP_DATA}/KY APR Storn/Kentucky April Storms - Analysis 2025 09 17.pdf',
+    'south_texas_floods': f'{CAP_DATA}/South Texas Floods/South Texas Floods Analysis 2025 09 17.pdf',
+    'mo_ar_april_storms': f'{CAP_DATA}/MO AR Storms/MO AR April Storms Analysis 2025 0915.pdf',
+    'community_stakeholder': f'{CAP_DATA}/Community Stakeholder/Community Stakeholder Analysis 2025 09 18.pdf',
+    'tn_april_storms': f'{CAP_DATA}/TN April Storms/TN April Stoms.pdf',
+}
+
+SENTIMENT_TITLE = 'Appendix 1'
+POSITIVE = {'Positive', 'Very Positive'}
+# A column is an x where cells start on at least this many lines
+MIN_COLUMN_LINES = 3
+# Lines further apart than this many line steps belong to different cells
+CELL_GAP = 1.5
+
+# 1. EXTRACTION
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Each worker opens a PDF once, however many of its pages it is handed
+_READERS = {}
+
+def extract_page(job):
+    """{'text', 'fragments': [[y, x, text]]} for one page (needs pypdf)"""
+    from pypdf import PdfReader
+    path, index = job
+    if path not in _READERS:
+        _READERS[path] = PdfReader(path)
+    fragments = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            fragments.append([round(y, 1), round(x, 2), text])
+
+    text = _READERS[path].pages[index].extract_text(visitor_text=visit)
+    return {'text': text or '', 'fragments': fragments}
+
+def extract(paths, workers=DEFAULT_WORKERS, cache_dir=CACHE_DIR):
+    """
+    {path: [page dicts]}; only PDFs missing from the cache are parsed, page by page in a pool
+    PDFs that don't exist are skipped with a warning and left out of the result.
+    """
+    documents = {}
+    pending = {}
+    missing = [path for path in paths if not os.path.isfile(path)]
+    for path in missing:
+        print(f"⚠️  Skipped missing PDF: {path}")
+    paths = [path for path in paths if path not in missing]
+    for path in paths:
+        sha256 = file_sha256(path)
+        cached = f'{cache_dir}/{sha256}.json'
+        if os.path.exists(cached):
+            with open(cached, 'r', encoding='utf-8') as f:
+                documents[path] = json.load(f)['pages']
+        else:
+            pending[path] = sha256
+
+    if pending:
+        from pypdf import PdfReader
+        jobs = [(path, index) for path in pending for index in range(len(PdfReader(path).pages))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = pool.map(extract_page, jobs, chunksize=4)
+            for (path, _), page in zip(jobs, pages):
+                documents.setdefault(path, []).append(page)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        for path, sha256 in pending.items():
+            tmp_path = f'{cache_dir}/{sha256}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'path': path, 'sha256': sha256, 'pages': documents.setdefault(path, [])}, f)
+            os.replace(tmp_path, f'{cache_dir}/{sha256}.json')
+
+    print(f"📄 {len(paths)} PDFs: {len(paths) - len(pending)} cached, {len(pending)} extracted")
+    return {path: documents[path] for path in paths}
+
+def page_fragments(pages):
+    """Per-page (y, x, text) lists, the form the table readers below take"""
+    return [page['fragments'] for page in pages]
+
+# 2. TABLES
+
+def lines(fragments):
+    """[(y, [(x, text)])] top to bottom, runs on a line left to right"""
+    by_y = {}
+    for y, x, text in fragments:
+        by_y.setdefault(y, []).append((x, text))
+    return [(y, sorted(by_y[y])) for y in sorted(by_y, reverse=True)]
+
+def _cells(column_lines):
+    """Join a column's wrapped lines into (top y, bottom y, text) cells"""
+    # Cell padding makes the gap between cells wider than the line step inside one
+    gaps = [upper - lower for (upper, _), (lower, _) in zip(column_lines, column_lines[1:])]
+    step = min(gaps, default=0)
+    cells = []
+    continued = False
+    for i, (y, text) in enumerate(column_lines):
+        if continued and gaps[i - 1] <= CELL_GAP * step:
+            top, _, previous = cells[-1]
+            cells[-1] = (top, y, previous + text)
+        else:
+            cells.append((y, y, text))
+        # A wrapped line ends in a space or hyphen
+        continued = text.endswith((' ', '-'))
+    return [(top, bottom, ' '.join(text.split())) for top, bottom, text in cells]
+
+def titled_table(fragments, title):
+    """
+    Rows of cell strings (header first) for the grid under a title line
+    The grid runs down to the next line back at the title's margin. Cells may
+    wrap and be vertically centred, so the first column's cells mark the row
+    bands and every other cell joins the band holding its centre.
+    """
+    page_lines = [(y, runs) for y, runs in lines(fragments) if not ''.join(t for _, t in runs).strip().isdigit()]
+    start = next((i for i, (_, runs) in enumerate(page_lines) if runs[0][1].startswith(title)), None)
+    if start is None:
+        return []
+    margin = page_lines[start][1][0][0]
+    grid = []
+    for y, runs in page_lines[start + 1:]:
+        if runs[0][0] <= margin + 2:
+            break
+        grid.append((y, runs))
+
+    starts = {}
+    for y, runs in grid:
+        for x, _ in runs:
+            starts.setdefault(round(x), set()).add(y)
+    columns = sorted(x for x, ys in starts.items() if len(ys) >= MIN_COLUMN_LINES)
+    if not columns:
+        return []
+
+    column_lines = [[] for _ in columns]
+    for y, runs in grid:
+        texts = {}
+        for x, text in runs:
+            column = max((i for i, start in enumerate(columns) if start <= x + 2), default=0)
+            texts[column] = texts.get(column, '') + text
+        for column, text in texts.items():
+            column_lines[column].append((y, text))
+
+    bands = _cells(column_lines[0])
+    rows = [[band[2]] + [''] * (len(columns) - 1) for band in bands]
+    # Band edges sit halfway between one first-column cell and the next
+    edges = [(upper[1] + lower[0]) / 2 for upper, lower in zip(bands, bands[1:])]
+    for column in range(1, len(columns)):
+        for top, bottom, text in _cells(column_lines[column]):
+            centre = (top + bottom) / 2
+            row = sum(1 for edge in edges if centre < edge)
+            rows[row][column] = f'{rows[row][column]} {text}'.strip()
+    return rows
+
+def find_table(pages, title):
+    """titled_table() on the first page that has one"""
+    for fragments in page_fragments(pages):
+        rows = titled_table(fragments, title)
+        if rows:
+            return rows
+    return []
+
+# 3. ANALYSIS METRICS
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+def sentiment_metrics(disaster, path, pages):
+    """
+    metrics_store rows from an analysis's sentiment grid: for each theme, the
+    percent of stakeholder groups whose interviews read positive or very positive
+    """
+    rows = find_table(pages, SENTIMENT_TITLE)
+    metrics = []
+    for row in rows[1:]:
+        theme, ratings = row[0], [rating for rating in row[1:] if rating]
+        if not theme or not ratings:
+            continue
+        share = 100 * sum(rating in POSITIVE for rating in ratings) / len(ratings)
+        metrics.append((f'sentiment.{disaster}.{_slug(theme)}', f'sentiment_{disaster}', theme,
+                        round(share, 2), 'percent', f'{os.path.basename(path)}, {SENTIMENT_TITLE}'))
+    return metrics
+
+def load_analysis_metrics(analyses=ANALYSIS_PDFS, workers=DEFAULT_WORKERS, metrics_db=metrics_store.METRICS_DB):
+    """
+    Extract every analysis PDF and store its sentiment metrics; returns the stored rows
+    Each extracted analysis replaces its whole sentiment series, so renamed or
+    dropped themes don't linger. Missing PDFs leave their stored series alone.
+    """
+    documents = extract(list(analyses.values()), workers=workers)
+    metrics = []
+    replaced = []
+    for disaster, path in analyses.items():
+        if path not in documents:
+            continue
+        found = sentiment_metrics(disaster, path, documents[path])
+        print(f"   {disaster}: {len(found)} sentiment themes" if found else f"   {disaster}: no sentiment grid")
+        metrics.extend(found)
+        replaced.append(f'sentiment_{disaster}')
+    if replaced:
+        metrics_store.store(metrics, metrics_db, replace_series=replaced)
+    return metrics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Extract (and cache) text and tables from PDFs')
+    parser.add_argument('pdfs', nargs='*', help='PDFs to extract instead of the disaster analyses')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--no-metrics', action='store_true', help='extract only; leave metrics_store alone')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        if args.pdfs or args.no_metrics:
+            documents = extract(args.pdfs or list(ANALYSIS_PDFS.values()), workers=args.workers)
+            print(f"✅ {sum(len(pages) for pages in documents.values())} pages in {time.perf_counter() - start:.1f}s")
+        else:
+            metrics = load_analysis_metrics(workers=args.workers)
+            print(f"✅ Stored {len(metrics)} metrics in {metrics_store.METRICS_DB} ({time.perf_counter() - start:.1f}s)")
+            print("   Run: python chart_registry.py   # rebuilds charts that read changed metrics")
+    except ImportError:
+        print("❌ PDFs that aren't cached yet need pypdf: pip install pypdf")
+        raise SystemExit(1)
+    print(f"📁 Cache: {CACHE_DIR}")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Image embedding stage for the PDF builders
+Charts are rendered at scale=2 (2400x1200 and up) but placed at 5-6 inches,
+so each image is resampled to the target DPI for its placed size, re-encoded
+(JPEG for photographic content, flattened/palette PNG for flat charts) and
+deduplicated by content before ReportLab embeds it.
+"""
+
+import hashlib
+import math
+import os
+
+OPTIMIZED_DIR = '/Users/jefffranzen/cap-data/.pdf_images'
+
+# 150 DPI reads sharp on screen and in office printing while keeping emailed PDFs small
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+# Images with more distinct colors than this are treated as photographic
+PHOTO_COLOR_THRESHOLD = 1 << 16
+
+class ImageOptimizer:
+    """Resample, re-encode and dedupe images for one PDF build"""
+    def __init__(self, dpi=DEFAULT_DPI, out_dir=OPTIMIZED_DIR):
+        self.dpi = dpi
+        self.out_dir = out_dir
+        self._prepared = {}   # (content hash, pixel size) -> optimized path
+        self._sources = {}    # source path -> (content hash, size in bytes)
+        self._seen_digests = set()
+        self.original_bytes = 0
+        self.optimized_bytes = 0
+        self.images = 0
+        self.duplicates = 0
+
+    def _source_info(self, path):
+        if path not in self._sources:
+            with open(path, 'rb') as f:
+                data = f.read()
+            self._sources[path] = (hashlib.sha256(data).hexdigest(), len(data))
+        return self._sources[path]
+
+    def prepare(self, path, width, height):
+        """
+        Return the path to embed for an image placed at width x height points
+        Falls back to the original file when Pillow isn't installed.
+        """
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            return path
+
+        is_new_source = path not in self._sources
+        digest, size = self._source_info(path)
+        self.images += 1
+        if is_new_source and digest not in self._seen_digests:
+            # ReportLab already embeds byte-identical files once, so count each source once
+            self._seen_digests.add(digest)
+            self.original_bytes += size
+
+        target = (max(1, math.ceil(width / 72 * self.dpi)), max(1, math.ceil(height / 72 * self.dpi)))
+        key = (digest, target)
+        if key in self._prepared:
+            # Same pixels at the same size: ReportLab embeds one XObject for both
+            self.duplicates += 1
+            return self._prepared[key]
+
+        img = PILImage.open(path)
+        img.load()
+
+        # Never upsample; only shrink to what the placed size can show
+        if img.width > target[0] or img.height > target[1]:
+            img = img.resize((min(img.width, target[0]), min(img.height, target[1])), PILImage.LANCZOS)
+
+        # Flatten transparency onto the white page
+        if img.mode in ('RGBA', 'LA', 'P'):
+            rgba = img.convert('RGBA')
+            flat = PILImage.new('RGB', rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.split()[-1])
+            img = flat
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        stem = os.path.join(self.out_dir, f'{digest[:16]}_{img.width}x{img.height}')
+        colors = img.getcolors(maxcolors=PHOTO_COLOR_THRESHOLD)
+        if colors is None:
+            out_path = f'{stem}.jpg'
+            img.save(out_path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+        elif len(colors) <= 256:
+            out_path = f'{stem}.png'
+            img.quantize(colors=len(colors)).save(out_path, 'PNG', optimize=True)
+        else:
+            out_path = f'{stem}.png'
+            img.save(out_path, 'PNG', optimize=True)
+
+        self.optimized_bytes += os.path.getsize(out_path)
+        self._prepared[key] = out_path
+        return out_path
+
+    def print_report(self, pdf_path=None):
+        """Summarize image bytes saved by resampling, re-encoding and dedupe"""
+        if not self.images:
+            return
+        saved = self.original_bytes - self.optimized_bytes
+        print(f"\n🗜️  Image optimization ({self.dpi} DPI):")
+        print(f"   Images placed:     {self.images} ({self.duplicates} deduplicated)")
+        print(f"   Source images:     {self.original_bytes / 1024 / 1024:.1f} MB")
+        print(f"   Embedded images:   {self.optimized_bytes / 1024 / 1024:.1f} MB")
+        if self.original_bytes:
+            print(f"   Saved:             {saved / 1024 / 1024:.1f} MB ({saved / self.original_bytes:.0%})")
+        if pdf_path and os.path.exists(pdf_path):
+            print(f"   Final PDF size:    {os.path.getsize(pdf_path) / 1024 / 1024:.1f} MB")
+
+# Shared optimizer for scripts that build one PDF per run
+_optimizer = ImageOptimizer()
+
+def optimize_for_pdf(path, width, height):
+    """Prepare an image for embedding at width x height points"""
+    return _optimizer.prepare(path, width, height)
+
+def print_savings_report(pdf_path=None):
+    _optimizer.print_report(pdf_path)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Content-addressed render cache for Plotly static exports
+Rendered images are keyed on a hash of the figure spec plus export size/scale,
+so only charts whose figure actually changed go through kaleido (via the
+render daemon when one is running).
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+CACHE_DIR = '/Users/jefffranzen/cap-data/.render_cache'
+
+# Least recently used entries are evicted once the store grows past this size
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+def figure_key(fig, width, height, scale=1, fmt='png'):
+    """Hash the figure spec together with every export parameter"""
+    import plotly
+    from plotly.utils import PlotlyJSONEncoder
+
+    spec = json.dumps(fig.to_plotly_json(), sort_keys=True, cls=PlotlyJSONEncoder)
+    digest = hashlib.sha256()
+    digest.update(spec.encode('utf-8'))
+    # The plotly version is part of the key since it changes how figures rasterize
+    digest.update(f'|{plotly.__version__}|{width}x{height}@{scale}|{fmt}'.encode('utf-8'))
+    return digest.hexdigest()
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, key[:2], key)
+
+def get(key):
+    """Return cached image bytes for a key, or None on a miss"""
+    path = _entry_path(key)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Touch the entry so eviction treats it as recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+def put(key, data):
+    """Store image bytes under a key; safe to call from several processes"""
+    path = _entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _entries():
+    if not os.path.isdir(CACHE_DIR):
+        return []
+    entries = []
+    for shard in os.scandir(CACHE_DIR):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    return entries
+
+def evict(max_bytes=MAX_CACHE_BYTES):
+    """Drop least recently used entries until the store fits in max_bytes"""
+    entries = sorted(_entries())
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+def clear():
+    """Remove every cached render"""
+    removed = 0
+    for _, _, path in _entries():
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def to_image(fig, format='png', width=None, height=None, scale=1):
+    """Cached drop-in for plotly.io.to_image; returns (image_bytes, cache_hit)"""
+    key = figure_key(fig, width, height, scale, format)
+    data = get(key)
+    if data is not None:
+        return data, True
+
+    # Misses go to the persistent render daemon when it is running
+    import render_server
+    data = render_server.to_image(fig, format=format, width=width, height=height, scale=scale)
+    put(key, data)
+    evict()
+    return data, False
+
+def write_image(fig, path, width=None, height=None, scale=1, format=None):
+    """Cached drop-in for fig.write_image; returns True when served from the cache"""
+    if format is None:
+        format = os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+        if format == 'jpg':
+            format = 'jpeg'
+    data, hit = to_image(fig, format=format, width=width, height=height, scale=scale)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return hit
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        print(f"🗑️  Removed {clear()} cached renders from {CACHE_DIR}")
+    else:
+        entries = _entries()
+        total = sum(size for _, size, _ in entries)
+        print(f"📦 Render cache: {CACHE_DIR}")
+        print(f"   Entries: {len(entries)}")
+        print(f"   Size:    {total / (1024 * 1024):.1f} MB of {MAX_CACHE_BYTES / (1024 * 1024):.0f} MB")
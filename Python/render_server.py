@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Persistent local kaleido render daemon
+Keeps one warm kaleido/Chromium instance behind a Unix socket so chained
+scripts don't each pay the renderer startup. Clients send figure JSON and get
+image bytes back; when the daemon isn't running they render in-process.
+
+Usage:
+    python render_server.py start     # run the daemon (foreground; background it with &)
+    python render_server.py status
+    python render_server.py stop
+
+Protocol (both directions): 4-byte big-endian length + JSON header, and on
+successful renders a second length-prefixed frame carrying the image bytes.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+
+SOCKET_PATH = '/Users/jefffranzen/cap-data/.render.sock'
+
+# Seconds a client waits on the daemon before falling back to in-process rendering
+CLIENT_TIMEOUT = 120
+
+# 1. FRAMING
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("render socket closed mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def send_frame(sock, payload):
+    sock.sendall(struct.pack('>I', len(payload)) + payload)
+
+def recv_frame(sock):
+    header = sock.recv(4)
+    if not header:
+        return None
+    if len(header) < 4:
+        header += _recv_exact(sock, 4 - len(header))
+    (size,) = struct.unpack('>I', header)
+    return _recv_exact(sock, size)
+
+# 2. DAEMON
+
+class RenderHandler(socketserver.BaseRequestHandler):
+    """Serve render requests on one connection until the client hangs up"""
+    def handle(self):
+        while True:
+            frame = recv_frame(self.request)
+            if frame is None:
+                return
+            request = json.loads(frame)
+            command = request.get('command', 'render')
+
+            if command == 'ping':
+                send_frame(self.request, json.dumps({
+                    'ok': True, 'pid': os.getpid(),
+                    'rendered': self.server.rendered,
+                    'uptime': time.time() - self.server.started,
+                }).encode('utf-8'))
+            elif command == 'shutdown':
+                send_frame(self.request, json.dumps({'ok': True}).encode('utf-8'))
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            else:
+                try:
+                    data = self.server.render(request)
+                except Exception as e:
+                    send_frame(self.request, json.dumps({'ok': False, 'error': str(e)}).encode('utf-8'))
+                    continue
+                send_frame(self.request, json.dumps({'ok': True}).encode('utf-8'))
+                send_frame(self.request, data)
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server owning the single warm kaleido instance"""
+    daemon_threads = True
+
+    def __init__(self, path=SOCKET_PATH):
+        import plotly.io as pio
+        import plotly.graph_objects as go
+
+        pio.kaleido.scope.mathjax = None
+        # Pay the Chromium startup once, before accepting clients
+        pio.to_image(go.Figure(), format='png', width=10, height=10)
+        self.pio = pio
+        self.lock = threading.Lock()
+        self.rendered = 0
+        self.started = time.time()
+
+        if os.path.exists(path):
+            os.remove(path)
+        socketserver.UnixStreamServer.__init__(self, path, RenderHandler)
+
+    def render(self, request):
+        fig = self.pio.from_json(request['figure'])
+        # Kaleido handles one export at a time; connections queue on the lock
+        with self.lock:
+            data = self.pio.to_image(fig, format=request.get('format', 'png'),
+                                     width=request.get('width'), height=request.get('height'),
+                                     scale=request.get('scale', 1))
+            self.rendered += 1
+        return data
+
+def serve(path=SOCKET_PATH):
+    server = RenderServer(path)
+    print(f"🖼️  Render daemon ready on {path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.remove(path)
+        print(f"🛑 Render daemon stopped after {server.rendered} renders")
+
+# 3. CLIENT
+
+def _request(request, path=SOCKET_PATH, timeout=CLIENT_TIMEOUT):
+    """Send one request to the daemon; returns (header, image_bytes or None)"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        send_frame(sock, json.dumps(request).encode('utf-8'))
+        header = json.loads(recv_frame(sock))
+        data = None
+        if header.get('ok') and request.get('command', 'render') == 'render':
+            data = recv_frame(sock)
+        return header, data
+    finally:
+        sock.close()
+
+def is_running(path=SOCKET_PATH):
+    if not os.path.exists(path):
+        return False
+    try:
+        header, _ = _request({'command': 'ping'}, path, timeout=5)
+        return header.get('ok', False)
+    except OSError:
+        return False
+
+def to_image(fig, format='png', width=None, height=None, scale=1):
+    """Render through the daemon if it is up, otherwise in-process via plotly.io"""
+    if os.path.exists(SOCKET_PATH):
+        request = {'command': 'render', 'figure': fig.to_json(), 'format': format,
+                   'width': width, 'height': height, 'scale': scale}
+        try:
+            header, data = _request(request)
+        except (OSError, ValueError, TypeError):
+            header, data = {}, None
+        if data is not None:
+            return data
+        if header.get('error'):
+            raise ValueError(f"Render daemon failed: {header['error']}")
+
+    import plotly.io as pio
+    return pio.to_image(fig, format=format, width=width, height=height, scale=scale)
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    if command == 'start':
+        if is_running():
+            print(f"✅ Render daemon already running on {SOCKET_PATH}")
+        else:
+            serve()
+    elif command == 'stop':
+        if is_running():
+            _request({'command': 'shutdown'})
+            print("🛑 Render daemon stopping")
+        else:
+            print("ℹ️  Render daemon is not running")
+    elif command == 'status':
+        if is_running():
+            header, _ = _request({'command': 'ping'})
+            print(f"✅ Render daemon running (pid {header['pid']}, "
+                  f"{header['rendered']} renders, up {header['uptime']:.0f}s)")
+        else:
+            print("ℹ️  Render daemon is not running; scripts render in-process")
+    else:
+        print("Usage: python render_server.py [start|stop|status]")
+        sys.exit(1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser for the CAP report text files
+Turns the report .txt into a document tree (sections, subsections, Key
+Findings, bullets, quotes, paragraphs) in one streaming pass. Each line is
+classified by one compiled regex, so the PDF builders walk the tree instead
+of rescanning the text.
+
+Usage:
+    python report_parser.py /Users/jefffranzen/cap-data/FINAL_CAP_Report_With_Updates.txt
+"""
+
+import re
+import sys
+
+# One alternation per line kind; the outermost group that matched names the kind
+LINE_PATTERN = re.compile(r'''
+      (?P<section>(?P<roman>IX|IV|V?I{1,3}|V)\.\s+(?P<section_title>.+))
+    | (?P<subsection>(?P<letter>[A-E])\.\s+(?P<subsection_title>.+))
+    | (?P<key_findings>Key\ Findings:)$
+    | (?P<bullet>•\s*(?P<bullet_text>.+))
+    | (?P<sub_bullet>o\s+(?P<sub_bullet_text>.+))
+    | (?P<quote>["“](?P<quote_text>.*)["”])$
+''', re.VERBOSE)
+
+# "Quality of Service: CAP partners have..." -> label + text
+LABEL_PATTERN = re.compile(r"(?P<label>[A-Z][\w ,&/'()-]{1,60}):\s+(?P<text>.+)")
+
+# Kinds that are rendered as a single line of content
+BLOCK_KINDS = ('paragraph', 'bullet', 'sub_bullet', 'quote', 'blank')
+
+class Node:
+    """One element of the report tree"""
+    def __init__(self, kind, text='', number=None, label=None):
+        self.kind = kind
+        self.text = text
+        self.number = number
+        self.label = label
+        self.children = []
+
+    @property
+    def heading(self):
+        """Heading line as it appears in the report, e.g. 'I. Executive Summary'"""
+        return f'{self.number}. {self.text}' if self.number else self.text
+
+    def walk(self):
+        """Yield this node and every descendant in document order"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def blocks(self):
+        """Content nodes directly under this node (not inside subsections)"""
+        return [child for child in self.children if child.kind in BLOCK_KINDS]
+
+    def intro(self):
+        """Paragraphs before the first Key Findings block or subsection"""
+        paragraphs = []
+        for child in self.children:
+            if child.kind not in BLOCK_KINDS:
+                break
+            if child.kind == 'paragraph':
+                paragraphs.append(child)
+        return paragraphs
+
+    def __repr__(self):
+        return f'Node({self.kind!r}, {self.heading[:40]!r}, {len(self.children)} children)'
+
+class Report(Node):
+    """Root of the tree: title, preamble lines and Roman-numeral sections"""
+    def __init__(self):
+        Node.__init__(self, 'document')
+        self.title = ''
+        self.sections = []
+
+    def section(self, title):
+        """First section whose title contains the given text"""
+        for section in self.sections:
+            if title in section.text:
+                return section
+        return None
+
+    def labeled_block(self, label):
+        """
+        A labeled paragraph or bullet ('Quality of Service: ...') plus the
+        content that follows it, up to the next heading or the next label
+        at the same level (labeled bullets under a labeled paragraph stay in)
+        """
+        block = []
+        for node in self.walk():
+            if block:
+                if node.kind not in BLOCK_KINDS or (node.label and node.kind == block[0].kind):
+                    break
+                block.append(node)
+            elif node.label == label:
+                block.append(node)
+        return block
+
+def _content_node(kind, text, body=None):
+    match = LABEL_PATTERN.match(body if body is not None else text)
+    if match:
+        return Node(kind, text, label=match.group('label'))
+    return Node(kind, text)
+
+def parse_lines(lines):
+    """Build the report tree from an iterable of lines in one pass"""
+    report = Report()
+    section = subsection = findings = None
+    container = report
+    previous_blank = False
+
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            # Runs of blank lines collapse into one paragraph break
+            if not previous_blank:
+                container.children.append(Node('blank'))
+            previous_blank = True
+            continue
+        previous_blank = False
+
+        if not report.title and section is None:
+            report.title = line
+            continue
+
+        match = LINE_PATTERN.match(line)
+        kind = match.lastgroup if match else None
+
+        if kind == 'section':
+            section = Node('section', match.group('section_title'), number=match.group('roman'))
+            report.children.append(section)
+            report.sections.append(section)
+            subsection = findings = None
+            container = section
+        elif kind == 'subsection' and section is not None:
+            subsection = Node('subsection', match.group('subsection_title'), number=match.group('letter'))
+            section.children.append(subsection)
+            findings = None
+            container = subsection
+        elif kind == 'key_findings':
+            findings = Node('key_findings', 'Key Findings:')
+            (subsection or section or report).children.append(findings)
+            container = findings
+        elif kind == 'bullet':
+            container.children.append(_content_node('bullet', line, match.group('bullet_text')))
+        elif kind == 'sub_bullet':
+            container.children.append(_content_node('sub_bullet', line, match.group('sub_bullet_text')))
+        elif kind == 'quote':
+            container.children.append(Node('quote', line))
+        else:
+            container.children.append(_content_node('paragraph', line))
+
+    return report
+
+def parse_report(path):
+    """Parse a report text file, streaming it line by line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_lines(f)
+
+if __name__ == "__main__":
+    report = parse_report(sys.argv[1])
+    print(f"📄 {report.title}")
+    for node in report.walk():
+        if node.kind == 'section':
+            print(f"  {node.heading} ({sum(1 for _ in node.walk()) - 1} nodes)")
+        elif node.kind == 'subsection':
+            print(f"    {node.heading}")
+        elif node.kind == 'key_findings':
+            print("    Key Findings")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic data for the illustrative charts
+Every chart gets its own numpy Generator seeded from the project seed and the
+chart's name, so a chart draws the same numbers on every run no matter which
+other charts ran first. The helpers draw whole arrays in one call instead of
+one np.random call per element, which also keeps figures byte-identical
+between runs and therefore cacheable by the render cache.
+"""
+
+import zlib
+
+import numpy as np
+
+SEED = 42
+
+def chart_rng(chart_name, seed=SEED):
+    """Deterministic Generator for one chart"""
+    return np.random.default_rng([seed, zlib.crc32(chart_name.encode('utf-8'))])
+
+def jitter(rng, base, scale):
+    """base (scalar, list or array) plus N(0, scale) noise per element"""
+    base = np.asarray(base, dtype=float)
+    return base + rng.normal(0, scale, base.shape)
+
+def normal_columns(rng, specs, n):
+    """{column: (mean, sd)} -> {column: n normal draws}, drawn as one matrix"""
+    means = np.array([mean for mean, _ in specs.values()], dtype=float)
+    sds = np.array([sd for _, sd in specs.values()], dtype=float)
+    draws = rng.normal(means, sds, size=(n, len(specs)))
+    return {column: draws[:, i] for i, column in enumerate(specs)}
+
+def normal_groups(rng, groups):
+    """
+    [(label, mean, sd, n), ...] -> (labels, values), one draw for all groups
+    Matches building a long-form table group by group.
+    """
+    labels = np.repeat([label for label, _, _, _ in groups], [n for _, _, _, n in groups])
+    means = np.repeat([mean for _, mean, _, _ in groups], [n for _, _, _, n in groups])
+    sds = np.repeat([sd for _, _, sd, _ in groups], [n for _, _, _, n in groups])
+    return labels, rng.normal(means, sds)
+
+def tiered_integers(rng, tiers, columns, rows):
+    """
+    rows x columns grid of integers where each column draws from its tier's
+    [low, high) range; tiers maps column -> (low, high)
+    """
+    low = np.array([tiers[column][0] for column in columns])
+    high = np.array([tiers[column][1] for column in columns])
+    return rng.integers(low, high, size=(rows, len(columns)))
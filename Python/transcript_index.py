@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Full-text quote search over the ingested interview transcripts
+Utterances from the Parquet corpus go into an SQLite FTS5 index (positional
+postings on disk) so phrase, proximity and boolean queries come back
+BM25-ranked in milliseconds. Updates are incremental: only documents that
+are new to the corpus are tokenized, removed ones are dropped, and canonical
+flags are refreshed from the latest dedup pass.
+
+Usage:
+    python transcript_index.py --update                       # sync with the corpus
+    python transcript_index.py "did not pay a dime"           # phrase search
+    python transcript_index.py "invisible population" --limit 20 --all-speakers
+    python transcript_index.py --near 10 hispanic invisible   # words within 10 tokens
+    python transcript_index.py --raw 'feeding AND (church OR pastor)'
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+
+import ingest_transcripts
+
+INDEX_PATH = f'{ingest_transcripts.CORPUS_DIR}/transcripts_index.db'
+
+# Elided quotes ("population is...the invisible") match fragments within this many tokens
+ELLIPSIS_DISTANCE = 30
+SNIPPET_TOKENS = 24
+
+ELLIPSIS = re.compile(r'\.{3}|…')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id         TEXT PRIMARY KEY,
+    interview_id   TEXT,
+    canonical      INTEGER NOT NULL,
+    file_name      TEXT NOT NULL,
+    collection     TEXT,
+    role           TEXT,
+    dr_code        TEXT,
+    interview_date TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances USING fts5(
+    text,
+    doc_id UNINDEXED,
+    utterance UNINDEXED,
+    start_seconds UNINDEXED,
+    speaker UNINDEXED,
+    speaker_role UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+DOCUMENT_COLUMNS = ['doc_id', 'interview_id', 'canonical', 'file_name', 'collection', 'role', 'dr_code', 'interview_date']
+UTTERANCE_COLUMNS = ['text', 'doc_id', 'utterance', 'start_seconds', 'speaker', 'speaker_role']
+
+class Hit:
+    """One matching utterance and the interview it came from"""
+    def __init__(self, score, snippet, text, speaker, speaker_role, utterance, start_seconds,
+                 doc_id, interview_id, file_name, role, dr_code, interview_date):
+        self.score = score
+        self.snippet = snippet
+        self.text = text
+        self.speaker = speaker
+        self.speaker_role = speaker_role
+        self.utterance = utterance
+        self.start_seconds = start_seconds
+        self.doc_id = doc_id
+        self.interview_id = interview_id
+        self.file_name = file_name
+        self.role = role
+        self.dr_code = dr_code
+        self.interview_date = interview_date
+
+    @property
+    def timestamp(self):
+        hours, rest = divmod(self.start_seconds or 0, 3600)
+        return f'{hours:02d}:{rest // 60:02d}:{rest % 60:02d}'
+
+    def __repr__(self):
+        return f'Hit({self.file_name!r} @ {self.timestamp}, score={self.score:.2f})'
+
+def connect(index_path=INDEX_PATH):
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    connection = sqlite3.connect(index_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+# 1. INDEXING
+
+def update(corpus_path=ingest_transcripts.CORPUS_PATH, index_path=INDEX_PATH):
+    """Bring the index in line with the corpus; returns (added, removed) document counts"""
+    documents = ingest_transcripts.load_corpus(DOCUMENT_COLUMNS, corpus_path).to_pylist()
+    corpus_docs = {row['doc_id']: row for row in documents}
+
+    connection = connect(index_path)
+    with connection:
+        indexed = {doc_id for (doc_id,) in connection.execute('SELECT doc_id FROM documents')}
+        removed = indexed - corpus_docs.keys()
+        added = corpus_docs.keys() - indexed
+
+        for doc_id in removed:
+            connection.execute('DELETE FROM utterances WHERE doc_id = ?', (doc_id,))
+            connection.execute('DELETE FROM documents WHERE doc_id = ?', (doc_id,))
+
+        # Canonical picks can move when a new variant of an interview arrives
+        connection.executemany(
+            f"INSERT OR REPLACE INTO documents ({', '.join(DOCUMENT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(DOCUMENT_COLUMNS))})",
+            [tuple(row[column] for column in DOCUMENT_COLUMNS) for row in corpus_docs.values()])
+
+        if added:
+            rows = ingest_transcripts.load_corpus(UTTERANCE_COLUMNS, corpus_path, doc_ids=added)
+            connection.executemany(
+                f"INSERT INTO utterances ({', '.join(UTTERANCE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(UTTERANCE_COLUMNS))})",
+                zip(*(rows.column(column).to_pylist() for column in UTTERANCE_COLUMNS)))
+        if added or removed:
+            connection.execute("INSERT INTO utterances (utterances) VALUES ('optimize')")
+    connection.close()
+    return len(added), len(removed)
+
+# 2. QUERIES
+
+def phrase(text):
+    """Quote text as an FTS5 phrase: its words must appear consecutively"""
+    return '"' + text.replace('"', '""') + '"'
+
+def near(terms, distance=10):
+    """FTS5 proximity query: every term (word or phrase) within distance tokens"""
+    return f"NEAR({' '.join(phrase(term) for term in terms)}, {distance})"
+
+def quote_query(quote):
+    """
+    Query for a pasted quote; '...' elisions become a proximity match of the fragments
+    Raises ValueError for a quote with no searchable words (FTS5 rejects 'NEAR(, 30)').
+    """
+    fragments = [fragment.strip(' "\'“”') for fragment in ELLIPSIS.split(quote)]
+    # The tokenizer drops punctuation and underscores, so those alone match nothing
+    fragments = [fragment for fragment in fragments if re.search(r'[^\W_]', fragment)]
+    if not fragments:
+        raise ValueError(f"No words to search for in {quote!r}")
+    if len(fragments) == 1:
+        return phrase(fragments[0])
+    return near(fragments, ELLIPSIS_DISTANCE)
+
+def search(query, limit=10, respondents_only=True, canonical_only=True, role=None, index_path=INDEX_PATH):
+    """
+    BM25-ranked utterances matching an FTS5 query (see phrase/near/quote_query)
+    Interviewer turns and duplicate copies of an interview are skipped by default.
+    """
+    where = ['utterances MATCH ?']
+    params = [query]
+    if respondents_only:
+        # Unlabelled speakers ("SPK_1") are usually the respondent; only drop known interviewers
+        where.append("u.speaker_role IS NOT 'Interviewer'")
+    if canonical_only:
+        where.append('d.canonical')
+    if role:
+        where.append('d.role = ?')
+        params.append(role)
+    params.append(limit)
+
+    connection = connect(index_path)
+    try:
+        rows = connection.execute(f"""
+            SELECT bm25(utterances), snippet(utterances, 0, '[', ']', '…', {SNIPPET_TOKENS}),
+                   u.text, u.speaker, u.speaker_role, u.utterance, u.start_seconds,
+                   d.doc_id, d.interview_id, d.file_name, d.role, d.dr_code, d.interview_date
+            FROM utterances u JOIN documents d ON d.doc_id = u.doc_id
+            WHERE {' AND '.join(where)}
+            ORDER BY bm25(utterances)
+            LIMIT ?
+        """, params).fetchall()
+    finally:
+        connection.close()
+    # FTS5's bm25() is negated so ascending order is best-first; flip it back for display
+    return [Hit(-score, *rest) for score, *rest in rows]
+
+def find_quote(quote, **kwargs):
+    """search() for a quote as pasted into a report"""
+    return search(quote_query(quote), **kwargs)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Search interview transcripts for quotes')
+    parser.add_argument('terms', nargs='*', help='quote to look up (a phrase unless --raw or --near)')
+    parser.add_argument('--update', action='store_true', help='sync the index with the corpus first')
+    parser.add_argument('--raw', action='store_true', help='pass the query to FTS5 unchanged')
+    parser.add_argument('--near', type=int, metavar='N', help='match the terms within N tokens of each other')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--role', help="interviewee role, e.g. 'CAP Partner'")
+    parser.add_argument('--all-speakers', action='store_true', help='include interviewer turns')
+    parser.add_argument('--all-copies', action='store_true', help='include duplicate copies of an interview')
+    args = parser.parse_args()
+
+    if args.update or not os.path.exists(INDEX_PATH):
+        start = time.perf_counter()
+        added, removed = update()
+        print(f"🗂️  Index updated: +{added} / -{removed} documents in {time.perf_counter() - start:.2f}s")
+    if not args.terms:
+        raise SystemExit(0)
+
+    if args.raw:
+        query = ' '.join(args.terms)
+    elif args.near:
+        query = near(args.terms, args.near)
+    else:
+        try:
+            query = quote_query(' '.join(args.terms))
+        except ValueError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+
+    start = time.perf_counter()
+    try:
+        hits = search(query, limit=args.limit, respondents_only=not args.all_speakers,
+                      canonical_only=not args.all_copies, role=args.role)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Bad query {query!r} - {e}")
+        raise SystemExit(1)
+    print(f"\n🔎 {query}  ({len(hits)} hits in {(time.perf_counter() - start) * 1000:.1f} ms)\n")
+    for hit in hits:
+        print(f"  {hit.score:6.2f}  {hit.file_name} @ {hit.timestamp}  [{hit.speaker}]")
+        print(f"          {hit.snippet}\n")
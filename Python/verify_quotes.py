@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Quote provenance check: report text and PDF callouts vs. the interview corpus
+Every quoted span in the report texts, plus the 'quote' CalloutBoxes in the
+PDF builders, is located in the transcripts. An inverted word-trigram index
+over the corpus proposes a few candidate alignments per quote by voting, and
+only those windows are scored with difflib, so a full report checks in a
+couple of seconds instead of running difflib against every utterance.
+Elided quotes ("population is...the invisible") are split at the ellipsis and
+their fragments scored in order within one shared window.
+
+Usage:
+    python verify_quotes.py                          # check the reports and PDF callouts
+    python verify_quotes.py report.txt --min-words 4
+    python verify_quotes.py --csv /tmp/provenance.csv
+"""
+
+import argparse
+import ast
+import csv
+import os
+import re
+import time
+from collections import Counter
+from difflib import SequenceMatcher
+
+import ingest_transcripts
+import transcript_index
+
+CAP_DATA = ingest_transcripts.CAP_DATA
+REPORTS = [
+    f'{CAP_DATA}/Updated_CAP_Report_September_30_2025_COMPLETE.txt',
+    f'{CAP_DATA}/FINAL_CAP_Report_With_Updates.txt',
+]
+PDF_BUILDERS = [os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                for name in ('create_pdf_simple.py', 'create_professional_pdf.py')]
+PROVENANCE_CSV = f'{CAP_DATA}/quote_provenance.csv'
+
+# Shorter quoted spans are terms ("invisible populations"), not statements
+MIN_QUOTE_WORDS = 5
+NGRAM = 3
+# Trigrams this common ("i don't know") cost postings and say nothing about position
+MAX_POSTINGS = 200
+# Alignments per quote scored with difflib, and the diagonal width votes are pooled over
+CANDIDATES = 5
+BUCKET = 16
+
+VERIFIED = 0.9
+PARAPHRASED = 0.6
+
+QUOTED = re.compile(r'"([^"\n]+)"|“([^”\n]+)”')
+TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+PROVENANCE_COLUMNS = ['source', 'line', 'quote', 'status', 'similarity', 'file_name', 'speaker',
+                      'timestamp', 'utterance', 'offset', 'matched_text']
+
+class Quote:
+    """A quoted statement and where in the report it appears"""
+    def __init__(self, source, line, text):
+        self.source = source
+        self.line = line
+        self.text = text
+
+def _normalize(text):
+    # Word processors curl apostrophes; the tokenizer only knows the straight one
+    return text.replace('’', "'").replace('‘', "'").lower()
+
+def tokenize(text):
+    """[(token, char offset)] with lowercase words and contractions kept whole"""
+    return [(match.group(), match.start()) for match in TOKEN.finditer(_normalize(text))]
+
+# 1. QUOTES
+
+def report_quotes(path, min_words=MIN_QUOTE_WORDS):
+    """Quoted spans in a report text; spans padded with spaces are mis-paired quote marks"""
+    quotes = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            for match in QUOTED.finditer(line):
+                text = match.group(1) or match.group(2)
+                if text != text.strip() or len(tokenize(text)) < min_words:
+                    continue
+                quotes.append(Quote(os.path.basename(path), number, text.strip(' ,.')))
+    return quotes
+
+def callout_quotes(path, min_words=MIN_QUOTE_WORDS):
+    """Literal CalloutBox(title, text, 'quote') bodies, minus their ' - Attribution' tail"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    quotes = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'CalloutBox'
+                and len(node.args) == 3):
+            continue
+        _, body, style = node.args
+        if not (isinstance(style, ast.Constant) and style.value == 'quote' and isinstance(body, ast.Constant)):
+            continue
+        text = body.value.rsplit(' - ', 1)[0].strip()
+        if len(tokenize(text)) >= min_words:
+            quotes.append(Quote(os.path.basename(path), body.lineno, text))
+    return quotes
+
+# 2. CORPUS INDEX
+
+class CorpusIndex:
+    """Every canonical utterance as one token stream, with a trigram -> positions index"""
+    def __init__(self, corpus_path=ingest_transcripts.CORPUS_PATH):
+        table = ingest_transcripts.load_corpus(
+            ['file_name', 'speaker', 'start_seconds', 'utterance', 'text'], corpus_path, canonical_only=True)
+        self.utterances = table.to_pylist()
+        self.tokens = []
+        self.token_utterance = []
+        self.token_offset = []
+        for index, row in enumerate(self.utterances):
+            for token, offset in tokenize(row['text']):
+                self.tokens.append(token)
+                self.token_utterance.append(index)
+                self.token_offset.append(offset)
+
+        self.postings = {}
+        for position in range(len(self.tokens) - NGRAM + 1):
+            self.postings.setdefault(tuple(self.tokens[position:position + NGRAM]), []).append(position)
+
+    def candidates(self, quote_tokens):
+        """Start positions of the best-supported alignments of the quote, by n-gram votes"""
+        votes = Counter()
+        for i in range(len(quote_tokens) - NGRAM + 1):
+            positions = self.postings.get(tuple(quote_tokens[i:i + NGRAM]), ())
+            if len(positions) > MAX_POSTINGS:
+                continue
+            for position in positions:
+                votes[(position - i) // BUCKET] += 1
+        return [bucket * BUCKET for bucket, _ in votes.most_common(CANDIDATES)]
+
+    def match(self, text):
+        """(similarity, first token, last token) of the best alignment, or None"""
+        fragments = [[token for token, _ in tokenize(fragment)] for fragment in transcript_index.ELLIPSIS.split(text)]
+        fragments = [tokens for tokens in fragments if tokens]
+        quote_tokens = [token for tokens in fragments for token in tokens]
+        # Each elision may hide up to ELLIPSIS_DISTANCE words of the transcript
+        gap = transcript_index.ELLIPSIS_DISTANCE * (len(fragments) - 1)
+        best = None
+        for start in self.candidates(quote_tokens):
+            low = max(start - BUCKET - gap, 0)
+            high = min(start + len(quote_tokens) + 2 * BUCKET + gap, len(self.tokens))
+            window = self.tokens[low:high]
+            # Fragments are aligned in order, each after the end of the one before
+            matched = length = 0
+            cursor = 0
+            first = last = None
+            for tokens in fragments:
+                blocks = _aligned_blocks(tokens, window[cursor:])
+                if not blocks:
+                    length += len(tokens)
+                    continue
+                # Words lined up over the fragment or its matched span, whichever is longer
+                span = blocks[-1].b + blocks[-1].size - blocks[0].b
+                matched += sum(block.size for block in blocks)
+                length += max(len(tokens), span)
+                if first is None:
+                    first = cursor + blocks[0].b
+                cursor += blocks[-1].b + blocks[-1].size
+                last = cursor - 1
+            if first is None:
+                continue
+            similarity = matched / length
+            if best is None or similarity > best[0]:
+                best = (similarity, low + first, low + last)
+        return best
+
+def _aligned_blocks(quote_tokens, window):
+    """difflib matching blocks of quote_tokens in window, minus stray edge words"""
+    matcher = SequenceMatcher(None, quote_tokens, window, autojunk=False)
+    blocks = [block for block in matcher.get_matching_blocks() if block.size]
+    # Stray single-word hits at either edge aren't part of the quote
+    while len(blocks) > 1 and blocks[0].size == 1:
+        blocks.pop(0)
+    while len(blocks) > 1 and blocks[-1].size == 1:
+        blocks.pop()
+    return blocks
+
+# 3. PROVENANCE
+
+def _status(similarity):
+    if similarity >= VERIFIED:
+        return 'verified'
+    if similarity >= PARAPHRASED:
+        return 'paraphrased'
+    return 'not found'
+
+def provenance(quotes, index):
+    """One row per quote: best source utterance, character offset and similarity"""
+    rows = []
+    matches = {}
+    for quote in quotes:
+        if quote.text not in matches:
+            matches[quote.text] = index.match(quote.text)
+        found = matches[quote.text]
+        row = {'source': quote.source, 'line': quote.line, 'quote': quote.text}
+        if found is None:
+            rows.append({**row, 'status': 'not found', 'similarity': 0.0})
+            continue
+
+        similarity, first, last = found
+        utterance = index.utterances[index.token_utterance[first]]
+        # A match running past the end of the utterance is clipped to it
+        if index.token_utterance[last] != index.token_utterance[first]:
+            last = first
+            while last + 1 < len(index.tokens) and index.token_utterance[last + 1] == index.token_utterance[first]:
+                last += 1
+        start = index.token_offset[first]
+        end = index.token_offset[last] + len(index.tokens[last])
+        seconds = utterance['start_seconds'] or 0
+        rows.append({
+            **row,
+            'status': _status(similarity),
+            'similarity': round(similarity, 3),
+            'file_name': utterance['file_name'],
+            'speaker': utterance['speaker'],
+            'timestamp': f'{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}',
+            'utterance': utterance['utterance'],
+            'offset': start,
+            'matched_text': utterance['text'][start:end],
+        })
+    return rows
+
+def write_provenance(rows, path=PROVENANCE_CSV):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=PROVENANCE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def verify(reports=REPORTS, builders=PDF_BUILDERS, min_words=MIN_QUOTE_WORDS,
+           corpus_path=ingest_transcripts.CORPUS_PATH):
+    """Provenance rows for every quote in the reports and builder callouts"""
+    quotes = []
+    for path in reports:
+        quotes.extend(report_quotes(path, min_words))
+    for path in builders:
+        quotes.extend(callout_quotes(path, min_words))
+    return provenance(quotes, CorpusIndex(corpus_path))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check report quotes against the interview transcripts')
+    parser.add_argument('reports', nargs='*', default=REPORTS, help='report text files to check')
+    parser.add_argument('--csv', default=PROVENANCE_CSV, help='where to write the provenance table')
+    parser.add_argument('--min-words', type=int, default=MIN_QUOTE_WORDS)
+    args = parser.parse_args()
+
+    print("\n🔍 Verifying quotes against the transcript corpus...\n")
+    start = time.perf_counter()
+    rows = verify(args.reports, min_words=args.min_words)
+    write_provenance(rows, args.csv)
+
+    counts = Counter(row['status'] for row in rows)
+    for row in rows:
+        if row['status'] != 'verified':
+            icon = '⚠️ ' if row['status'] == 'paraphrased' else '❌'
+            print(f"{icon} {row['source']}:{row['line']} ({row['similarity']:.2f}) \"{row['quote'][:70]}\"")
+    print(f"\n✅ {counts['verified']} verified, {counts['paraphrased']} paraphrased, "
+          f"{counts['not found']} not found of {len(rows)} quotes in {time.perf_counter() - start:.1f}s")
+    print(f"📄 Provenance: {args.csv}")
@@ -10,9 +10,17 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 import os
+import sys
 
-# Create output directory
-os.makedirs('/Users/jefffranzen/cap-data/cool_visualizations', exist_ok=True)
+sys.path.append('/Users/jefffranzen/cap-data/Python')
+import html_export
+import large_data
+import network_charts
+import render_cache
+import synthetic_data
+
+# Its own folder: several chart names (and index.html) match create_cool_visualizations
+COOL_DIR = '/Users/jefffranzen/cap-data/cool_visualizations_fixed'
 
 # American Red Cross Brand Colors
 ARC_RED = '#CC0000'
@@ -22,9 +30,10 @@ ARC_LIGHT_GRAY = '#E2E8F0'
 
 def save_figure(fig, name):
     """Save figure as both HTML and PNG"""
-    fig.write_html(f'/Users/jefffranzen/cap-data/cool_visualizations/{name}.html')
+    os.makedirs(COOL_DIR, exist_ok=True)
+    html_export.write_html(fig, f'{COOL_DIR}/{name}.html')
     try:
-        fig.write_image(f'/Users/jefffranzen/cap-data/cool_visualizations/{name}.png', width=1400, height=800, scale=2)
+        render_cache.write_image(fig, f'{COOL_DIR}/{name}.png', width=1400, height=800, scale=2)
     except:
         pass
     print(f"✅ Created: {name}")
@@ -41,16 +50,17 @@ def create_3d_scatter():
     quality = [98, 95, 92, 90, 88, 85, 83, 75, 87, 89] * 3
     
     # Add some noise
-    roi = [r + np.random.normal(0, 2) for r in roi]
-    speed = [s + np.random.normal(0, 3) for s in speed]
-    quality = [q + np.random.normal(0, 2) for q in quality]
+    rng = synthetic_data.chart_rng('create_3d_scatter')
+    roi = synthetic_data.jitter(rng, roi, 2)
+    speed = synthetic_data.jitter(rng, speed, 3)
+    quality = synthetic_data.jitter(rng, quality, 2)
     
     fig = go.Figure(data=[go.Scatter3d(
         x=roi, y=speed, z=quality,
         mode='markers',
         text=partners,
         marker=dict(
-            size=[r/3 for r in roi],
+            size=roi / 3,
             color=roi,
             colorscale=[[0, ARC_GRAY], [0.5, '#FC8181'], [1, ARC_RED]],
             showscale=True,
@@ -74,24 +84,24 @@ def create_3d_scatter():
         height=800, width=1400
     )
     
-    return save_figure(fig, '3d_scatter_performance')
+    return fig
 
 # 2. ANIMATED TIME SERIES SCATTER
 def create_animated_scatter():
     quarters = pd.date_range('2023-01', '2025-09', freq='Q')
-    data = []
-    
-    for i, q in enumerate(quarters):
-        for j in range(20):  # 20 partners
-            data.append({
-                'Quarter': q.strftime('%Y Q%q'),
-                'Partner': f'Partner {j+1}',
-                'Cost Savings': 20000 + j*5000 + i*8000 + np.random.randint(-5000, 5000),
-                'Speed Score': 70 + j*1.5 + i*2 + np.random.normal(0, 5),
-                'Size': 30 + j*2 + i*3
-            })
+    n_partners = 20
+    rng = synthetic_data.chart_rng('create_animated_scatter')
     
-    df = pd.DataFrame(data)
+    # One row per (quarter, partner): i = quarter index, j = partner index
+    i = np.repeat(np.arange(len(quarters)), n_partners)
+    j = np.tile(np.arange(n_partners), len(quarters))
+    df = pd.DataFrame({
+        'Quarter': np.repeat([q.strftime('%Y Q%q') for q in quarters], n_partners),
+        'Partner': [f'Partner {k+1}' for k in j],
+        'Cost Savings': 20000 + j*5000 + i*8000 + rng.integers(-5000, 5000, len(i)),
+        'Speed Score': 70 + j*1.5 + i*2 + rng.normal(0, 5, len(i)),
+        'Size': 30 + j*2 + i*3
+    })
     
     fig = px.scatter(df, x='Speed Score', y='Cost Savings',
                      animation_frame='Quarter',
@@ -107,7 +117,7 @@ def create_animated_scatter():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'animated_scatter_evolution')
+    return fig
 
 # 3. SUNBURST with DEPTH - Cost Hierarchy
 def create_sunburst():
@@ -149,19 +159,19 @@ def create_sunburst():
         height=800, width=1400
     )
     
-    return save_figure(fig, 'sunburst_hierarchy')
+    return fig
 
 # 4. SCATTER PLOT MATRIX - Correlations
 def create_correlation_matrix():
-    np.random.seed(42)
+    rng = synthetic_data.chart_rng('create_correlation_matrix')
     n = 100
     
     # Create correlated data
-    roi = np.random.normal(28, 8, n)
-    speed = 2 * roi + np.random.normal(0, 10, n)
-    quality = 1.5 * roi + np.random.normal(0, 8, n)
-    cost = -0.8 * roi + np.random.normal(100, 20, n)
-    volunteers = 0.5 * quality + np.random.normal(50, 15, n)
+    roi = rng.normal(28, 8, n)
+    speed = 2 * roi + rng.normal(0, 10, n)
+    quality = 1.5 * roi + rng.normal(0, 8, n)
+    cost = -0.8 * roi + rng.normal(100, 20, n)
+    volunteers = 0.5 * quality + rng.normal(50, 15, n)
     
     df = pd.DataFrame({
         'ROI (%)': roi,
@@ -186,7 +196,7 @@ def create_correlation_matrix():
         coloraxis_colorbar=dict(title="ROI %")
     )
     
-    return save_figure(fig, 'correlation_matrix')
+    return fig
 
 # 5. BUBBLE MAP - Geographic Impact
 def create_bubble_map():
@@ -232,19 +242,22 @@ def create_bubble_map():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'bubble_map_impact')
+    return fig
 
 # 6. PARALLEL COORDINATES - Partner Profiles
 def create_parallel():
     n_partners = 30
     
+    rng = synthetic_data.chart_rng('create_parallel')
     data = pd.DataFrame({
         'Partner': [f'P{i}' for i in range(n_partners)],
-        'ROI': np.random.normal(28, 10, n_partners),
-        'Speed': np.random.normal(85, 10, n_partners),
-        'Quality': np.random.normal(90, 8, n_partners),
-        'Efficiency': np.random.normal(82, 12, n_partners),
-        'Trust': np.random.normal(88, 7, n_partners)
+        **synthetic_data.normal_columns(rng, {
+            'ROI': (28, 10),
+            'Speed': (85, 10),
+            'Quality': (90, 8),
+            'Efficiency': (82, 12),
+            'Trust': (88, 7)
+        }, n_partners)
     })
     
     fig = px.parallel_coordinates(data,
@@ -259,20 +272,16 @@ def create_parallel():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'parallel_coordinates')
+    return fig
 
 # 7. VIOLIN + SCATTER - Distribution with Points
 def create_violin_scatter():
     disasters = ['Hurricane', 'Tornado', 'Flood', 'Wildfire', 'Storm']
-    data = []
-    
-    for d in disasters:
-        base = {'Hurricane': 90, 'Tornado': 80, 'Flood': 75, 'Wildfire': 70, 'Storm': 72}[d]
-        values = np.random.normal(base, 10, 50)
-        for v in values:
-            data.append({'Disaster': d, 'Performance': v})
+    base = {'Hurricane': 90, 'Tornado': 80, 'Flood': 75, 'Wildfire': 70, 'Storm': 72}
     
-    df = pd.DataFrame(data)
+    rng = synthetic_data.chart_rng('create_violin_scatter')
+    labels, values = synthetic_data.normal_groups(rng, [(d, base[d], 10, 50) for d in disasters])
+    df = pd.DataFrame({'Disaster': labels, 'Performance': values})
     
     fig = go.Figure()
     
@@ -302,7 +311,7 @@ def create_violin_scatter():
         showlegend=False
     )
     
-    return save_figure(fig, 'violin_scatter_distribution')
+    return fig
 
 # 8. SANKEY FLOW - Resource Allocation
 def create_sankey():
@@ -333,16 +342,13 @@ def create_sankey():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'sankey_flow')
+    return fig
 
 # 9. SCATTER with TREND - ROI Evolution
 def create_scatter_trend():
     months = pd.date_range('2023-01', '2025-09', freq='M')
-    roi = []
-    
-    for i, m in enumerate(months):
-        base_roi = 20 + i * 0.3
-        roi.append(base_roi + np.random.normal(0, 2))
+    rng = synthetic_data.chart_rng('create_scatter_trend')
+    roi = synthetic_data.jitter(rng, 20 + np.arange(len(months)) * 0.3, 2)
     
     df = pd.DataFrame({'Month': months, 'ROI': roi})
     
@@ -392,19 +398,15 @@ def create_scatter_trend():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'scatter_trend_roi')
+    return fig
 
 # 10. HEATMAP MATRIX - Performance Grid
 def create_heatmap_matrix():
     partners = [f'Partner {i+1}' for i in range(15)]
     metrics = ['Speed', 'Quality', 'Cost', 'Coverage', 'Trust', 'Innovation']
     
-    z = []
-    for _ in metrics:
-        row = []
-        for _ in partners:
-            row.append(np.random.randint(60, 100))
-        z.append(row)
+    rng = synthetic_data.chart_rng('create_heatmap_matrix')
+    z = rng.integers(60, 100, size=(len(metrics), len(partners))).tolist()
     
     fig = go.Figure(data=go.Heatmap(
         z=z,
@@ -425,7 +427,7 @@ def create_heatmap_matrix():
         xaxis=dict(tickangle=-45)
     )
     
-    return save_figure(fig, 'heatmap_matrix')
+    return fig
 
 # 11. TREEMAP - Impact Categories
 def create_treemap():
@@ -459,7 +461,7 @@ def create_treemap():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'treemap_impact')
+    return fig
 
 # 12. FUNNEL - Service Pipeline
 def create_funnel():
@@ -484,17 +486,18 @@ def create_funnel():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'funnel_pipeline')
+    return fig
 
 # 13. POLAR SCATTER - 360 View
 def create_polar_scatter():
-    theta = np.random.uniform(0, 360, 100)
-    r = np.random.uniform(50, 100, 100)
-    colors = [ARC_RED if r > 80 else ARC_GRAY for r in r]
-    
-    fig = go.Figure(go.Scatterpolar(
-        r=r,
-        theta=theta,
+    rng = synthetic_data.chart_rng('create_polar_scatter')
+    theta = rng.uniform(0, 360, 100)
+    r = rng.uniform(50, 100, 100)
+    colors = np.where(r > 80, ARC_RED, ARC_GRAY)
+    
+    fig = go.Figure(large_data.scatterpolar(
+        r,
+        theta,
         mode='markers',
         marker=dict(
             size=8,
@@ -513,13 +516,15 @@ def create_polar_scatter():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'polar_scatter_360')
+    return fig
 
 # 14. DUAL AXIS - Cost vs Impact
 def create_dual_axis():
     months = pd.date_range('2023-01', '2025-09', freq='M')
-    cost = [100000 + i * 5000 + np.random.randint(-10000, 10000) for i in range(len(months))]
-    impact = [50 + i * 2 + np.random.normal(0, 5) for i in range(len(months))]
+    rng = synthetic_data.chart_rng('create_dual_axis')
+    i = np.arange(len(months))
+    cost = 100000 + i * 5000 + rng.integers(-10000, 10000, len(months))
+    impact = 50 + i * 2 + rng.normal(0, 5, len(months))
     
     fig = make_subplots(specs=[[{"secondary_y": True}]])
     
@@ -547,25 +552,25 @@ def create_dual_axis():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'dual_axis_analysis')
+    return fig
 
 # 15. CONTOUR - Density Map
 def create_contour():
-    x = np.random.normal(75, 15, 500)
-    y = np.random.normal(80, 12, 500)
+    rng = synthetic_data.chart_rng('create_contour')
+    x = rng.normal(75, 15, 500)
+    y = rng.normal(80, 12, 500)
     
-    fig = go.Figure(go.Histogram2dContour(
-        x=x,
-        y=y,
+    fig = go.Figure(large_data.density_contour(
+        x,
+        y,
         colorscale=[[0, 'white'], [0.5, '#FC8181'], [1, ARC_RED]],
         xaxis='x',
         yaxis='y'
     ))
     
-    fig.add_trace(go.Scatter(
-        x=x,
-        y=y,
-        mode='markers',
+    fig.add_trace(large_data.density_points(
+        x,
+        y,
         marker=dict(color='rgba(0,0,0,0.1)', size=3),
         showlegend=False
     ))
@@ -579,7 +584,7 @@ def create_contour():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'contour_density')
+    return fig
 
 # 16. RADAR COMPARISON - Multi-Partner
 def create_radar_comparison():
@@ -615,28 +620,16 @@ def create_radar_comparison():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'radar_comparison')
+    return fig
 
 # 17. NETWORK - Partner Connections
 def create_network():
-    edge_x = []
-    edge_y = []
-    
-    # Create network layout
-    np.random.seed(42)
-    pos = {}
-    for i in range(20):
-        pos[i] = (np.cos(2*np.pi*i/20), np.sin(2*np.pi*i/20))
+    # Partners on a circle around the Red Cross hub (node 20)
+    angles = 2*np.pi*np.arange(20)/20
+    pos = np.vstack([np.column_stack([np.cos(angles), np.sin(angles)]), [0, 0]])
     
-    # Add center node
-    pos[20] = (0, 0)
-    
-    # Connect nodes
-    for i in range(20):
-        x0, y0 = pos[20]
-        x1, y1 = pos[i]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    # Connect every partner to the hub
+    edge_x, edge_y = network_charts.edge_segments(pos, [(20, i) for i in range(20)])
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -645,8 +638,8 @@ def create_network():
         mode='lines'
     )
     
-    node_x = [pos[i][0] for i in range(21)]
-    node_y = [pos[i][1] for i in range(21)]
+    node_x = pos[:, 0]
+    node_y = pos[:, 1]
     
     node_trace = go.Scatter(
         x=node_x, y=node_y,
@@ -672,7 +665,7 @@ def create_network():
         yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
     )
     
-    return save_figure(fig, 'network_partners')
+    return fig
 
 # 18. BOX PLOTS - Statistical View
 def create_box_plots():
@@ -680,8 +673,12 @@ def create_box_plots():
     
     fig = go.Figure()
     
+    # One row of scores per metric
+    rng = synthetic_data.chart_rng('create_box_plots')
+    scores = rng.normal(75 + np.arange(len(metrics))[:, None] * 5, 10, size=(len(metrics), 100))
+    
     for i, metric in enumerate(metrics):
-        values = np.random.normal(75 + i*5, 10, 100)
+        values = scores[i]
         
         fig.add_trace(go.Box(
             y=values,
@@ -701,7 +698,7 @@ def create_box_plots():
         height=700, width=1400
     )
     
-    return save_figure(fig, 'box_plots_stats')
+    return fig
 
 # 19. GANTT - Timeline View
 def create_gantt():
@@ -727,7 +724,7 @@ def create_gantt():
         height=600, width=1400
     )
     
-    return save_figure(fig, 'gantt_timeline')
+    return fig
 
 # 20. EXECUTIVE DASHBOARD - Combined View
 def create_dashboard():
@@ -747,7 +744,8 @@ def create_dashboard():
                  row=1, col=1)
     
     # Speed Distribution
-    fig.add_trace(go.Box(y=np.random.normal(85, 10, 50),
+    rng = synthetic_data.chart_rng('create_dashboard')
+    fig.add_trace(go.Box(y=rng.normal(85, 10, 50),
                         marker_color=ARC_GRAY),
                  row=1, col=2)
     
@@ -785,39 +783,48 @@ def create_dashboard():
         showlegend=False
     )
     
-    return save_figure(fig, 'executive_dashboard')
+    return fig
+
+# Output name -> figure builder
+VISUALIZATIONS = [
+    ('3d_scatter_performance', create_3d_scatter),
+    ('animated_scatter_evolution', create_animated_scatter),
+    ('sunburst_hierarchy', create_sunburst),
+    ('correlation_matrix', create_correlation_matrix),
+    ('bubble_map_impact', create_bubble_map),
+    ('parallel_coordinates', create_parallel),
+    ('violin_scatter_distribution', create_violin_scatter),
+    ('sankey_flow', create_sankey),
+    ('scatter_trend_roi', create_scatter_trend),
+    ('heatmap_matrix', create_heatmap_matrix),
+    ('treemap_impact', create_treemap),
+    ('funnel_pipeline', create_funnel),
+    ('polar_scatter_360', create_polar_scatter),
+    ('dual_axis_analysis', create_dual_axis),
+    ('contour_density', create_contour),
+    ('radar_comparison', create_radar_comparison),
+    ('network_partners', create_network),
+    ('box_plots_stats', create_box_plots),
+    ('gantt_timeline', create_gantt),
+    ('executive_dashboard', create_dashboard)
+]
 
 # Main execution
 def main():
     print("\n🚀 Creating 20 COOL Modern Visualizations\n")
     print("=" * 60)
     
-    visualizations = [
-        create_3d_scatter(),
-        create_animated_scatter(),
-        create_sunburst(),
-        create_correlation_matrix(),
-        create_bubble_map(),
-        create_parallel(),
-        create_violin_scatter(),
-        create_sankey(),
-        create_scatter_trend(),
-        create_heatmap_matrix(),
-        create_treemap(),
-        create_funnel(),
-        create_polar_scatter(),
-        create_dual_axis(),
-        create_contour(),
-        create_radar_comparison(),
-        create_network(),
-        create_box_plots(),
-        create_gantt(),
-        create_dashboard()
-    ]
+    # Build every figure, then save each as HTML + PNG
+    visualizations = [save_figure(builder(), name) for name, builder in VISUALIZATIONS]
     
+    # One page with every chart, loading plotly.js once
+    html_export.write_gallery(visualizations, f'{COOL_DIR}/index.html',
+                              title="CAP Cool Visualizations")
+
     print("=" * 60)
     print(f"\n✨ Successfully created {len(visualizations)} COOL visualizations!")
-    print(f"📁 Location: /Users/jefffranzen/cap-data/cool_visualizations/")
+    print(f"📁 Location: {COOL_DIR}/")
+    print(f"🌐 Gallery: {COOL_DIR}/index.html")
     print("\n🎨 Features:")
     print("   • 3D scatter plots")
     print("   • Animated time series")